@@ -0,0 +1,85 @@
+"""Shared boto3 clients: one per (service, region, credentials) for the life
+of the process.
+
+Building a client costs tens of milliseconds (loading and resolving the
+service model), and every new client starts with an empty connection pool,
+so the first call on it pays a fresh TLS handshake. boto3 clients are
+thread-safe, so one cached client per key is shared by every caller and
+thread. Each is created with a larger connection pool, TCP keepalive and
+adaptive retries (standard retries plus client-side rate limiting when AWS
+throttles).
+
+    s3 = client("s3")
+    polly = client("polly", "us-east-1")
+    s3 = client("s3", region, access_key_id=..., secret_access_key=...)
+
+Used by s3io, generate_bundle, the pack_editor worker and the daily news
+pipeline (through daily_news_pipeline/aws_clients.py, which puts the repo
+root on sys.path and re-exports this). The pack_editor web app deploys as
+a git subtree and can't import this package, so
+pack_editor/app/aws_clients.py is a byte-for-byte copy of this file;
+pack_editor/heroku/deploy.sh refuses to deploy while the two differ.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+MAX_POOL_CONNECTIONS = 32
+RETRIES = {"max_attempts": 8, "mode": "adaptive"}
+
+_clients: dict[tuple, Any] = {}
+_sessions: dict[str | None, Any] = {}
+_lock = threading.Lock()
+
+
+def client(
+    service: str,
+    region: str | None = None,
+    *,
+    profile: str | None = None,
+    access_key_id: str | None = None,
+    secret_access_key: str | None = None,
+    **config: Any,
+):
+    """
+    The process-wide client for `service` in `region` (None: the session's
+    default) with the given credentials (None: the default chain).
+    `config` adds / overrides botocore Config options, e.g.
+    signature_version="s3v4"; clients with different options are cached
+    separately.
+    """
+    key = (service, region, profile, access_key_id, secret_access_key, repr(sorted(config.items())))
+    with _lock:
+        hit = _clients.get(key)
+        if hit is None:
+            from botocore.config import Config
+
+            options = {"max_pool_connections": MAX_POOL_CONNECTIONS, "retries": RETRIES,
+                       "tcp_keepalive": True, **config}
+            hit = _session(profile).client(
+                service,
+                region_name=region,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                config=Config(**options),
+            )
+            _clients[key] = hit
+    return hit
+
+
+def _session(profile: str | None):
+    # Sessions aren't thread-safe; clients are only created under _lock.
+    if profile not in _sessions:
+        import boto3
+
+        _sessions[profile] = boto3.session.Session(profile_name=profile)
+    return _sessions[profile]
+
+
+def clear() -> None:
+    """Drop every cached client (tests, credential rotation)."""
+    with _lock:
+        _clients.clear()
+        _sessions.clear()
@@ -5,6 +5,8 @@ import logging
 from pathlib import Path
 from typing import Iterable
 
+from .aws_clients import client
+
 
 def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
     """
@@ -38,15 +40,13 @@ def download_prefix_to_dir(
     Downloads all objects under a given S3 prefix into dest_dir (flat).
     Returns list of downloaded file paths.
     """
-    import boto3
-
     log = logger or logging.getLogger(__name__)
 
     bucket, key_prefix = parse_s3_uri(source_s3)
     if key_prefix and not key_prefix.endswith("/"):
         key_prefix += "/"
 
-    s3 = boto3.client("s3")
+    s3 = client("s3")
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     downloaded: list[Path] = []
@@ -19,7 +19,10 @@ Three passes:
      language are translated per track in a single call, with the full
      ordered transcript in the prompt for context. Strict 1:1 count
      validation with one retry. In-run cache dedupes identical span text
-     (e.g. akc-01 and akc-01-v2 share all content).
+     (e.g. akc-01 and akc-01-v2 share all content). All track requests are
+     sent concurrently, capped by the daily pipeline's llm_providers governor
+     — or, with --batch, as one provider batch job (half price, slower;
+     the better fit for overnight backfills across many tracks).
   3. Verify: the enriched bundle must differ from the original ONLY in
      `translations` keys; per-track coverage is reported.
 
@@ -33,11 +36,13 @@ Usage:
     python translate_bundle.py starter_seoul_lunch --commit
     python translate_bundle.py hccc-s01e15-sc01 --pair-adjacent --commit
     python translate_bundle.py path/to/bundle.json --langs en,es --commit
+    python translate_bundle.py akc-01 --batch --commit              # batch API
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import copy
 import json
 import subprocess
@@ -51,7 +56,7 @@ WORK_ROOT = HERE / "translate_work"
 # Reuse the daily pipeline's provider + pricing plumbing (same pattern as
 # daily_news_pipeline/5_publish_s3.py importing bundle_pipeline helpers).
 sys.path.insert(0, str(REPO_ROOT / "daily_news_pipeline"))
-from llm_providers import make_provider  # noqa: E402
+from llm_providers import BatchError, make_provider  # noqa: E402
 from cost_tracker import estimate_llm_cost  # noqa: E402
 
 PUBLISH_BUCKET = "turned.rip"
@@ -73,6 +78,8 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--model", default="claude-haiku-4-5")
     p.add_argument("--provider", default="anthropic")
     p.add_argument("--max-tokens", type=int, default=4096)
+    p.add_argument("--batch", action="store_true",
+                   help="send the LLM pass as one provider batch job (cheaper, slower)")
     p.add_argument("--commit", action="store_true",
                    help="upload to S3 (pack id) or overwrite the file (local path)")
     return p.parse_args()
@@ -188,10 +195,81 @@ def parse_response(text: str, todo: list[int]) -> dict[int, str]:
     return {i: got[i] for i in todo}
 
 
+async def translate_track(track: dict, spans: list[dict], remaining: list[int], lang: str,
+                          provider, max_tokens: int) -> tuple[dict[int, str], float]:
+    """One track × language request, with one retry on a malformed response."""
+    prompt = build_prompt(track.get("title") or "", spans, remaining, lang)
+    cost = 0.0
+    for attempt in (1, 2):
+        resp = await provider.achat(prompt, max_tokens=max_tokens)
+        cost += estimate_llm_cost(resp.provider, resp.model,
+                                  resp.input_tokens, resp.output_tokens,
+                                  resp.cache_read_tokens, resp.cache_write_tokens)
+        try:
+            results = parse_response(resp.text, remaining)
+            break
+        except ValueError as e:
+            if attempt == 2:
+                raise SystemExit(f"❌ track '{track.get('title')}': {e}")
+            print(f"  ⚠️  retry ({e})")
+    print(f"  📡 {track.get('title', '?')[:40]} → {lang}: {len(remaining)} spans "
+          f"(in={resp.input_tokens} out={resp.output_tokens})")
+    return results, cost
+
+
+def batch_translate(jobs: list[tuple[dict, list[dict], list[int], str]], provider,
+                    max_tokens: int) -> list[tuple[dict[int, str], float]]:
+    """All jobs as one provider batch. Jobs whose request failed in the batch
+    or came back malformed are re-sent in realtime via translate_track
+    (which has its own retry); their batch spend is still counted."""
+    prompts = {str(n): build_prompt(track.get("title") or "", spans, remaining, lang)
+               for n, (track, spans, remaining, lang) in enumerate(jobs)}
+    replies = provider.chat_batch(prompts, max_tokens=max_tokens)
+    out: list[tuple[dict[int, str], float] | None] = []
+    spent: dict[int, float] = {}
+    for n, (track, spans, remaining, lang) in enumerate(jobs):
+        resp = replies[str(n)]
+        title = track.get("title", "?")[:40]
+        if isinstance(resp, BatchError):
+            print(f"  ⚠️  {title} → {lang}: batch request failed ({resp}); retrying in realtime")
+            out.append(None)
+            continue
+        cost = estimate_llm_cost(resp.provider, resp.model, resp.input_tokens, resp.output_tokens,
+                                 resp.cache_read_tokens, resp.cache_write_tokens, batch=resp.batch)
+        try:
+            out.append((parse_response(resp.text, remaining), cost))
+        except ValueError as e:
+            print(f"  ⚠️  {title} → {lang}: {e}; retrying in realtime")
+            spent[n] = cost
+            out.append(None)
+            continue
+        print(f"  📦 {title} → {lang}: {len(remaining)} spans "
+              f"(in={resp.input_tokens} out={resp.output_tokens})")
+
+    retry = [n for n, r in enumerate(out) if r is None]
+
+    async def run_retries():
+        return await asyncio.gather(*(translate_track(*jobs[n], provider, max_tokens)
+                                      for n in retry))
+
+    for n, (results, cost) in zip(retry, asyncio.run(run_retries()) if retry else []):
+        out[n] = (results, cost + spent.get(n, 0.0))
+    return out
+
+
 def llm_pass(bundle: dict, langs: list[str], provider, max_tokens: int,
-             cache: dict[tuple[str, str], str]) -> tuple[int, float]:
+             cache: dict[tuple[str, str], str], batch: bool = False) -> tuple[int, float]:
+    """Plan every track × language request in bundle order, then send them
+    all at once (llm_providers' governor caps what is in flight), or as one
+    batch job with `batch`.
+
+    Dedupe is decided at planning time, exactly as a serial pass would: a span
+    whose text an EARLIER request already covers is not re-sent, and is
+    filled from that request's result afterwards."""
     translated = 0
-    cost = 0.0
+    jobs: list[tuple[dict, list[dict], list[int], str]] = []
+    deferred: list[tuple[dict, str]] = []  # (span, lang) served by an earlier job
+    planned: set[tuple[str, str]] = set()
     for track, spans in iter_spans(bundle):
         for lang in langs:
             todo = [i for i, s in enumerate(spans)
@@ -201,32 +279,38 @@ def llm_pass(bundle: dict, langs: list[str], provider, max_tokens: int,
             # Serve cache hits first
             remaining = []
             for i in todo:
-                hit = cache.get((spans[i]["text"], lang))
+                key = (spans[i]["text"], lang)
+                hit = cache.get(key)
                 if hit is not None:
                     spans[i].setdefault("translations", {})[lang] = hit
                     translated += 1
+                elif key in planned:
+                    deferred.append((spans[i], lang))
                 else:
                     remaining.append(i)
-            if not remaining:
-                continue
-            prompt = build_prompt(track.get("title") or "", spans, remaining, lang)
-            for attempt in (1, 2):
-                resp = provider.chat(prompt, max_tokens=max_tokens)
-                cost += estimate_llm_cost(resp.provider, resp.model,
-                                          resp.input_tokens, resp.output_tokens)
-                try:
-                    results = parse_response(resp.text, remaining)
-                    break
-                except ValueError as e:
-                    if attempt == 2:
-                        raise SystemExit(f"❌ track '{track.get('title')}': {e}")
-                    print(f"  ⚠️  retry ({e})")
-            for i, tr in results.items():
-                spans[i].setdefault("translations", {})[lang] = tr
-                cache[(spans[i]["text"], lang)] = tr
-                translated += 1
-            print(f"  📡 {track.get('title', '?')[:40]} → {lang}: {len(remaining)} spans "
-                  f"(in={resp.input_tokens} out={resp.output_tokens})")
+            if remaining:
+                jobs.append((track, spans, remaining, lang))
+                planned.update((spans[i]["text"], lang) for i in remaining)
+
+    async def run_all():
+        return await asyncio.gather(*(
+            translate_track(track, spans, remaining, lang, provider, max_tokens)
+            for track, spans, remaining, lang in jobs))
+
+    if batch:
+        outcomes = batch_translate(jobs, provider, max_tokens) if jobs else []
+    else:
+        outcomes = asyncio.run(run_all())
+    cost = 0.0
+    for (track, spans, remaining, lang), (results, job_cost) in zip(jobs, outcomes):
+        cost += job_cost
+        for i, tr in results.items():
+            spans[i].setdefault("translations", {})[lang] = tr
+            cache.setdefault((spans[i]["text"], lang), tr)  # first (bundle-order) wins
+            translated += 1
+    for span, lang in deferred:
+        span.setdefault("translations", {})[lang] = cache[(span["text"], lang)]
+        translated += 1
     return translated, cost
 
 
@@ -265,7 +349,8 @@ def main() -> int:
 
     provider = make_provider(args.provider, args.model)
     cache: dict[tuple[str, str], str] = {}
-    translated, cost = llm_pass(bundle, langs, provider, args.max_tokens, cache)
+    translated, cost = llm_pass(bundle, langs, provider, args.max_tokens, cache,
+                                batch=args.batch)
     print(f"  💬 LLM pass: {translated} spans translated  est_cost=${cost:.4f}")
 
     # Verify: nothing but translations may change.
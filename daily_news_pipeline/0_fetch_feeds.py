@@ -21,12 +21,13 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import json
 import sys
 from pathlib import Path
 
 import feedparser
-import yaml
+
+import artifacts
+import tracing
 
 
 HERE = Path(__file__).resolve().parent
@@ -34,12 +35,12 @@ DEFAULT_FEEDS = HERE / "feeds.yaml"
 WORK_ROOT = HERE / "work"
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Fetch RSS feeds for the daily news pipeline")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     p.add_argument("--feeds", type=Path, default=DEFAULT_FEEDS, help="Path to feeds.yaml")
     p.add_argument("--max-per-feed", type=int, default=20, help="Cap items per feed (default: 20)")
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -50,12 +51,14 @@ def today_eastern() -> str:
 def load_feeds_config(path: Path) -> dict:
     if not path.exists():
         raise SystemExit(f"❌ feeds config not found: {path}")
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return artifacts.load_yaml(path)
 
 
 def fetch_feed(source: str, url: str, genre: str, max_items: int) -> list[dict]:
     print(f"  ↓ {source:20s} ({genre})", end=" ", flush=True)
-    parsed = feedparser.parse(url)
+    with tracing.span(source, "http", url=url) as sp:
+        parsed = feedparser.parse(url)
+        sp["entries"] = len(parsed.entries)
     if parsed.bozo and not parsed.entries:
         print(f"⚠ failed: {parsed.bozo_exception}")
         return []
@@ -73,14 +76,15 @@ def fetch_feed(source: str, url: str, genre: str, max_items: int) -> list[dict]:
     return items
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     date = args.date or today_eastern()
 
     cfg = load_feeds_config(args.feeds)
     out_dir = WORK_ROOT / date
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "feeds.json"
+    tracing.start_step("0_fetch_feeds", out_dir)
 
     print(f"═══ Fetching feeds for {date} ═══")
     items: list[dict] = []
@@ -101,7 +105,7 @@ def main() -> int:
         "fetched_at": dt.datetime.now(dt.timezone.utc).isoformat(),
         "items": items,
     }
-    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    artifacts.write_json(out_path, payload)
     print(f"✅ Wrote {out_path} ({len(items)} items)")
     return 0
 
@@ -32,10 +32,10 @@ import os
 import sys
 from pathlib import Path
 
-import yaml
-
+import artifacts
+import tracing
 from cost_tracker import StepCostRecorder
-from llm_providers import LLMProvider, provider_for_step, max_tokens_for_step
+from llm_providers import LLMProvider, discard_cached, provider_for_step, max_tokens_for_step
 
 HERE = Path(__file__).resolve().parent
 WORK_ROOT = HERE / "work"
@@ -48,12 +48,12 @@ _llm: LLMProvider | None = None
 _max_tokens: int = 2048
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Curate today's stories")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     p.add_argument("--config", type=Path, default=DEFAULT_LLM_CONFIG, help="llm.yaml path")
     p.add_argument("--commit", action="store_true", help="Actually call the LLM + fetch bodies.")
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -176,14 +176,21 @@ def call_llm(prompt: str, label: str = "curate") -> str:
         raise SystemExit("LLM provider not initialized — should not happen")
     print(f"  📡 [{label}] → {_llm.name}")
     print(f"     model={_llm.model}  prompt_chars={len(prompt)}  max_tokens={_max_tokens}")
-    resp = _llm.chat(prompt, max_tokens=_max_tokens)
+    with tracing.span(label, "llm", model=f"{_llm.name}/{_llm.model}") as sp:
+        resp = _llm.chat(prompt, max_tokens=_max_tokens)
+        sp.update(input_tokens=resp.input_tokens, output_tokens=resp.output_tokens,
+                  cache_hit=resp.cache_hit)
     cost = 0.0
     if _cost_recorder is not None:
         cost = _cost_recorder.add_llm_call(
             provider=resp.provider, model=resp.model,
             input_tokens=resp.input_tokens, output_tokens=resp.output_tokens,
-            label=label, response_chars=len(resp.text),
+            label=label, response_chars=len(resp.text), cache_hit=resp.cache_hit,
+            cache_read_tokens=resp.cache_read_tokens, cache_write_tokens=resp.cache_write_tokens,
         )
+    if resp.cache_hit:
+        print(f"     ✓ response cache hit (no charge)  response_chars={len(resp.text)}")
+        return resp.text
     print(f"     ✓ usage: input={resp.input_tokens} output={resp.output_tokens} tokens  est_cost=${cost:.4f}  response_chars={len(resp.text)}")
     return resp.text
 
@@ -206,12 +213,15 @@ def fetch_body(url: str) -> str:
     except ImportError:
         raise SystemExit("trafilatura not installed. pip install trafilatura")
     print(f"     ↓ trafilatura GET {url}")
-    downloaded = trafilatura.fetch_url(url)
+    with tracing.span("fetch body", "http", url=url) as sp:
+        downloaded = trafilatura.fetch_url(url)
+        sp["bytes"] = len(downloaded or "")
     if not downloaded:
         print(f"     ⚠ trafilatura returned no HTML for {url}")
         return ""
     print(f"     ↓ fetched {len(downloaded)} bytes; extracting main content...")
-    extracted = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
+    with tracing.span("extract body", "cpu", url=url):
+        extracted = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
     if not extracted:
         print(f"     ⚠ trafilatura could not extract main content")
         return ""
@@ -220,14 +230,14 @@ def fetch_body(url: str) -> str:
     return body
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     date = args.date or today_eastern()
 
     feeds_path = WORK_ROOT / date / "feeds.json"
     if not feeds_path.exists():
         raise SystemExit(f"❌ feeds.json not found at {feeds_path}. Run step 0 first.")
-    feeds_data = json.loads(feeds_path.read_text(encoding="utf-8"))
+    feeds_data = artifacts.read_json(feeds_path)
     items = feeds_data["items"]
 
     recent = recent_chosen(date)
@@ -243,7 +253,7 @@ def main() -> int:
 
     if not args.config.exists():
         raise SystemExit(f"❌ llm.yaml not found: {args.config}")
-    llm_cfg = yaml.safe_load(args.config.read_text(encoding="utf-8")) or {}
+    llm_cfg = artifacts.load_yaml(args.config)
 
     print(f"═══ Curating {len(items)} items for {date} ═══")
     print(f"  Output:  {out_path}")
@@ -259,6 +269,7 @@ def main() -> int:
         return 0
 
     global _cost_recorder, _llm, _max_tokens
+    tracing.start_step("1_curate", WORK_ROOT / date)
     _cost_recorder = StepCostRecorder("1_curate", WORK_ROOT / date)
     _llm = provider_for_step("curate", llm_cfg)
     _max_tokens = max_tokens_for_step("curate", llm_cfg, default=2048)
@@ -268,6 +279,7 @@ def main() -> int:
     try:
         decision = json.loads(cleaned)
     except json.JSONDecodeError as e:
+        discard_cached(_llm, prompt, _max_tokens)
         print("❌ Claude did not return valid JSON.", file=sys.stderr)
         print(cleaned, file=sys.stderr)
         raise SystemExit(f"JSON parse error: {e}")
@@ -304,7 +316,7 @@ def main() -> int:
         "curated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
         "stories": stories,
     }
-    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    artifacts.write_json(out_path, payload)
     if _cost_recorder is not None:
         _cost_recorder.write()
     print()
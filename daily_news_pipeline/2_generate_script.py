@@ -36,10 +36,23 @@ Output:
         ]
       }
 
+Stories are independent until they reach the Lexicon, so the LLM chain
+(script → QA → verbatim gate) runs for every story concurrently, a bounded
+number of stories at a time; the provider calls themselves are capped by
+llm_providers.GOVERNOR. Library reuse + recording then runs in story
+order, so the output matches a serial run. --all-editions does the same for
+ko and en at once (one process, both script files).
+
+Both halves checkpoint per story (checkpoints.py, work/<date>/checkpoints/):
+a re-run after a failure on story 4 reuses stories 1-3's generated (and, if
+the Lexicon was saved, finished) output instead of paying for them again,
+and lists what it reused. --fresh ignores the checkpoints.
+
 Safety: defaults to dry-run.
 
 Usage:
-    python 2_generate_script.py [--date YYYY-MM-DD] [--commit]
+    python 2_generate_script.py [--date YYYY-MM-DD] [--edition ko|en] [--commit]
+    python 2_generate_script.py --all-editions [--concurrency N] --commit
 """
 
 from __future__ import annotations
@@ -49,20 +62,29 @@ import datetime as dt
 import json
 import os
 import sys
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 from lexicon import Lexicon
+from checkpoints import Checkpoints, fingerprint
 from cost_tracker import StepCostRecorder
-from llm_providers import LLMProvider, provider_for_step, max_tokens_for_step
+from json_stream import JsonStreamError
+from llm_providers import (LLMProvider, LLMResponse, Prompt, discard_cached, max_tokens_for_step,
+                           prompt_text, provider_for_step)
+from set_cover import ExampleIndex
+from vocab_matcher import VocabMatcher
 
 HERE = Path(__file__).resolve().parent
 WORK_ROOT = HERE / "work"
 CACHE_ROOT = HERE / "cache"
 DEFAULT_LLM_CONFIG = HERE / "llm.yaml"
+DEFAULT_CONCURRENCY = 6  # stories × editions in flight at once
 
+import artifacts
 import edition
+import tracing
 from check_verbatim_overlap import check_texts, english_texts_from_script
 
 
@@ -71,14 +93,22 @@ EN_MONTHS = ["", "January", "February", "March", "April", "May", "June",
              "July", "August", "September", "October", "November", "December"]
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Generate the narration script for the day's pack")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     p.add_argument("--config", type=Path, default=DEFAULT_LLM_CONFIG, help="llm.yaml path")
     p.add_argument("--commit", action="store_true", help="Actually call the LLM.")
     p.add_argument("--no-qa", action="store_true", help="Skip the cross-model QA review (saves ~$0.10/run)")
     edition.add_edition_arg(p)
-    return p.parse_args()
+    p.add_argument("--all-editions", action="store_true",
+                   help="Generate every edition (ko + en) in one process, all stories "
+                        "concurrently (overrides --edition)")
+    p.add_argument("--concurrency", type=int, default=None,
+                   help=f"Max stories × editions in flight at once "
+                        f"(default: llm.yaml max_concurrent_calls, else {DEFAULT_CONCURRENCY})")
+    p.add_argument("--fresh", action="store_true",
+                   help="Ignore per-story checkpoints from an earlier run and regenerate every story")
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -86,24 +116,18 @@ def today_eastern() -> str:
     return now.strftime("%Y-%m-%d")
 
 
-def build_story_prompt(story: dict) -> str:
-    return f"""You are building a Korean-language news listening pack for English speakers
+STORY_INSTRUCTIONS_KO = """You are building a Korean-language news listening pack for English speakers
 learning Korean (intermediate level, roughly TOPIK 3-4).
 
-SOURCE ARTICLE (English, U.S. news):
-Headline: {story['headline']}
-Source: {story['source']}
-
-Body:
-{story['body']}
+The SOURCE ARTICLE to work from is at the end of this prompt.
 
 Produce a JSON object with this exact shape (no markdown fences, no prose):
 
-{{
+{
   "track_title_ko": "<short Korean title, 4-10 syllables>",
   "track_title_en": "<English title>",
   "vocab": [
-    {{ "ko": "<Korean word>", "en": "<short English gloss>" }},
+    { "ko": "<Korean word>", "en": "<short English gloss>" },
     ... Pick the most important content words for an intermediate learner
     (TOPIK 2-4) from your Korean summary. Include nouns, verbs, adjectives,
     and adverbs that carry meaning. SKIP: particles (은/는/이/가/을/를/에/에서/으로/도/만),
@@ -115,7 +139,7 @@ Produce a JSON object with this exact shape (no markdown fences, no prose):
     List in order of first appearance in the summary.
   ],
   "examples": [
-    {{ "ko": "<Korean example sentence>", "en": "<English translation>" }},
+    { "ko": "<Korean example sentence>", "en": "<English translation>" },
     ... 1 to 12 example sentences total. Every vocab word MUST appear in at
     least one example. Combine 2-3 vocab words per sentence when natural.
 
@@ -158,7 +182,7 @@ Produce a JSON object with this exact shape (no markdown fences, no prose):
     appear in a minimal way.
   ],
   "expressions": [
-    {{ "ko": "<Korean expression>", "en": "<English translation>" }},
+    { "ko": "<Korean expression>", "en": "<English translation>" },
     ... 2 entries — useful collocations, idiomatic patterns, or paraphrases
     drawn directly from the news story content. Not single words; phrases.
   ],
@@ -171,7 +195,7 @@ Produce a JSON object with this exact shape (no markdown fences, no prose):
   "summary_en": [
     "<sentence 1>", "<sentence 2>", "<sentence 3>"
   ]
-}}
+}
 
 ⚠ FACTUAL FIDELITY (BOTH SUMMARY LEVELS) — non-negotiable:
 - NEVER invent facts, numbers, names, dates, or events not in the article body.
@@ -255,27 +279,31 @@ comes first and reads idiomatically; English is the cushion.
 """
 
 
-
-
-def build_story_prompt_en(story: dict) -> str:
-    return f"""You are building an English-language news listening pack for Korean speakers
-learning English (intermediate level, roughly CEFR B1-B2 — Korean high school
-to university English).
-
+def build_story_prompt(story: dict) -> Prompt:
+    """Static instructions (provider-cacheable prefix) + this story's article."""
+    return Prompt(STORY_INSTRUCTIONS_KO, f"""
 SOURCE ARTICLE (English, U.S. news):
 Headline: {story['headline']}
 Source: {story['source']}
 
 Body:
 {story['body']}
+""")
+
+
+STORY_INSTRUCTIONS_EN = """You are building an English-language news listening pack for Korean speakers
+learning English (intermediate level, roughly CEFR B1-B2 — Korean high school
+to university English).
+
+The SOURCE ARTICLE to work from is at the end of this prompt.
 
 Produce a JSON object with this exact shape (no markdown fences, no prose):
 
-{{
+{
   "track_title_en": "<short English title, 3-7 words>",
   "track_title_ko": "<Korean title>",
   "vocab": [
-    {{ "en": "<English word or phrase>", "ko": "<short Korean gloss>" }},
+    { "en": "<English word or phrase>", "ko": "<short Korean gloss>" },
     ... Pick the items an intermediate Korean learner actually struggles
     with, in priority order: PHRASAL VERBS (lift, call off, step down),
     IDIOMS and fixed COLLOCATIONS (take effect, on the rise, face charges),
@@ -286,7 +314,7 @@ Produce a JSON object with this exact shape (no markdown fences, no prose):
     valuable. List in order of first appearance in your English summary.
   ],
   "examples": [
-    {{ "en": "<easy English example sentence>", "ko": "<Korean translation>" }},
+    { "en": "<easy English example sentence>", "ko": "<Korean translation>" },
     ... 1 to 12 example sentences total. Every vocab item MUST appear in at
     least one example. Combine 2-3 vocab items per sentence when natural.
 
@@ -320,7 +348,7 @@ Produce a JSON object with this exact shape (no markdown fences, no prose):
       Good example: "I negotiate with my brother about chores."
   ],
   "expressions": [
-    {{ "en": "<English expression>", "ko": "<Korean translation>" }},
+    { "en": "<English expression>", "ko": "<Korean translation>" },
     ... 2 entries — useful collocations, idiomatic patterns, or paraphrases
     drawn directly from the news story content. Not single words; phrases.
   ],
@@ -333,7 +361,7 @@ Produce a JSON object with this exact shape (no markdown fences, no prose):
   "summary_ko": [
     "<sentence 1>", "<sentence 2>", "<sentence 3>"
   ]
-}}
+}
 
 ⚠ FACTUAL FIDELITY (BOTH SUMMARY LEVELS) — non-negotiable:
 - NEVER invent facts, numbers, names, dates, or events not in the article body.
@@ -372,40 +400,105 @@ summary, sentence-aligned (3 sentences, same order). English comes first and
 reads idiomatically; Korean is the comprehension cushion for the learner.
 """
 
-# Cost tracker + per-step LLM providers installed by main().
-_cost_recorder: StepCostRecorder | None = None
-_llm_script: LLMProvider | None = None
-_llm_qa: LLMProvider | None = None
-_max_tokens_script: int = 4096
-_max_tokens_qa: int = 4096
+
+def build_story_prompt_en(story: dict) -> Prompt:
+    """en-edition mirror of build_story_prompt."""
+    return Prompt(STORY_INSTRUCTIONS_EN, f"""
+SOURCE ARTICLE (English, U.S. news):
+Headline: {story['headline']}
+Source: {story['source']}
+
+Body:
+{story['body']}
+""")
+
+@dataclass
+class EditionRun:
+    """Per-edition state for one step-2 run: cost recorder, providers, and the
+    edition's prompt/turn builders. Several of these run side by side in the
+    concurrent (--all-editions) mode, so nothing edition-specific is global."""
+    ed: str
+    date: str
+    recorder: StepCostRecorder
+    llm_script: LLMProvider
+    max_tokens_script: int = 4096
+    llm_qa: LLMProvider | None = None
+    max_tokens_qa: int = 4096
+    checkpoints: Checkpoints | None = None
+
+    @property
+    def sfx(self) -> str:
+        return edition.suffix(self.ed)
+
+    @property
+    def prompt_builder(self):
+        return build_story_prompt if self.ed == "ko" else build_story_prompt_en
+
+    @property
+    def turns_builder(self):
+        return build_turns_for_story if self.ed == "ko" else build_turns_for_story_en
+
+    @property
+    def langs(self) -> tuple[str, str]:
+        """(key_lang, gloss_lang) for this edition's lexicon store."""
+        return ("ko", "en") if self.ed == "ko" else ("en", "ko")
+
 
 # Running totals across all calls within a single run.
 _run_totals = {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0}
+_totals_lock = threading.Lock()
 
 
-def call_llm(provider: LLMProvider, max_tokens: int, prompt: str, label: str) -> str:
-    """Single-turn LLM call with cost recording."""
-    print(f"     📡 [{label}] → {provider.name}")
-    print(f"        model={provider.model}  prompt_chars={len(prompt)}  max_tokens={max_tokens}")
-    resp = provider.chat(prompt, max_tokens=max_tokens)
-    cost = 0.0
-    if _cost_recorder is not None:
-        cost = _cost_recorder.add_llm_call(
+def record_llm_usage(run: EditionRun, resp: LLMResponse, label: str) -> None:
+    """Cost bookkeeping + log line for one response (under the totals lock)."""
+    with _totals_lock:
+        cost = run.recorder.add_llm_call(
             provider=resp.provider, model=resp.model,
             input_tokens=resp.input_tokens, output_tokens=resp.output_tokens,
-            label=label, response_chars=len(resp.text),
+            label=label, response_chars=len(resp.text), cache_hit=resp.cache_hit,
+            cache_read_tokens=resp.cache_read_tokens, cache_write_tokens=resp.cache_write_tokens,
+            ttft_ms=resp.ttft_ms, duration_ms=resp.duration_ms, attempts=resp.attempts,
         )
-    _run_totals["input_tokens"] += resp.input_tokens
-    _run_totals["output_tokens"] += resp.output_tokens
-    _run_totals["cost_usd"] += cost
-    print(f"        ✓ usage: input={resp.input_tokens} output={resp.output_tokens} tokens  est_cost=${cost:.4f}  response_chars={len(resp.text)}")
-    print(f"        ↳ running total: input={_run_totals['input_tokens']} output={_run_totals['output_tokens']} cost=${_run_totals['cost_usd']:.4f}")
+        if resp.cache_hit:
+            print(f"        ✓ [{run.ed}/{label}] response cache hit (no charge)  "
+                  f"response_chars={len(resp.text)}")
+            return
+        _run_totals["input_tokens"] += resp.input_tokens
+        _run_totals["output_tokens"] += resp.output_tokens
+        _run_totals["cost_usd"] += cost
+        cached = (f" cache_read={resp.cache_read_tokens} cache_write={resp.cache_write_tokens}"
+                  if resp.cache_read_tokens or resp.cache_write_tokens else "")
+        timing = (f"  ttft={resp.ttft_ms}ms total={resp.duration_ms}ms"
+                  if resp.ttft_ms is not None else "")
+        print(f"        ✓ [{run.ed}/{label}] usage: input={resp.input_tokens} output={resp.output_tokens}{cached} tokens  "
+              f"est_cost=${cost:.4f}  response_chars={len(resp.text)}{timing}  "
+              f"(running: ${_run_totals['cost_usd']:.4f})")
+
+
+def call_llm(run: EditionRun, provider: LLMProvider, max_tokens: int,
+             prompt: Prompt, label: str) -> str:
+    """Single-turn JSON-returning LLM call with cost recording. Streams, so a
+    structurally broken response is aborted and re-asked early (raises
+    JsonStreamError, a json.JSONDecodeError, if the retry breaks too). Safe to
+    call from worker threads: each provider attempt waits for a GOVERNOR slot,
+    the bookkeeping is done under a lock."""
+    print(f"     📡 [{run.ed}/{label}] → {provider.name}  "
+          f"model={provider.model}  prompt_chars={len(prompt)} "
+          f"(static {len(prompt.static)})  max_tokens={max_tokens}")
+    with tracing.span(f"{run.ed}/{label}", "llm", model=f"{provider.name}/{provider.model}") as sp:
+        try:
+            resp = provider.stream_chat(prompt, max_tokens=max_tokens, expect_json=True)
+        except JsonStreamError as e:
+            if getattr(e, "usage", None) is not None:  # aborted, but billed
+                record_llm_usage(run, e.usage, f"{label}:aborted")
+            raise
+        sp.update(input_tokens=resp.input_tokens, output_tokens=resp.output_tokens,
+                  cache_hit=resp.cache_hit, ttft_ms=resp.ttft_ms)
+    record_llm_usage(run, resp, label)
     return resp.text
 
 
-def build_qa_review_prompt(story: dict, generated: dict) -> str:
-    """Build a prompt asking Claude to review and correct its own output."""
-    return f"""You are reviewing a Korean-language learning pack you just generated.
+QA_INSTRUCTIONS_KO = """You are reviewing a Korean-language learning pack you just generated.
 The audience is English speakers learning Korean (TOPIK 2-4). Carefully check
 the script below for any errors and correct them. Be conservative — only change
 things that are actually wrong. If everything is correct, return the input
@@ -465,13 +558,8 @@ CHECK FOR:
 
 8. TYPOS / SPACING: Spelling errors, missing 받침, unusual punctuation.
 
-ORIGINAL ARTICLE (English source — use as ground truth for facts):
-Headline: {story['headline']}
-Body:
-{story['body'][:2000]}
-
-GENERATED SCRIPT TO REVIEW:
-{json.dumps(generated, ensure_ascii=False, indent=2)}
+The ORIGINAL ARTICLE and the GENERATED SCRIPT TO REVIEW are at the end of
+this prompt.
 
 Return ONLY a JSON object with the SAME schema as the input (track_title_ko,
 track_title_en, vocab, examples, expressions, summary_ko, summary_en).
@@ -481,10 +569,20 @@ fixed) so we have an audit trail. If nothing changed, set "_qa_changes": [].
 """
 
 
+def build_qa_review_prompt(story: dict, generated: dict) -> Prompt:
+    """Build a prompt asking Claude to review and correct its own output."""
+    return Prompt(QA_INSTRUCTIONS_KO, f"""
+ORIGINAL ARTICLE (English source — use as ground truth for facts):
+Headline: {story['headline']}
+Body:
+{story['body'][:2000]}
 
-def build_qa_review_prompt_en(story: dict, generated: dict) -> str:
-    """en-edition mirror of build_qa_review_prompt."""
-    return f"""You are reviewing an English-language learning pack you just generated.
+GENERATED SCRIPT TO REVIEW:
+{json.dumps(generated, ensure_ascii=False, indent=2)}
+""")
+
+
+QA_INSTRUCTIONS_EN = """You are reviewing an English-language learning pack you just generated.
 The audience is Korean speakers learning English (CEFR B1-B2). Carefully check
 the script below for any errors and correct them. Be conservative — only change
 things that are actually wrong. If everything is correct, return the input
@@ -532,13 +630,8 @@ CHECK FOR:
 
 8. TYPOS / SPACING: English spelling, Korean spacing and 받침.
 
-ORIGINAL ARTICLE (English source — use as ground truth for facts):
-Headline: {story['headline']}
-Body:
-{story['body'][:2000]}
-
-GENERATED SCRIPT TO REVIEW:
-{json.dumps(generated, ensure_ascii=False, indent=2)}
+The ORIGINAL ARTICLE and the GENERATED SCRIPT TO REVIEW are at the end of
+this prompt.
 
 Return ONLY a JSON object with the SAME schema as the input (track_title_en,
 track_title_ko, vocab, examples, expressions, summary_en_easy,
@@ -549,6 +642,19 @@ nothing changed, set "_qa_changes": [].
 """
 
 
+def build_qa_review_prompt_en(story: dict, generated: dict) -> Prompt:
+    """en-edition mirror of build_qa_review_prompt."""
+    return Prompt(QA_INSTRUCTIONS_EN, f"""
+ORIGINAL ARTICLE (English source — use as ground truth for facts):
+Headline: {story['headline']}
+Body:
+{story['body'][:2000]}
+
+GENERATED SCRIPT TO REVIEW:
+{json.dumps(generated, ensure_ascii=False, indent=2)}
+""")
+
+
 QA_REQUIRED_KEYS = {
     "ko": {"track_title_ko", "track_title_en", "vocab", "examples", "expressions",
            "summary_ko_easy", "summary_ko_natural", "summary_en"},
@@ -557,20 +663,20 @@ QA_REQUIRED_KEYS = {
 }
 
 
-def qa_review_story(story: dict, generated: dict, ed: str = "ko") -> tuple[dict, list[str]]:
-    """Run Claude QA review on a generated story; return (corrected, change_list)."""
-    builder = build_qa_review_prompt if ed == "ko" else build_qa_review_prompt_en
+def qa_review_story(run: EditionRun, story: dict, generated: dict) -> tuple[dict, list[str]]:
+    """Run the cross-model QA review on a generated story; return (corrected, change_list)."""
+    builder = build_qa_review_prompt if run.ed == "ko" else build_qa_review_prompt_en
     prompt = builder(story, generated)
-    raw = call_llm(_llm_qa, _max_tokens_qa, prompt, label=f"qa:{story['story_id']}")
-    cleaned = strip_fences(raw)
     try:
-        reviewed = json.loads(cleaned)
-    except json.JSONDecodeError as e:
-        print(f"     ⚠ QA review returned invalid JSON, keeping original. Error: {e}")
+        raw = call_llm(run, run.llm_qa, run.max_tokens_qa, prompt, label=f"qa:{story['story_id']}")
+        reviewed = json.loads(strip_fences(raw))
+    except json.JSONDecodeError as e:  # incl. JsonStreamError (aborted stream)
+        discard_cached(run.llm_qa, prompt, run.max_tokens_qa)
+        print(f"     ⚠ [{run.ed}/{story['story_id']}] QA review returned invalid JSON, keeping original. Error: {e}")
         return generated, []
     changes = reviewed.pop("_qa_changes", []) or []
     # Ensure all required keys made it through (defensive — fall back to original if not)
-    required = QA_REQUIRED_KEYS[ed]
+    required = QA_REQUIRED_KEYS[run.ed]
     if not required.issubset(reviewed.keys()):
         missing = required - set(reviewed.keys())
         print(f"     ⚠ QA review output missing keys {missing}, keeping original")
@@ -625,32 +731,18 @@ def apply_library_reuse(data: dict, library: Lexicon,
     ]
 
     # 3. Greedy fill from Claude's fresh examples for remaining uncovered vocab
-    # First, annotate Claude's examples with which of today's vocab they contain.
+    # (set_cover: most newly covered vocab per pick, ties to the earlier example).
+    matcher = VocabMatcher(day_vocab_set)
+
     def coverage_of(ex_text: str) -> list[str]:
-        return [v for v in day_vocab_set if v in ex_text]
+        found = set(matcher.terms_in(ex_text))
+        return [v for v in day_vocab_set if v in found]
 
-    fresh_candidates = []
-    for ex in data["examples"]:
-        cov = coverage_of(ex[key_lang])
-        if cov:
-            fresh_candidates.append({**ex, "vocab_covered": cov})
-
-    remaining = uncovered
-    fresh_picks = []
-    while remaining and len(cached_examples) + len(fresh_picks) < 12:
-        best = None
-        best_n = 0
-        for ex in fresh_candidates:
-            if ex in fresh_picks:
-                continue
-            n = len(set(ex["vocab_covered"]) & remaining)
-            if n > best_n:
-                best = ex
-                best_n = n
-        if not best:
-            break
-        fresh_picks.append(best)
-        remaining -= set(best["vocab_covered"])
+    fresh_index = ExampleIndex.from_texts((ex[key_lang] for ex in data["examples"]), matcher)
+    picked, remaining = fresh_index.cover(day_vocab_set, uncovered,
+                                          max_picks=12 - len(cached_examples))
+    fresh_picks = [{**data["examples"][i], "vocab_covered": coverage_of(data["examples"][i][key_lang])}
+                   for i in picked]
 
     # 4. Combine + reorder by min vocab index (Beginner set plays in this order)
     vocab_idx = {v: i for i, v in enumerate(day_vocab_set)}
@@ -1118,208 +1210,331 @@ def render_date_titles(date: str) -> tuple[str, str]:
     return ko, en
 
 
-def main() -> int:
-    args = parse_args()
-    date = args.date or today_eastern()
-
-    chosen_path = WORK_ROOT / date / "chosen.json"
-    if not chosen_path.exists():
-        raise SystemExit(f"❌ chosen.json not found at {chosen_path}. Run step 1 first.")
-    chosen = json.loads(chosen_path.read_text(encoding="utf-8"))
-    stories = chosen["stories"]
-
-    ed = args.edition
-    sfx = edition.suffix(ed)
-    pack_id = f"news{sfx}_{date.replace('-', '_')}"
-    if ed == "ko":
-        pack_title_ko, pack_title_en = render_date_titles(date)
-    else:
-        pack_title_ko, pack_title_en = render_date_titles_en(date)
+def produce_story(run: EditionRun, s: dict, *, no_qa: bool,
+                  extra_instruction: str = "") -> tuple[dict, list[str]]:
+    """Generate + QA one story. `extra_instruction` is appended to the prompt
+    on a copyright-rewrite retry."""
+    prompt = run.prompt_builder(s) + extra_instruction
+    try:
+        raw = call_llm(run, run.llm_script, run.max_tokens_script, prompt,
+                       label=f"script:{s['story_id']}")
+        data = json.loads(strip_fences(raw))
+    except json.JSONDecodeError:  # incl. JsonStreamError (aborted stream)
+        discard_cached(run.llm_script, prompt, run.max_tokens_script)
+        raise
+    changes: list[str] = []
+    if not no_qa:
+        data, changes = qa_review_story(run, s, data)
+    return data, changes
+
+
+def generated_key(run: EditionRun, s: dict, *, no_qa: bool) -> str:
+    """Checkpoint key of a story's LLM half: its prompt (story + template)
+    and the models that answer it."""
+    qa = None if no_qa or run.llm_qa is None else (run.llm_qa.name, run.llm_qa.model)
+    return fingerprint(prompt_text(run.prompt_builder(s)), run.llm_script.name,
+                       run.llm_script.model, qa)
+
+
+def generate_story(run: EditionRun, s: dict, *, no_qa: bool) -> dict | None:
+    """The LLM half of a story: script → QA → verbatim gate (with one rewrite
+    for the en edition). Touches no shared state besides the cost recorder,
+    so stories and editions can run this concurrently. Returns
+    {"data", "qa_changes"}, or None when the copyright gate drops the story.
+    Reuses the story's `generated` checkpoint when there is a matching one."""
+    tag = f"[{run.ed}/{s['story_id']}]"
+    key = generated_key(run, s, no_qa=no_qa)
+    if run.checkpoints is not None:
+        hit = run.checkpoints.get("generated", s["story_id"], key)
+        if hit is not None:
+            print(f"━━━ {tag} ♻️  reused generated script from checkpoint ({hit['at']})"
+                  + ("  [dropped by copyright gate]" if hit["result"] is None else ""))
+            return hit["result"]
+    print(f"━━━ {tag} {s['headline'][:70]}")
+    result = _generate_story(run, s, tag, no_qa=no_qa)
+    if run.checkpoints is not None:
+        run.checkpoints.put("generated", s["story_id"], key, result)
+    return result
+
+
+def run_jobs(jobs: list[tuple[EditionRun, dict]], concurrency: int, *,
+             no_qa: bool) -> list[dict | None]:
+    """generate_story for every (run, story), `concurrency` at a time, results
+    in job order. The first failure cancels the jobs that haven't started
+    (ones already running finish and checkpoint) and is re-raised."""
+    pool = ThreadPoolExecutor(max_workers=max(1, min(len(jobs), concurrency)))
+    try:
+        futures = [pool.submit(generate_story, run, s, no_qa=no_qa) for run, s in jobs]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        return [f.result() for f in futures]
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        pool.shutdown(wait=True)
 
-    out_path = WORK_ROOT / date / f"script{sfx}.json"
 
-    if not args.config.exists():
-        raise SystemExit(f"❌ llm.yaml not found: {args.config}")
-    llm_cfg = yaml.safe_load(args.config.read_text(encoding="utf-8")) or {}
+def _generate_story(run: EditionRun, s: dict, tag: str, *, no_qa: bool) -> dict | None:
+    try:
+        data, qa_changes = produce_story(run, s, no_qa=no_qa)
+    except json.JSONDecodeError as e:
+        print(f"   ❌ {tag} JSON parse error: {e}", file=sys.stderr)
+        raise SystemExit(1)
+    if qa_changes:
+        print(f"     ✎ {tag} QA made {len(qa_changes)} change(s):")
+        for c in qa_changes:
+            print(f"        · {c}")
+    elif not no_qa:
+        print(f"     ✓ {tag} QA: no changes needed")
+
+    # ── Verbatim copyright gate (deterministic, no API cost) ──────────
+    # English learner text must state facts in our OWN words. A 6+ word run
+    # shared with the source article is copied EXPRESSION, not fact.
+    flags = verbatim_flags(s, data)
+    if flags:
+        worst = flags[0]
+        print(f"     ⚠ {tag} Verbatim overlap: {len(flags)} sentence(s) share up to a "
+              f"{worst['run']}-word run with the source (e.g. \"{worst['phrase']}\")")
+        if run.ed == "en":
+            # Hard gate: rewrite ONCE, then drop rather than publish a copy.
+            reword = (
+                "\n\n⚠️ REWRITE REQUIRED: an earlier draft reused exact phrasing "
+                "from the source article (e.g. "
+                + "; ".join(f"\"{f['phrase']}\"" for f in flags[:5])
+                + "). Rewrite ALL English learner text in your OWN words — do not "
+                "reuse any run of 6 or more consecutive words from the source. "
+                "Convey the facts, not the source's sentences."
+            )
+            try:
+                data, qa_changes = produce_story(run, s, no_qa=no_qa, extra_instruction=reword)
+                flags = verbatim_flags(s, data)
+            except json.JSONDecodeError:
+                pass  # keep original flags → dropped below
+            if flags:
+                print(f"     ❌ {tag} COPYRIGHT GATE: {len(flags)} verbatim run(s) remain "
+                      f"after one rewrite — DROPPING it from the English bundle rather "
+                      f"than publish copied text.")
+                return None
+            print(f"     ✓ {tag} Rewrite cleared the overlap")
+        else:
+            print(f"       (ko edition: advisory — the English gloss can echo, but "
+                  f"cross-language narration is not a verbatim copy)")
+    return {"data": data, "qa_changes": qa_changes}
+
+
+def finish_or_reuse(run: EditionRun, s: dict, g: dict, library: Lexicon) -> dict:
+    """finish_story, or the story's `scripted` checkpoint if it was finished
+    from this same generated output before (its library writes are already
+    in the saved Lexicon). A fresh result is checkpointed on flush(), after
+    the caller saves the Lexicon."""
+    key = fingerprint(g)  # before finish_story: library reuse edits g["data"] in place
+    cp = run.checkpoints
+    if cp is not None:
+        hit = cp.get("scripted", s["story_id"], key)
+        if hit is not None:
+            print(f"   ♻️  [{run.ed}/{s['story_id']}] reused finished story from checkpoint "
+                  f"(library already recorded)")
+            return hit["result"]
+    story = finish_story(run, s, g["data"], g["qa_changes"], library)
+    if cp is not None:
+        cp.defer("scripted", s["story_id"], key, story)
+    return story
+
+
+def finish_story(run: EditionRun, s: dict, data: dict, qa_changes: list[str],
+                 library: Lexicon) -> dict:
+    """The library half of a story: gloss locking, example reuse, recording
+    back into the Lexicon, and turn building. Runs sequentially in story
+    order — the only serialized part of a concurrent run — so the Lexicon
+    sees exactly the same read/write sequence as a serial run."""
+    key_lang, gloss_lang = run.langs
+    tag = f"[{run.ed}/{s['story_id']}]"
+
+    # ── Library reuse: lock glosses + opportunistic example reuse ─────
+    reuse_report = apply_library_reuse(data, library, key_lang, gloss_lang)
+    if reuse_report["locked_glosses"]:
+        print(f"     🔒 {tag} Library locked {len(reuse_report['locked_glosses'])} gloss(es):")
+        for term, fresh_gloss, locked_gloss in reuse_report["locked_glosses"]:
+            print(f"        · {term}: '{fresh_gloss}' → '{locked_gloss}' (locked)")
+    print(f"     📚 {tag} Examples: {reuse_report['cached_examples_used']} cached + "
+          f"{reuse_report['fresh_examples_added']} fresh = "
+          f"{reuse_report['final_example_count']} total")
+    if reuse_report["uncovered_vocab"]:
+        print(f"        ⚠ Uncovered vocab (no example): {reuse_report['uncovered_vocab']}")
+
+    # Record new vocab + fresh examples back to the library
+    for v in data["vocab"]:
+        library.record_vocab(v[key_lang], v[gloss_lang], run.date)
+    for ex in data["examples"]:
+        library.record_example(ex[key_lang], ex[gloss_lang], ex.get("vocab_covered", []), run.date)
 
-    print(f"═══ Generating script for {date} (edition: {ed}) ═══")
-    print(f"  Pack ID:   {pack_id}")
-    print(f"  Title:     {pack_title_ko} / {pack_title_en}")
-    print(f"  Stories:   {len(stories)}")
-    print(f"  Output:    {out_path}")
-    print()
+    turns, practice_sets = run.turns_builder(data, run.date)
+    summary_fields = (("summary_ko_easy", "summary_ko_natural", "summary_en")
+                      if run.ed == "ko" else
+                      ("summary_en_easy", "summary_en_natural", "summary_ko"))
+    print(f"   ✓ {tag} {len(turns)} turns, {sum(len(ps['clips']) for ps in practice_sets)} clips across 3 sets")
+    return {
+        "story_id": s["story_id"],
+        "category": s["category"],
+        "headline": s["headline"],
+        "source": s["source"],
+        "link": s["link"],
+        "track_title_ko": data["track_title_ko"],
+        "track_title_en": data["track_title_en"],
+        "vocab": data["vocab"],
+        "examples": data["examples"],
+        "expressions": data["expressions"],
+        **{k: data[k] for k in summary_fields},
+        "qa_changes": qa_changes,
+        "turns": turns,
+        "practice_sets": practice_sets,
+    }
 
-    prompt_builder = build_story_prompt if ed == "ko" else build_story_prompt_en
-    turns_builder = build_turns_for_story if ed == "ko" else build_turns_for_story_en
-    key_lang, gloss_lang = ("ko", "en") if ed == "ko" else ("en", "ko")
 
-    if not args.commit:
-        sample = stories[0]
-        prompt = prompt_builder(sample)
-        print("--- DRY RUN — sample prompt for first story ---")
-        print(prompt[:2000])
-        if len(prompt) > 2000:
-            print(f"... [truncated, full length {len(prompt)} chars] ...")
-        print()
-        print(f"Will call Claude {len(stories)} times (once per story) when --commit.")
-        return 0
+def script_header(ed: str, date: str) -> dict:
+    """Pack-level fields of script.json (everything except the stories)."""
+    sfx = edition.suffix(ed)
+    pack_title_ko, pack_title_en = (render_date_titles(date) if ed == "ko"
+                                    else render_date_titles_en(date))
+    return {
+        "date": date,
+        "edition": ed,
+        "pack_id": f"news{sfx}_{date.replace('-', '_')}",
+        "pack_title_ko": pack_title_ko,
+        "pack_title_en": pack_title_en,
+    }
 
-    # Install cost recorder + LLM providers (per-step)
-    global _cost_recorder, _llm_script, _llm_qa, _max_tokens_script, _max_tokens_qa
-    work_date_dir = WORK_ROOT / date
-    _cost_recorder = StepCostRecorder(f"2_generate_script{sfx}", work_date_dir)
-    _llm_script = provider_for_step("script", llm_cfg)
-    _max_tokens_script = max_tokens_for_step("script", llm_cfg, default=4096)
-    if not args.no_qa:
-        _llm_qa = provider_for_step("qa_review", llm_cfg)
-        _max_tokens_qa = max_tokens_for_step("qa_review", llm_cfg, default=4096)
-        print(f"📡 Script LLM: {_llm_script.name}/{_llm_script.model}  (max_tokens={_max_tokens_script})")
-        print(f"📡 QA LLM:     {_llm_qa.name}/{_llm_qa.model}  (max_tokens={_max_tokens_qa})  ← cross-model review")
-    else:
-        print(f"📡 Script LLM: {_llm_script.name}/{_llm_script.model}  (max_tokens={_max_tokens_script})")
-        print(f"📡 QA LLM:     (disabled with --no-qa)")
-    print()
 
-    # Load shared library for vocab/example reuse
+def write_edition(run: EditionRun, stories: list[dict], generated: list[dict | None]) -> None:
+    """Phase B for one edition: library work in story order, then script.json."""
+    date, ed, sfx = run.date, run.ed, run.sfx
     # Shared store: ko-en.json keyed by Korean; en-ko.json keyed by English
     # (store fields are positional: "ko" = key term, "en"/"canonical_en" = gloss)
-    library = Lexicon.load() if ed == "ko" else Lexicon.load(pair="en-ko")
+    library = artifacts.lexicon(ed)
     lib_stats_before = library.stats_summary()
+    print()
     print(f"📚 Lexicon ({lib_stats_before['pair']}): "
           f"{lib_stats_before['vocab_terms']} vocab, "
           f"{lib_stats_before['example_sentences']} examples")
-    print()
 
     story_outputs = []
     dropped_for_copyright = 0
-    for s in stories:
-        print(f"━━━ [{s['story_id']}] {s['headline'][:70]}")
-
-        def produce_story(extra_instruction: str = ""):
-            """Generate + QA one story. `extra_instruction` is appended to the
-            prompt on a copyright-rewrite retry."""
-            raw = call_llm(_llm_script, _max_tokens_script,
-                           prompt_builder(s) + extra_instruction,
-                           label=f"script:{s['story_id']}")
-            data_local = json.loads(strip_fences(raw))
-            changes: list[str] = []
-            if not args.no_qa:
-                data_local, changes = qa_review_story(s, data_local, ed)
-            return data_local, changes
-
-        try:
-            data, qa_changes = produce_story()
-        except json.JSONDecodeError as e:
-            print(f"   ❌ JSON parse error: {e}", file=sys.stderr)
-            raise SystemExit(1)
-        if qa_changes:
-            print(f"     ✎ QA made {len(qa_changes)} change(s):")
-            for c in qa_changes:
-                print(f"        · {c}")
-        elif not args.no_qa:
-            print(f"     ✓ QA: no changes needed")
-
-        # ── Verbatim copyright gate (deterministic, no API cost) ──────────
-        # English learner text must state facts in our OWN words. A 6+ word run
-        # shared with the source article is copied EXPRESSION, not fact.
-        flags = verbatim_flags(s, data)
-        if flags:
-            worst = flags[0]
-            print(f"     ⚠ Verbatim overlap: {len(flags)} sentence(s) share up to a "
-                  f"{worst['run']}-word run with the source (e.g. \"{worst['phrase']}\")")
-            if ed == "en":
-                # Hard gate: rewrite ONCE, then drop rather than publish a copy.
-                reword = (
-                    "\n\n⚠️ REWRITE REQUIRED: an earlier draft reused exact phrasing "
-                    "from the source article (e.g. "
-                    + "; ".join(f"\"{f['phrase']}\"" for f in flags[:5])
-                    + "). Rewrite ALL English learner text in your OWN words — do not "
-                    "reuse any run of 6 or more consecutive words from the source. "
-                    "Convey the facts, not the source's sentences."
-                )
-                try:
-                    data, qa_changes = produce_story(reword)
-                    flags = verbatim_flags(s, data)
-                except json.JSONDecodeError:
-                    pass  # keep original flags → dropped below
-                if flags:
-                    print(f"     ❌ COPYRIGHT GATE: {len(flags)} verbatim run(s) remain "
-                          f"after one rewrite — DROPPING [{s['story_id']}] from the "
-                          f"English bundle rather than publish copied text.")
-                    dropped_for_copyright += 1
-                    continue
-                print(f"     ✓ Rewrite cleared the overlap")
-            else:
-                print(f"       (ko edition: advisory — the English gloss can echo, but "
-                      f"cross-language narration is not a verbatim copy)")
-
-        # ── Library reuse: lock glosses + opportunistic example reuse ─────
-        reuse_report = apply_library_reuse(data, library, key_lang, gloss_lang)
-        if reuse_report["locked_glosses"]:
-            print(f"     🔒 Library locked {len(reuse_report['locked_glosses'])} gloss(es):")
-            for term, fresh_gloss, locked_gloss in reuse_report["locked_glosses"]:
-                print(f"        · {term}: '{fresh_gloss}' → '{locked_gloss}' (locked)")
-        print(f"     📚 Examples: {reuse_report['cached_examples_used']} cached + "
-              f"{reuse_report['fresh_examples_added']} fresh = "
-              f"{reuse_report['final_example_count']} total")
-        if reuse_report["uncovered_vocab"]:
-            print(f"        ⚠ Uncovered vocab (no example): {reuse_report['uncovered_vocab']}")
-
-        # Record new vocab + fresh examples back to the library
-        for v in data["vocab"]:
-            library.record_vocab(v[key_lang], v[gloss_lang], date)
-        for ex in data["examples"]:
-            library.record_example(ex[key_lang], ex[gloss_lang], ex.get("vocab_covered", []), date)
-
-        turns, practice_sets = turns_builder(data, date)
-        summary_fields = (("summary_ko_easy", "summary_ko_natural", "summary_en")
-                          if ed == "ko" else
-                          ("summary_en_easy", "summary_en_natural", "summary_ko"))
-        story_outputs.append({
-            "story_id": s["story_id"],
-            "category": s["category"],
-            "headline": s["headline"],
-            "source": s["source"],
-            "link": s["link"],
-            "track_title_ko": data["track_title_ko"],
-            "track_title_en": data["track_title_en"],
-            "vocab": data["vocab"],
-            "examples": data["examples"],
-            "expressions": data["expressions"],
-            **{k: data[k] for k in summary_fields},
-            "qa_changes": qa_changes,
-            "turns": turns,
-            "practice_sets": practice_sets,
-        })
-        print(f"   ✓ {len(turns)} turns, {sum(len(ps['clips']) for ps in practice_sets)} clips across 3 sets")
+    for s, g in zip(stories, generated):
+        if g is None:
+            dropped_for_copyright += 1
+            continue
+        story_outputs.append(finish_or_reuse(run, s, g, library))
 
     if dropped_for_copyright:
         print()
-        print(f"⚠ Copyright gate dropped {dropped_for_copyright} story(ies) that still "
+        print(f"⚠ [{ed}] Copyright gate dropped {dropped_for_copyright} story(ies) that still "
               f"copied the source after a rewrite. {len(story_outputs)} remain.")
     if not story_outputs:
-        raise SystemExit("❌ No stories survived the copyright gate — refusing to write "
+        raise SystemExit(f"❌ [{ed}] No stories survived the copyright gate — refusing to write "
                          "an empty bundle. Re-run (fresh sources) or lower the risk.")
 
+    out_path = WORK_ROOT / date / f"script{sfx}.json"
     payload = {
-        "date": date,
-        "edition": ed,
-        "pack_id": pack_id,
-        "pack_title_ko": pack_title_ko,
-        "pack_title_en": pack_title_en,
+        **script_header(ed, date),
         "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
         "stories": story_outputs,
     }
-    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    artifacts.write_json(out_path, payload)
     library.save()
-    _cost_recorder.write()
+    if run.checkpoints is not None:
+        run.checkpoints.flush()
+        run.recorder.extra["checkpoints"] = run.checkpoints.report()
+    run.recorder.write()
     lib_stats_after = library.stats_summary()
     print()
     print(f"✅ Wrote {out_path}")
-    print(f"   Cost report: {_cost_recorder.work_dir}/costs/{_cost_recorder.step}.json")
-    print(f"   Total Claude usage: input={_run_totals['input_tokens']} output={_run_totals['output_tokens']} tokens  est_total_cost=${_run_totals['cost_usd']:.4f}")
+    print(f"   Cost report: {run.recorder.work_dir}/costs/{run.recorder.step}.json")
     print(f"   📚 Library now: {lib_stats_after['vocab_terms']} vocab (+{lib_stats_after['vocab_terms'] - lib_stats_before['vocab_terms']}), "
           f"{lib_stats_after['example_sentences']} examples (+{lib_stats_after['example_sentences'] - lib_stats_before['example_sentences']})")
+    if run.checkpoints is not None:
+        print(f"   {run.checkpoints.summary()}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    date = args.date or today_eastern()
+
+    chosen_path = WORK_ROOT / date / "chosen.json"
+    if not chosen_path.exists():
+        raise SystemExit(f"❌ chosen.json not found at {chosen_path}. Run step 1 first.")
+    chosen = artifacts.read_json(chosen_path)
+    stories = chosen["stories"]
+
+    editions = list(edition.EDITIONS) if args.all_editions else [args.edition]
+
+    if not args.config.exists():
+        raise SystemExit(f"❌ llm.yaml not found: {args.config}")
+    llm_cfg = artifacts.load_yaml(args.config)
+    concurrency = args.concurrency or int(llm_cfg.get("max_concurrent_calls", DEFAULT_CONCURRENCY))
+
+    print(f"═══ Generating script for {date} (edition: {', '.join(editions)}) ═══")
+    for ed in editions:
+        header = script_header(ed, date)
+        print(f"  [{ed}] Pack ID: {header['pack_id']}  "
+              f"Title: {header['pack_title_ko']} / {header['pack_title_en']}")
+        print(f"  [{ed}] Output:  {WORK_ROOT / date / f'script{edition.suffix(ed)}.json'}")
+    print(f"  Stories:     {len(stories)}")
+    print(f"  Concurrency: {concurrency} stories in flight")
+    print()
+
+    if not args.commit:
+        for ed in editions:
+            prompt_builder = build_story_prompt if ed == "ko" else build_story_prompt_en
+            prompt = prompt_builder(stories[0])
+            print(f"--- DRY RUN — sample {ed} prompt for first story ---")
+            print(prompt.static[:1500])
+            print(f"... [static prefix: {len(prompt.static)} chars, provider-cached "
+                  f"across calls] ...")
+            print(prompt.dynamic[:1500])
+            if len(prompt.dynamic) > 1500:
+                print(f"... [truncated, story part {len(prompt.dynamic)} chars] ...")
+            print()
+        print(f"Will call the script LLM {len(stories) * len(editions)} times "
+              f"(once per story per edition) when --commit.")
+        return 0
+
+    # Install per-edition cost recorders + LLM providers
+    work_date_dir = WORK_ROOT / date
+    tracing.start_step("2_generate_script" if len(editions) > 1
+                       else f"2_generate_script{edition.suffix(editions[0])}", work_date_dir)
+    llm_script = provider_for_step("script", llm_cfg)
+    llm_qa = None if args.no_qa else provider_for_step("qa_review", llm_cfg)
+    runs = [
+        EditionRun(
+            ed=ed, date=date,
+            recorder=StepCostRecorder(f"2_generate_script{edition.suffix(ed)}", work_date_dir),
+            llm_script=llm_script,
+            max_tokens_script=max_tokens_for_step("script", llm_cfg, default=4096),
+            llm_qa=llm_qa,
+            max_tokens_qa=max_tokens_for_step("qa_review", llm_cfg, default=4096),
+            checkpoints=Checkpoints(work_date_dir, ed, enabled=not args.fresh),
+        )
+        for ed in editions
+    ]
+    print(f"📡 Script LLM: {llm_script.name}/{llm_script.model}  (max_tokens={runs[0].max_tokens_script})")
+    if llm_qa is not None:
+        print(f"📡 QA LLM:     {llm_qa.name}/{llm_qa.model}  (max_tokens={runs[0].max_tokens_qa})  ← cross-model review")
+    else:
+        print(f"📡 QA LLM:     (disabled with --no-qa)")
+    print()
+
+    # Phase A — every story × edition through script → QA → verbatim gate,
+    # `concurrency` at a time. The GOVERNOR bounds the provider calls.
+    jobs = [(run, s) for run in runs for s in stories]
+    results = run_jobs(jobs, concurrency, no_qa=args.no_qa)
+
+    # Phase B — Lexicon reads/writes, story order, one edition at a time.
+    for i, run in enumerate(runs):
+        with tracing.span(f"write {run.ed} (lexicon + script)", "io"):
+            write_edition(run, stories, results[i * len(stories):(i + 1) * len(stories)])
+
+    print()
+    print(f"   Total LLM usage: input={_run_totals['input_tokens']} output={_run_totals['output_tokens']} tokens  est_total_cost=${_run_totals['cost_usd']:.4f}")
     return 0
 
 
@@ -11,44 +11,56 @@ into script.json as `summary_en_easy`, 1:1 aligned with `summary_ko_easy`.
 Step 4 (assemble) then attaches these as `translations` on the transcript
 spans, so the app can show the English for any easy-summary clip.
 
+Stories are translated concurrently (async; the llm_providers governor caps
+what is in flight per provider). With --batch they go out instead as one
+provider batch job — half price, but it can take minutes to hours, so it's
+meant for backfills rather than the daily run.
+
 Idempotent: stories that already have a well-formed `summary_en_easy`
 (same length as `summary_ko_easy`) are skipped. Safe to run as a backfill
-against any older work/<date>/ directory.
+against any older work/<date>/ directory. Each translation is also
+checkpointed per story as it arrives (checkpoints.py, keyed by the prompt),
+so a run that dies on the last story — or a re-run after step 2 rewrote
+script.json with the same summaries — only pays for what's missing.
 
 Output:
     work/<date>/script.json  (updated in place; original kept as .bak)
 
 Usage:
-    python 2b_translate_easy.py [--date YYYY-MM-DD] [--force]
+    python 2b_translate_easy.py [--date YYYY-MM-DD] [--force] [--batch]
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
 import json
 
+import artifacts
 import edition
+import tracing
 import re
 import sys
 from pathlib import Path
 
-import yaml
-
+from checkpoints import Checkpoints, fingerprint
 from cost_tracker import StepCostRecorder
-from llm_providers import LLMProvider, provider_for_step, max_tokens_for_step
+from llm_providers import BatchError, LLMProvider, discard_cached, provider_for_step, max_tokens_for_step
 
 HERE = Path(__file__).resolve().parent
 WORK_ROOT = HERE / "work"
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Translate easy-summary sentences to English")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     p.add_argument("--force", action="store_true",
-                   help="Re-translate even if the gloss field already exists")
+                   help="Re-translate even if the gloss field (or a checkpoint of it) already exists")
+    p.add_argument("--batch", action="store_true",
+                   help="Submit all stories as one provider batch job (cheaper, slower; for backfills)")
     edition.add_edition_arg(p)
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -91,60 +103,167 @@ def parse_response(text: str, expected_count: int) -> list[str]:
     return arr
 
 
-def main() -> int:
-    args = parse_args()
+def gloss_fields(ed: str) -> tuple[str, str]:
+    """(source summary field, gloss field to write) for an edition."""
+    return (("summary_ko_easy", "summary_en_easy") if ed == "ko"
+            else ("summary_en_easy", "summary_ko_easy"))
+
+
+def _pending(story: dict, ed: str, force: bool, checkpoints: Checkpoints | None = None) -> bool:
+    """Whether a story still needs its gloss (prints why not). A matching
+    checkpoint fills the gloss in place and counts as not pending."""
+    src_field, dst_field = gloss_fields(ed)
+    src_sents = story.get(src_field) or []
+    if not src_sents:
+        print(f"  ⏭  {story['story_id']}: no {src_field}, skipping")
+        return False
+    existing = story.get(dst_field) or []
+    if not force and len(existing) == len(src_sents):
+        print(f"  ⏭  {story['story_id']}: {dst_field} already present ({len(src_sents)} sentences)")
+        return False
+    if checkpoints is not None:
+        hit = checkpoints.get("translated", story["story_id"], fingerprint(build_prompt(story, ed)))
+        if hit is not None and len(hit["result"]) == len(src_sents):
+            story[dst_field] = hit["result"]
+            print(f"  ♻️  {story['story_id']}: {dst_field} reused from checkpoint ({hit['at']})")
+            return False
+    print(f"  📡 {story['story_id']}: translating {len(src_sents)} sentences")
+    return True
+
+
+def _apply(story: dict, ed: str, provider: LLMProvider, prompt: str, max_tokens: int,
+           resp, recorder: StepCostRecorder, checkpoints: Checkpoints | None = None) -> None:
+    """Record the call, write the parsed gloss into the story and
+    checkpoint it."""
+    src_field, dst_field = gloss_fields(ed)
+    cost = recorder.add_llm_call(
+        provider=resp.provider, model=resp.model,
+        input_tokens=resp.input_tokens, output_tokens=resp.output_tokens,
+        label=f"translate_easy:{story['story_id']}", response_chars=len(resp.text),
+        cache_hit=resp.cache_hit, cache_read_tokens=resp.cache_read_tokens,
+        cache_write_tokens=resp.cache_write_tokens, batch=resp.batch,
+    )
+    try:
+        story[dst_field] = parse_response(resp.text, len(story[src_field]))
+    except ValueError:
+        discard_cached(provider, prompt, max_tokens)
+        raise
+    if checkpoints is not None:
+        checkpoints.put("translated", story["story_id"], fingerprint(prompt), story[dst_field])
+    if resp.cache_hit:
+        print(f"     ✓ {story['story_id']}: response cache hit (no charge)")
+    else:
+        print(f"     ✓ {story['story_id']}: input={resp.input_tokens} output={resp.output_tokens} tokens  "
+              f"est_cost=${cost:.4f}{'  (batch)' if resp.batch else ''}")
+
+
+def translate_story(story: dict, ed: str, provider: LLMProvider, max_tokens: int,
+                    recorder: StepCostRecorder, *, force: bool = False,
+                    checkpoints: Checkpoints | None = None) -> bool:
+    """Fill the gloss field of one story in place. Returns True if it was
+    translated, False if skipped (nothing to translate, already present, or
+    restored from a checkpoint)."""
+    if not _pending(story, ed, force, checkpoints):
+        return False
+    prompt = build_prompt(story, ed)
+    with tracing.span(f"translate_easy:{story['story_id']}", "llm"):
+        resp = provider.chat(prompt, max_tokens=max_tokens)
+    _apply(story, ed, provider, prompt, max_tokens, resp, recorder, checkpoints)
+    return True
+
+
+async def atranslate_story(story: dict, ed: str, provider: LLMProvider, max_tokens: int,
+                           recorder: StepCostRecorder, *, force: bool = False,
+                           checkpoints: Checkpoints | None = None) -> bool:
+    """Async translate_story — main() runs every story at once; the
+    llm_providers governor caps what is actually in flight."""
+    if not _pending(story, ed, force, checkpoints):
+        return False
+    prompt = build_prompt(story, ed)
+    with tracing.span(f"translate_easy:{story['story_id']}", "llm"):
+        resp = await provider.achat(prompt, max_tokens=max_tokens)
+    _apply(story, ed, provider, prompt, max_tokens, resp, recorder, checkpoints)
+    return True
+
+
+async def translate_all(stories: list[dict], ed: str, provider: LLMProvider, max_tokens: int,
+                        recorder: StepCostRecorder, *, force: bool = False,
+                        checkpoints: Checkpoints | None = None) -> list[bool]:
+    return await asyncio.gather(*(
+        atranslate_story(story, ed, provider, max_tokens, recorder, force=force,
+                         checkpoints=checkpoints)
+        for story in stories
+    ))
+
+
+def translate_batch(stories: list[dict], ed: str, provider: LLMProvider, max_tokens: int,
+                    recorder: StepCostRecorder, *, force: bool = False,
+                    checkpoints: Checkpoints | None = None) -> list[bool]:
+    """translate_all via one provider batch job. Requests the batch reports
+    as failed (errored / expired) or that came back malformed are re-sent as
+    ordinary calls; a malformed reply's batch spend is still recorded."""
+    pending = [story for story in stories if _pending(story, ed, force, checkpoints)]
+    prompts = {story["story_id"]: build_prompt(story, ed) for story in pending}
+    results = provider.chat_batch(prompts, max_tokens=max_tokens)
+    for story in pending:
+        prompt = prompts[story["story_id"]]
+        resp = results[story["story_id"]]
+        if isinstance(resp, BatchError):
+            print(f"  ⚠️  {story['story_id']}: batch request failed ({resp}); retrying directly")
+        else:
+            try:
+                _apply(story, ed, provider, prompt, max_tokens, resp, recorder, checkpoints)
+                continue
+            except ValueError as e:
+                print(f"  ⚠️  {story['story_id']}: {e}; retrying directly")
+        resp = provider.chat(prompt, max_tokens=max_tokens)
+        _apply(story, ed, provider, prompt, max_tokens, resp, recorder, checkpoints)
+    return [story["story_id"] in prompts for story in stories]
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     date = args.date or today_eastern()
     work_dir = WORK_ROOT / date
 
     ed = args.edition
     sfx = edition.suffix(ed)
-    src_field, dst_field = (("summary_ko_easy", "summary_en_easy") if ed == "ko"
-                            else ("summary_en_easy", "summary_ko_easy"))
 
     script_path = work_dir / f"script{sfx}.json"
     if not script_path.exists():
         raise SystemExit(f"❌ {script_path.name} not found at {script_path}. Run step 2 first.")
 
-    script = json.loads(script_path.read_text(encoding="utf-8"))
+    script = artifacts.read_json(script_path)
 
-    llm_cfg = yaml.safe_load((HERE / "llm.yaml").read_text(encoding="utf-8"))
+    llm_cfg = artifacts.load_yaml(HERE / "llm.yaml")
     provider: LLMProvider = provider_for_step("translate_easy", llm_cfg)
     max_tokens = max_tokens_for_step("translate_easy", llm_cfg)
 
     recorder = StepCostRecorder(f"2b_translate_easy{sfx}", work_dir)
+    tracing.start_step(f"2b_translate_easy{sfx}", work_dir)
+    checkpoints = Checkpoints(work_dir, ed, enabled=not args.force)
 
-    translated = 0
-    skipped = 0
-    for story in script["stories"]:
-        src_sents = story.get(src_field) or []
-        if not src_sents:
-            print(f"  ⏭  {story['story_id']}: no {src_field}, skipping")
-            skipped += 1
-            continue
-        existing = story.get(dst_field) or []
-        if not args.force and len(existing) == len(src_sents):
-            print(f"  ⏭  {story['story_id']}: {dst_field} already present ({len(src_sents)} sentences)")
-            skipped += 1
-            continue
-
-        print(f"  📡 {story['story_id']}: translating {len(src_sents)} sentences → {provider.name}/{provider.model}")
-        resp = provider.chat(build_prompt(story, ed), max_tokens=max_tokens)
-        cost = recorder.add_llm_call(
-            provider=resp.provider, model=resp.model,
-            input_tokens=resp.input_tokens, output_tokens=resp.output_tokens,
-            label=f"translate_easy:{story['story_id']}", response_chars=len(resp.text),
-        )
-        story[dst_field] = parse_response(resp.text, len(src_sents))
-        print(f"     ✓ input={resp.input_tokens} output={resp.output_tokens} tokens  est_cost=${cost:.4f}")
-        translated += 1
-
-    if translated:
+    if args.batch:
+        print(f"📦 {provider.name}/{provider.model}: {len(script['stories'])} stories, as one batch job")
+        done = translate_batch(script["stories"], ed, provider, max_tokens, recorder,
+                               force=args.force, checkpoints=checkpoints)
+    else:
+        print(f"📡 {provider.name}/{provider.model}: {len(script['stories'])} stories, concurrently")
+        done = asyncio.run(translate_all(script["stories"], ed, provider, max_tokens, recorder,
+                                         force=args.force, checkpoints=checkpoints))
+    translated = sum(done)
+    restored = len(checkpoints.reused.get("translated", []))
+    skipped = len(done) - translated - restored
+
+    if translated or restored:
         backup = script_path.with_suffix(".json.bak")
         if not backup.exists():
             backup.write_text(script_path.read_text(encoding="utf-8"), encoding="utf-8")
-        script_path.write_text(json.dumps(script, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        artifacts.write_json(script_path, script)
+        recorder.extra["checkpoints"] = checkpoints.report()
         recorder.write()
-        print(f"✅ Updated {script_path} ({translated} stories translated, {skipped} skipped)")
+        print(f"✅ Updated {script_path} ({translated} stories translated, "
+              f"{restored} reused from checkpoints, {skipped} skipped)")
     else:
         print(f"✅ Nothing to do ({skipped} stories skipped)")
     return 0
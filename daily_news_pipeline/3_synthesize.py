@@ -35,14 +35,14 @@ import shutil
 import sys
 from pathlib import Path
 
-import yaml
-
 from studypack.adapters import news as news_adapter
 from voicebox import key_params, remaining_credits, synth_pack
 
 from lexicon import Lexicon
 
+import artifacts
 import edition
+import tracing
 from cost_tracker import StepCostRecorder
 
 HERE = Path(__file__).resolve().parent
@@ -54,7 +54,7 @@ DEFAULT_MAX_CHARS = 20_000
 CONFIRM_CHAR_THRESHOLD = 15_000
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Synthesize per-story audio (via voicebox)")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     edition.add_edition_arg(p)
@@ -63,7 +63,7 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS,
                    help="Abort if freshly-debited (cache-miss) chars would exceed this.")
     p.add_argument("--commit", action="store_true", help="Actually call the TTS provider.")
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -118,6 +118,7 @@ def write_legacy_outputs(manifest: dict, script: dict, vb_dir: Path, out_dir: Pa
                 voice_id=voice.voice_id, voice_label=voice.voice_label,
                 model=manifest["model"], lang=turn["lang"], text=turn["text"],
                 audio_key=span["audio_key"], cache_hit=bool(span["from_cache"]),
+                label=f"tts:{story_id}",
             )
 
         # Concatenated track
@@ -149,22 +150,24 @@ def write_legacy_outputs(manifest: dict, script: dict, vb_dir: Path, out_dir: Pa
               f"track {group['duration_ms']} ms")
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     date = args.date or today_eastern()
 
     sfx = edition.suffix(args.edition)
+    if args.commit:
+        tracing.start_step(f"3_synthesize{sfx}", WORK_ROOT / date)
     script_path = WORK_ROOT / date / f"script{sfx}.json"
     if not script_path.exists():
         raise SystemExit(f"❌ {script_path.name} not found at {script_path}. Run step 2 first.")
-    script = json.loads(script_path.read_text(encoding="utf-8"))
+    script = artifacts.read_json(script_path)
     if script.get("edition", "ko") != args.edition:
         raise SystemExit(f"❌ {script_path.name} is edition {script.get('edition', 'ko')!r}, "
                          f"but --edition {args.edition} was requested.")
 
     if not args.config.exists():
         raise SystemExit(f"❌ tts config not found: {args.config}")
-    cfg = yaml.safe_load(args.config.read_text(encoding="utf-8")) or {}
+    cfg = artifacts.load_yaml(args.config)
     if args.tts:
         cfg["provider"] = args.tts
     provider_name = cfg.get("provider")
@@ -239,17 +242,20 @@ def main() -> int:
     out_dir.mkdir(parents=True, exist_ok=True)
     vb_dir = out_dir / "vb"
 
-    library = (Lexicon.load() if args.edition == "ko"
-               else Lexicon.load(pair="en-ko"))  # shared stores at ~/.langpack/lexicon/
+    library = artifacts.lexicon(args.edition)  # shared stores at ~/.langpack/lexicon/
     pre_stats = library.stats_summary()
     recorder = StepCostRecorder(f"3_synthesize{sfx}", WORK_ROOT / date)
     kp = key_params(plan["provider"], cfg)
 
-    manifest = synth_pack(pack, cfg, vb_dir, commit=True, concat=True)
+    # Per-turn requests happen inside voicebox; this span is the whole pack.
+    with tracing.span(f"voicebox synth ({plan['provider']})", "tts", turns=t["calls"],
+                      synthesized=t["synthesized"], chars_debited=t["chars_debited"]):
+        manifest = synth_pack(pack, cfg, vb_dir, commit=True, concat=True)
 
     print()
-    write_legacy_outputs(manifest, script, vb_dir, out_dir, pause_ms,
-                         library, recorder, kp)
+    with tracing.span("legacy outputs + library attach", "io"):
+        write_legacy_outputs(manifest, script, vb_dir, out_dir, pause_ms,
+                             library, recorder, kp)
 
     # Keep the raw manifest, drop the voicebox-layout staging dir.
     shutil.copy2(vb_dir / "voicebox.manifest.json", out_dir / "voicebox.manifest.json")
@@ -25,7 +25,9 @@ from pathlib import Path
 
 from bundler import GroupAudio, materialize, timings_from_voicebox
 
+import artifacts
 import edition
+import tracing
 from studypack.adapters import news as news_adapter
 
 HERE = Path(__file__).resolve().parent
@@ -35,12 +37,12 @@ CLOUDFRONT_BASE = "https://d1ni0tk3ua6bwo.cloudfront.net"
 PUBLISH_PREFIX_TEMPLATE = "lmaudio/{bundle_id}"
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Assemble the day's iOS bundle.json")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     edition.add_edition_arg(p)
     p.add_argument("--author", default="Six Wands Studios")
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -65,18 +67,19 @@ def legacy_timings_audio(pack, audio_dir: Path) -> dict:
     return audio
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     date = args.date or today_eastern()
 
     work_dir = WORK_ROOT / date
     sfx = edition.suffix(args.edition)
+    tracing.start_step(f"4_assemble_bundle{sfx}", work_dir)
     script_path = work_dir / f"script{sfx}.json"
     audio_dir = work_dir / f"audio{sfx}"
     if not script_path.exists():
         raise SystemExit(f"❌ {script_path.name} not found at {script_path}. Run step 2 first.")
 
-    script = json.loads(script_path.read_text(encoding="utf-8"))
+    script = artifacts.read_json(script_path)
     if script.get("edition", "ko") != args.edition:
         raise SystemExit(f"❌ {script_path.name} is edition {script.get('edition', 'ko')!r}, "
                          f"but --edition {args.edition} was requested.")
@@ -95,22 +98,22 @@ def main() -> int:
         audio = legacy_timings_audio(pack, audio_dir)
 
     pack_id = script["pack_id"]
-    bundle = materialize(
-        pack,
-        audio=audio,
-        prefix=PUBLISH_PREFIX_TEMPLATE.format(bundle_id=pack_id),
-        public_base=CLOUDFRONT_BASE,
-        pack_id=pack_id,
-        author=args.author,
-        gloss_titles=True,
-        track_name=lambda unit, group, single: f"{unit.id.replace('-', '_')}.mp3",
-        # legacy news convention: track.id == filename (iOS re-derives from url)
-        track_id=lambda unit, group, filename, single: filename,
-    )
+    with tracing.span("materialize bundle", "cpu"):
+        bundle = materialize(
+            pack,
+            audio=audio,
+            prefix=PUBLISH_PREFIX_TEMPLATE.format(bundle_id=pack_id),
+            public_base=CLOUDFRONT_BASE,
+            pack_id=pack_id,
+            author=args.author,
+            gloss_titles=True,
+            track_name=lambda unit, group, single: f"{unit.id.replace('-', '_')}.mp3",
+            # legacy news convention: track.id == filename (iOS re-derives from url)
+            track_id=lambda unit, group, filename, single: filename,
+        )
 
     out_path = work_dir / f"bundle{sfx}.json"
-    out_path.write_text(json.dumps(bundle, ensure_ascii=False, indent=2) + "\n",
-                        encoding="utf-8")
+    artifacts.write_json(out_path, bundle)
     n_tracks = len(bundle["packs"][0]["tracks"])
     n_clips = sum(len(ps["clips"]) for t in bundle["packs"][0]["tracks"]
                   for ps in t["practiceSets"])
@@ -15,21 +15,39 @@ at the destination prefix are never overwritten unless --redeploy is passed
 (publisher clobber gate). bundle.json is CloudFront-invalidated after upload
 so republished packs propagate immediately.
 
+Upload order: publisher's preflight (a dry run of the whole plan) and the
+clobber gate run over every key first; then the MP3s go
+up concurrently (--upload-workers threads, multipart above 8 MB) and each is
+verified by size with a HEAD; only once ALL of them have landed does
+publisher upload + verify + invalidate bundle.json, and then the
+news_latest alias. --all-editions publishes ko and en side by side in one
+process (what run.py does). --defer-invalidation queues the CloudFront paths
+for run.py's one batched invalidation at the end of the run
+(invalidations.py) instead of invalidating here — each path as soon as its
+object has been published, so a failure before the alias still gets the
+dated bundle.json invalidated.
+
 Usage:
     python 5_publish_s3.py [--date YYYY-MM-DD] [--commit] [--redeploy]
+    python 5_publish_s3.py --all-editions --commit
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
+import artifacts
+import aws_clients
 import edition
+import invalidations
 import notify_email
-import json
+import tracing
 from pathlib import Path
 
-from publisher import build_app_url, load_destination, publish, write_qr_png
+from publisher import (build_app_url, check_clobber, load_destination, publish,
+                       require_no_clobber, write_qr_png)
 
 HERE = Path(__file__).resolve().parent
 WORK_ROOT = HERE / "work"
@@ -43,15 +61,30 @@ LATEST_ALIAS_KEYS = {
     "en": "lmaudio/news_en_latest/bundle.json",
 }
 
+# Audio upload tuning. A story MP3 is 3–12 MB; multipart splits the larger
+# ones into parallel 8 MB parts, and the pool keeps several stories in flight.
+UPLOAD_WORKERS = 8
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+PARTS_PER_FILE = 4
+
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Publish the day's bundle to S3 + generate QR")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     p.add_argument("--commit", action="store_true", help="Actually upload to S3.")
     edition.add_edition_arg(p)
+    p.add_argument("--all-editions", action="store_true",
+                   help="Publish every edition (ko + en) concurrently in one process "
+                        "(overrides --edition)")
     p.add_argument("--redeploy", action="store_true",
                    help="Allow overwriting an already-published pack (cp-only, never deletes).")
-    return p.parse_args()
+    p.add_argument("--defer-invalidation", action="store_true",
+                   help="Queue the CloudFront paths for the run's batched invalidation "
+                        "(invalidations.py) instead of invalidating now")
+    p.add_argument("--upload-workers", type=int, default=UPLOAD_WORKERS,
+                   help=f"Concurrent MP3 uploads per edition (default {UPLOAD_WORKERS})")
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -59,72 +92,140 @@ def today_eastern() -> str:
     return now.strftime("%Y-%m-%d")
 
 
-def main() -> int:
-    args = parse_args()
-    date = args.date or today_eastern()
+def upload_audio(dest, plan: list[tuple[Path, str]], workers: int) -> None:
+    """Upload the MP3 entries of `plan` concurrently and check each one
+    landed (HEAD size == local size). Raises on the first failure, without
+    starting the uploads still queued, so the caller never gets to the
+    manifest. The clobber gate must already have run over these keys."""
+    from boto3.s3.transfer import TransferConfig
+
+    # Thread-safe; shared by the pool and both editions, so the pool is sized
+    # for --all-editions: editions × workers × multipart parts.
+    s3 = aws_clients.client("s3", max_pool_connections=max(
+        aws_clients.MAX_POOL_CONNECTIONS, len(edition.EDITIONS) * workers * PARTS_PER_FILE))
+    config = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD,
+                            multipart_chunksize=MULTIPART_CHUNKSIZE,
+                            max_concurrency=PARTS_PER_FILE)
 
-    sfx = edition.suffix(args.edition)
+    def upload(path: Path, key: str) -> None:
+        size = path.stat().st_size
+        with tracing.span(f"upload {key}", "s3", bytes=size,
+                          multipart=size >= MULTIPART_THRESHOLD or None):
+            s3.upload_file(str(path), dest.bucket, key,
+                           ExtraArgs={"ContentType": "audio/mpeg"}, Config=config)
+            landed = s3.head_object(Bucket=dest.bucket, Key=key)["ContentLength"]
+        if landed != size:
+            raise SystemExit(f"❌ Post-flight: s3://{dest.bucket}/{key} is {landed} bytes, "
+                             f"local {path.name} is {size}. bundle.json NOT published.")
+        print(f"   ✓ {key} ({size / 1e6:.1f} MB)")
+
+    # The first failure cancels the uploads that haven't started (ones in
+    # flight finish) and is re-raised; bundle.json is never reached.
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(plan))))
+    try:
+        futures = [pool.submit(upload, path, key) for path, key in plan]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for f in futures:
+            f.result()
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        pool.shutdown(wait=True)
+
+
+def publish_edition(ed: str, date: str, args: argparse.Namespace) -> int:
+    sfx = edition.suffix(ed)
     work_dir = WORK_ROOT / date
     bundle_path = work_dir / f"bundle{sfx}.json"
     audio_dir = work_dir / f"audio{sfx}"
     if not bundle_path.exists():
         raise SystemExit(f"❌ {bundle_path.name} not found at {bundle_path}. Run step 4 first.")
 
-    manifest = json.loads(bundle_path.read_text(encoding="utf-8"))
+    manifest = artifacts.read_json(bundle_path)
     pack_id = manifest["id"]
     prefix = PREFIX_TEMPLATE.format(bundle_id=pack_id)
-    latest_alias_key = LATEST_ALIAS_KEYS[args.edition]
+    latest_alias_key = LATEST_ALIAS_KEYS[ed]
 
     dest = load_destination(DESTINATION)
     mp3_files = sorted(p for p in audio_dir.glob("*.mp3") if p.is_file())
-    # Upload audio FIRST and the manifest LAST. publish() uploads plan entries
-    # in order, so this guarantees there is never a window where a live
+    # Audio FIRST, manifest LAST: bundle.json is only uploaded once every MP3
+    # has landed and been verified, so there is never a window where a live
     # bundle.json points at MP3s that haven't landed yet (a client hitting
     # CloudFront mid-publish would otherwise 404 on every clip).
     # The S3 key is always bundle.json even when the local file is bundle_en.json.
-    plan = [(f, f"{prefix}/{f.name}") for f in mp3_files]
-    plan.append((bundle_path, f"{prefix}/bundle.json"))
-    files_to_upload = mp3_files + [bundle_path]
+    audio_plan = [(f, f"{prefix}/{f.name}") for f in mp3_files]
+    manifest_entry = (bundle_path, f"{prefix}/bundle.json")
+    plan = audio_plan + [manifest_entry]
 
     manifest_url = dest.public_url(f"{prefix}/bundle.json")
     qr_path = work_dir / f"qr{sfx}.png"
 
-    print(f"═══ Publishing {pack_id} for {date} ═══")
-    print(f"  Destination:   {DESTINATION} (s3://{dest.bucket}/)")
-    print(f"  Prefix:        {prefix}/")
-    print(f"  Manifest URL:  {manifest_url}")
-    print(f"  QR output:     {qr_path}")
-    print()
-
-    publish(dest, plan,
-            redeploy=args.redeploy,
-            invalidate_paths=[f"/{prefix}/bundle.json"],
-            commit=args.commit)
+    # One print, so --all-editions doesn't interleave the two headers.
+    print(f"═══ Publishing {pack_id} for {date} ═══\n"
+          f"  Destination:   {DESTINATION} (s3://{dest.bucket}/)\n"
+          f"  Prefix:        {prefix}/\n"
+          f"  Manifest URL:  {manifest_url}\n"
+          f"  QR output:     {qr_path}\n")
 
+    # publisher's read-only pass over every key: protected-keys preflight,
+    # clobber report, plan. It can't do concurrent multipart uploads, so the
+    # MP3s themselves go up through upload_audio().
+    with tracing.span(f"publisher preflight {pack_id} (dry run)", "s3"):
+        publish(dest, plan,
+                redeploy=args.redeploy,
+                invalidate_paths=[f"/{prefix}/bundle.json"],
+                commit=False)
     if not args.commit:
-        print(f"Re-run with --commit to publish {len(files_to_upload)} files.")
+        print(f"Re-run with --commit to publish {len(plan)} files.")
         return 0
 
+    # Clobber gate over every key (manifest included) before anything lands.
+    with tracing.span(f"clobber gate {pack_id} ({len(plan)} keys)", "s3"):
+        clobber_map = check_clobber(dest, [k for _, k in plan])
+        require_no_clobber(dest, clobber_map, redeploy=args.redeploy)
+
+    print(f"⬆️  [{ed}] Uploading {len(audio_plan)} MP3s ({args.upload_workers} at a time)...")
+    with tracing.span(f"upload {pack_id} audio ({len(audio_plan)} files)", "s3",
+                      bytes=sum(f.stat().st_size for f, _ in audio_plan)):
+        upload_audio(dest, audio_plan, args.upload_workers)
+
+    # publisher does preflight, upload, verify and invalidation in one call.
+    manifest_paths = [f"/{prefix}/bundle.json"]
+    with tracing.span(f"publish {pack_id}/bundle.json + invalidation", "s3",
+                      bytes=bundle_path.stat().st_size):
+        publish(dest, [manifest_entry],
+                redeploy=args.redeploy,
+                invalidate_paths=[] if args.defer_invalidation else manifest_paths,
+                commit=True)
+    if args.defer_invalidation:
+        invalidations.enqueue(work_dir, DESTINATION, manifest_paths)
+
     # news_latest alias (NEWS_PUSH_PIPELINE_SPEC.md, option A): the iOS app's
     # daily reminder resolves "today's pack" via this stable key even when a
     # run slips. Only bundle.json is aliased — its pack id and audio URLs stay
     # dated, so the app dedups against the real pack and audio isn't duplicated.
     print()
     print(f"🔗 Updating {latest_alias_key} alias...")
-    publish(dest, [(bundle_path, latest_alias_key)],
-            allow_overwrite_keys=(latest_alias_key,),   # rolling alias, always overwritten
-            invalidate_paths=[f"/{latest_alias_key}"],
-            commit=True)
+    alias_paths = [f"/{latest_alias_key}"]
+    with tracing.span(f"publish alias {latest_alias_key} + invalidation", "s3"):
+        publish(dest, [(bundle_path, latest_alias_key)],
+                allow_overwrite_keys=(latest_alias_key,),   # rolling alias, always overwritten
+                invalidate_paths=[] if args.defer_invalidation else alias_paths,
+                commit=True)
+    if args.defer_invalidation:
+        invalidations.enqueue(work_dir, DESTINATION, alias_paths)
 
-    print("🔳 Generating QR code...")
-    write_qr_png(manifest_url, qr_path)
-    print(f"✅ QR code: {qr_path}")
-    print(f"   App URL:      {build_app_url(manifest_url)}")
-    print(f"   Manifest URL: {manifest_url}")
+    print(f"🔳 [{ed}] Generating QR code...")
+    with tracing.span(f"qr png ({ed})", "cpu"):
+        write_qr_png(manifest_url, qr_path)
+    print(f"✅ QR code: {qr_path}\n"
+          f"   App URL:      {build_app_url(manifest_url)}\n"
+          f"   Manifest URL: {manifest_url}")
 
     pack = manifest.get("packs", [{}])[0]
     tracks = "\n".join(f"  · {t.get('title', '?')}" for t in pack.get("tracks", []))
-    edition_label = "Korean" if args.edition == "ko" else "English"
+    edition_label = "Korean" if ed == "ko" else "English"
     notify_email.send(
         subject=f"✅ {pack_id} deployed ({edition_label} edition)",
         body=(f"{pack.get('title', pack_id)}\n\n"
@@ -132,10 +233,27 @@ def main() -> int:
               f"Manifest: {manifest_url}\n"
               f"Alias:    {dest.public_url(latest_alias_key)}\n"
               + (f"Web:      https://sixwandsstudios.com/news/{date}/\n"
-                 if args.edition == "ko" else "")),
+                 if ed == "ko" else "")),
     )
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    date = args.date or today_eastern()
+    editions = list(edition.EDITIONS) if args.all_editions else [args.edition]
+
+    if args.commit:
+        tracing.start_step("5_publish_s3" if len(editions) > 1
+                           else f"5_publish_s3{edition.suffix(editions[0])}", WORK_ROOT / date)
+    if len(editions) == 1:
+        return publish_edition(editions[0], date, args)
+    # Each edition keeps its own audio → manifest → alias order; the two
+    # editions share no keys, so they run side by side.
+    with ThreadPoolExecutor(max_workers=len(editions)) as pool:
+        futures = [pool.submit(publish_edition, ed, date, args) for ed in editions]
+        return max(f.result() for f in futures)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
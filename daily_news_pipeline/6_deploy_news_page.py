@@ -3,25 +3,43 @@
 Step 6: Render today's HTML news page into the local sixwands.com source tree,
 git-commit, then cp-only sync the changed files to s3://sixwandsstudios.com/.
 
-NEVER deletes anything. NEVER uses `aws s3 sync --delete` or `aws s3 rm`. Before
-any upload, performs a pre-flight check that confirms the bucket root still
-contains all known-good top-level files.
+NEVER deletes anything from the bucket. NEVER uses `aws s3 sync --delete` or
+`aws s3 rm`. Before any upload, performs a pre-flight check that confirms the
+bucket root still contains all known-good top-level files.
 
 Output:
     ~/Desktop/sixwandsstudiosllc/sixwands.com/news/<date>/index.html
-    ~/Desktop/sixwandsstudiosllc/sixwands.com/news/<date>/qr.png
+    ~/Desktop/sixwandsstudiosllc/sixwands.com/news/<date>/qr.<hash>.png
     ~/Desktop/sixwandsstudiosllc/sixwands.com/news/<date>/meta.json
     ~/Desktop/sixwandsstudiosllc/sixwands.com/news/index.html  (rolling archive)
+    ~/Desktop/sixwandsstudiosllc/sixwands.com/news/archive.json (archive index)
+    ~/Desktop/sixwandsstudiosllc/sixwands.com/news/feed.json    (JSON Feed for the app)
 
 The day page is a full study sheet: EN+KO story titles, vocabulary table,
 easy + natural Korean summaries, and a collapsible English translation. Content
 comes from work/<date>/script.json; audio URLs come from work/<date>/bundle.json.
 
+The archive page and feed are rendered from news/archive.json, one entry per
+published day (newest first), which each deploy updates with just its own
+day — no directory scan or per-day meta.json reads. A missing index is
+rebuilt once from the day dirs' meta.json files; --rebuild-archive forces
+that (e.g. after removing a day by hand).
+
+The upload is built first (site_assets.py, into work/<date>/site/): HTML
+minified, HTML / JSON gzip-encoded, the QR PNG optimized
+under a content-hashed name with a one-year Cache-Control, and a 5-minute
+Cache-Control on the day page, meta.json and the archive page / index /
+feed. publisher's preflight (dry run) and clobber gate clear every key; the
+built objects are then PUT with their Content-Encoding / Cache-Control
+headers (publisher has no per-object headers) and HEAD-verified.
+
 Safety: defaults to dry-run. Pass --commit to git-commit + upload. Existing
 published day pages are never overwritten unless --redeploy is passed.
+--defer-invalidation (run.py) queues the CloudFront paths for the run's one
+batched invalidation (invalidations.py) instead of invalidating here.
 
 Usage:
-    python 6_deploy_news_page.py [--date YYYY-MM-DD] [--commit] [--redeploy]
+    python 6_deploy_news_page.py [--date YYYY-MM-DD] [--commit] [--redeploy] [--rebuild-archive]
 """
 
 from __future__ import annotations
@@ -29,11 +47,16 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 
+import artifacts
 import edition
+import invalidations
 import json
+import site_assets
+import tracing
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 from pagesmith import news_archive, news_day
@@ -54,15 +77,25 @@ KO_MONTHS = ["", "1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월",
 EN_MONTHS = ["", "January", "February", "March", "April", "May", "June",
              "July", "August", "September", "October", "November", "December"]
 
+SITE_URL = "https://sixwandsstudios.com"
+ARCHIVE_DAYS = 60  # days listed on the archive page
+FEED_DAYS = 30     # items in feed.json
+
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Deploy today's news page to sixwandsstudios.com")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
     edition.add_edition_arg(p)
     p.add_argument("--commit", action="store_true", help="Git-commit + upload to S3.")
     p.add_argument("--redeploy", action="store_true",
                    help="Allow overwriting an already-published day page (still cp-only, never deletes).")
-    return p.parse_args()
+    p.add_argument("--rebuild-archive", action="store_true",
+                   help="Rebuild news/archive.json from every day dir's meta.json "
+                        "instead of updating it with today's entry")
+    p.add_argument("--defer-invalidation", action="store_true",
+                   help="Queue the CloudFront paths for the run's batched invalidation "
+                        "(invalidations.py) instead of invalidating now")
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -78,6 +111,11 @@ def render_date_titles(date: str) -> tuple[str, str]:
     return ko, en
 
 
+def manifest_url_for(manifest: dict) -> str:
+    track_url = manifest["packs"][0]["tracks"][0]["url"]
+    return track_url.rsplit("/", 1)[0] + "/bundle.json"
+
+
 def render_day_page(date: str, manifest: dict, script: dict, qr_filename: str) -> str:
     """Render via pagesmith (templates live there, byte-identical to the
     pages this module used to render inline)."""
@@ -85,8 +123,7 @@ def render_day_page(date: str, manifest: dict, script: dict, qr_filename: str) -
     for w in warnings:
         print(f"  ⚠ studypack: {w}", file=sys.stderr)
     _, title_en = render_date_titles(date)
-    track_url = manifest["packs"][0]["tracks"][0]["url"]
-    manifest_url = track_url.rsplit("/", 1)[0] + "/bundle.json"
+    manifest_url = manifest_url_for(manifest)
     app_url = f"languagemirror://bundle?url={manifest_url.replace(':', '%3A').replace('/', '%2F')}"
     return news_day.render(pack, title_en=title_en,
                            qr_filename=qr_filename, app_url=app_url)
@@ -110,33 +147,101 @@ def build_day_meta(date: str, script: dict) -> dict:
     }
 
 
-def render_archive_page(news_root: Path) -> str:
-    """Scan date subdirs newest-first, build entries from meta.json, render
-    via pagesmith."""
-    day_dirs = sorted(
-        (p.name for p in news_root.iterdir()
-         if p.is_dir() and len(p.name) == 10 and p.name[4] == "-"),
-        reverse=True,
-    )
+def archive_entry(meta: dict, manifest_url: str | None = None) -> dict:
+    """One archive.json entry: the day's meta plus the preview line the
+    archive page shows."""
+    titles = [s["title_en"] for s in meta.get("stories", []) if s.get("title_en")]
+    entry = {**meta, "preview": " · ".join(titles) if titles else None}
+    if manifest_url:
+        entry["manifest_url"] = manifest_url
+    return entry
+
+
+def _is_day_dir(p: Path) -> bool:
+    return p.is_dir() and len(p.name) == 10 and p.name[4] == "-"
+
+
+def rebuild_archive_index(news_root: Path) -> list[dict]:
+    """Every day dir's meta.json → index entries, newest first (what the
+    archive page used to do on every deploy). Days without a readable
+    meta.json get their date titles and no preview."""
     days = []
-    for d in day_dirs[:60]:  # last 60 days max in the archive
-        _, en = render_date_titles(d)
-        preview = None
+    for d in sorted((p.name for p in news_root.iterdir() if _is_day_dir(p)), reverse=True):
+        title_ko, title_en = render_date_titles(d)
+        meta = {"date": d, "title_en": title_en, "title_ko": title_ko, "stories": []}
         meta_path = news_root / d / "meta.json"
         if meta_path.exists():
             try:
-                meta = json.loads(meta_path.read_text(encoding="utf-8"))
-                titles = [s["title_en"] for s in meta.get("stories", []) if s.get("title_en")]
-                if titles:
-                    preview = " · ".join(titles)
-            except (json.JSONDecodeError, KeyError):
-                pass
-        days.append({"date": d, "title_en": en, "preview": preview})
-    return news_archive.render(days)
-
-
-def main() -> int:
-    args = parse_args()
+                parsed = json.loads(meta_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict):
+                meta = {**parsed, "date": d}
+        try:
+            days.append(archive_entry(meta))
+        except (KeyError, TypeError):
+            days.append(archive_entry({"date": d, "title_en": title_en,
+                                       "title_ko": title_ko, "stories": []}))
+    return days
+
+
+def update_archive_index(news_root: Path, entry: dict, rebuild: bool = False) -> list[dict]:
+    """news/archive.json with `entry` inserted (or replacing the same date),
+    newest first. Written back and returned."""
+    index_path = news_root / "archive.json"
+    if rebuild or not index_path.exists():
+        print(f"🗂  Building {index_path.name} from the day dirs' meta.json")
+        days = rebuild_archive_index(news_root)
+    else:
+        days = json.loads(index_path.read_text(encoding="utf-8"))["days"]
+    days = [d for d in days if d["date"] != entry["date"]]
+    days.append(entry)
+    days.sort(key=lambda d: d["date"], reverse=True)
+    index_path.write_text(
+        json.dumps({"version": 1, "days": days}, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8")
+    return days
+
+
+def render_archive_page(days: list[dict]) -> str:
+    """Archive index entries (newest first) → the archive page, via
+    pagesmith."""
+    return news_archive.render([
+        {"date": d["date"], "title_en": render_date_titles(d["date"])[1], "preview": d.get("preview")}
+        for d in days[:ARCHIVE_DAYS]
+    ])
+
+
+def render_feed(days: list[dict]) -> str:
+    """JSON Feed 1.1 (https://jsonfeed.org/version/1.1) of the latest days.
+    Items carry the pack manifest URL under `_languagemirror` so the app
+    can open a day straight from the feed."""
+    items = []
+    for d in days[:FEED_DAYS]:
+        item = {
+            "id": d["date"],
+            "url": f"{SITE_URL}/news/{d['date']}/",
+            "title": d.get("title_en") or render_date_titles(d["date"])[1],
+            "content_text": d.get("preview") or "",
+            "date_published": f"{d['date']}T08:00:00-04:00",
+            "language": "ko",
+        }
+        if d.get("manifest_url"):
+            item["_languagemirror"] = {"manifest_url": d["manifest_url"],
+                                       "title_ko": d.get("title_ko")}
+        items.append(item)
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": "Language Mirror — Daily Korean News",
+        "home_page_url": f"{SITE_URL}/news/",
+        "feed_url": f"{SITE_URL}/news/feed.json",
+        "items": items,
+    }
+    return json.dumps(feed, ensure_ascii=False, indent=2) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     if getattr(args, "edition", "ko") != "ko":
         print("⏭ English-edition web pages are not yet supported (see "
               "ENGLISH_NEWS_EDITION_SPEC.md step 6) — nothing to do.")
@@ -144,6 +249,8 @@ def main() -> int:
     date = args.date or today_eastern()
 
     work_dir = WORK_ROOT / date
+    if args.commit:
+        tracing.start_step("6_deploy_news_page", work_dir)
     bundle_path = work_dir / "bundle.json"
     script_path = work_dir / "script.json"
     qr_src = work_dir / "qr.png"
@@ -157,56 +264,105 @@ def main() -> int:
     if not SITE_DIR.exists():
         raise SystemExit(f"❌ site dir not found: {SITE_DIR}")
 
-    manifest = json.loads(bundle_path.read_text(encoding="utf-8"))
-    script = json.loads(script_path.read_text(encoding="utf-8"))
+    manifest = artifacts.read_json(bundle_path)
+    script = artifacts.read_json(script_path)
 
     # 1. Render and write files locally
     news_root = SITE_DIR / "news"
     day_dir = news_root / date
     day_dir.mkdir(parents=True, exist_ok=True)
 
-    day_html = render_day_page(date, manifest, script, "qr.png")
+    build_dir = work_dir / "site"
+    with tracing.span("optimize + hash qr png", "cpu"):
+        qr_built = site_assets.build_qr(qr_src, build_dir)
+    qr_path = day_dir / qr_built.name
+    # A redeploy with a different QR leaves the old hash behind otherwise.
+    # Site tree only: the bucket is never deleted from.
+    for stale in site_assets.remove_stale_qrs(day_dir, qr_path):
+        print(f"   🗑  {stale} (superseded QR)")
+    shutil.copy2(qr_built, qr_path)
+
+    day_html = render_day_page(date, manifest, script, qr_path.name)
     day_html_path = day_dir / "index.html"
     day_html_path.write_text(day_html, encoding="utf-8")
-    shutil.copy2(qr_src, day_dir / "qr.png")
 
     meta = build_day_meta(date, script)
     meta_path = day_dir / "meta.json"
     meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
-    archive_html = render_archive_page(news_root)
+    with tracing.span("update archive index + render archive page, feed", "cpu"):
+        days = update_archive_index(news_root, archive_entry(meta, manifest_url_for(manifest)),
+                                    rebuild=args.rebuild_archive)
+        archive_html = render_archive_page(days)
+        feed_json = render_feed(days)
     archive_html_path = news_root / "index.html"
     archive_html_path.write_text(archive_html, encoding="utf-8")
+    archive_index_path = news_root / "archive.json"
+    feed_path = news_root / "feed.json"
+    feed_path.write_text(feed_json, encoding="utf-8")
 
     print(f"📝 Wrote local site files under {news_root}")
     print(f"   {day_html_path}")
-    print(f"   {day_dir}/qr.png")
+    print(f"   {qr_path}")
     print(f"   {meta_path}")
     print(f"   {archive_html_path}")
+    print(f"   {archive_index_path} ({len(days)} days)")
+    print(f"   {feed_path}")
     print()
 
-    # Publish via the langpack publisher (gates + upload + verify + invalidate).
+    # Build what's uploaded: the hashed QR is immutable, everything else
+    # can change on a redeploy / the next day's deploy. Uploaded in this
+    # order, so nothing goes live before what it links to: the QR, then the
+    # day page and meta.json, then the archive page / index / feed that
+    # point at the day.
     dest = load_destination(DESTINATION)
-    plan = [
-        (day_html_path, f"news/{date}/index.html"),
-        (day_dir / "qr.png", f"news/{date}/qr.png"),
-        (meta_path, f"news/{date}/meta.json"),
-        (archive_html_path, "news/index.html"),
+    entries = [
+        (qr_path, f"news/{date}/{qr_path.name}", site_assets.IMMUTABLE),
+        (day_html_path, f"news/{date}/index.html", site_assets.SHORT),
+        (meta_path, f"news/{date}/meta.json", site_assets.SHORT),
+        (archive_html_path, "news/index.html", site_assets.SHORT),
+        (archive_index_path, "news/archive.json", site_assets.SHORT),
+        (feed_path, "news/feed.json", site_assets.SHORT),
     ]
+    with tracing.span(f"build site assets ({len(entries)} files)", "cpu"):
+        assets = site_assets.build(entries, build_dir)
+    print(f"🗜  Built {len(assets)} objects under {build_dir}")
+    for line in site_assets.report(entries, assets):
+        print(f"   {line}")
+    print()
+    rolling = ("news/index.html", "news/archive.json", "news/feed.json")
+    rolling_keys = tuple(a.key for a in assets if a.key in rolling)
+
+    # publisher's read-only pass over the built objects: protected-keys
+    # preflight, clobber report, plan. It can't set Content-Encoding /
+    # Cache-Control, so the upload itself is site_assets.upload().
+    with tracing.span("publisher preflight (dry run)", "s3"):
+        publish(dest, [(a.path, a.key) for a in assets],
+                allow_overwrite_keys=rolling_keys,  # rolling archive page, index, feed
+                redeploy=args.redeploy,
+                invalidate_paths=[],
+                commit=False)
 
     if args.commit:
         # Clobber gate BEFORE the git commit so a refused publish leaves the
         # site repo untouched (matches the original step-6 ordering).
-        clobber_map = check_clobber(dest, [k for _, k in plan])
+        clobber_map = check_clobber(dest, [a.key for a in assets])
         require_no_clobber(dest, clobber_map,
-                           allow=("news/index.html",), redeploy=args.redeploy)
+                           allow=rolling_keys, redeploy=args.redeploy)
 
         print("📦 Committing to git...")
+        git_t0 = time.time()
         subprocess.run(["git", "-C", str(SITE_REPO), "add",
                         str(day_html_path.relative_to(SITE_REPO)),
-                        str((day_dir / "qr.png").relative_to(SITE_REPO)),
+                        str(qr_path.relative_to(SITE_REPO)),
                         str(meta_path.relative_to(SITE_REPO)),
-                        str(archive_html_path.relative_to(SITE_REPO))],
+                        str(archive_html_path.relative_to(SITE_REPO)),
+                        str(archive_index_path.relative_to(SITE_REPO)),
+                        str(feed_path.relative_to(SITE_REPO))],
+                       check=True)
+        # Stages the removal of a superseded qr.<hash>.png.
+        subprocess.run(["git", "-C", str(SITE_REPO), "add", "--update",
+                        str(day_dir.relative_to(SITE_REPO))],
                        check=True)
         diff_check = subprocess.run(
             ["git", "-C", str(SITE_REPO), "diff", "--cached", "--quiet"],
@@ -219,17 +375,25 @@ def main() -> int:
                 check=True,
             )
             print(f"   ✓ committed news: publish {date}")
-
-    publish(dest, plan,
-            allow_overwrite_keys=("news/index.html",),  # rolling archive page
-            redeploy=args.redeploy,
-            invalidate_paths=[f"/news/{date}/*", "/news/index.html"],
-            commit=args.commit)
+        tracing.record("site git commit", "git", git_t0, time.time())
 
     if not args.commit:
         print("Re-run with --commit to deploy.")
         return 0
 
+    print(f"⬆️  Uploading to s3://{dest.bucket}/ ...")
+    with tracing.span(f"upload news/{date} ({len(assets)} objects)", "s3",
+                      bytes=sum(a.path.stat().st_size for a in assets)):
+        site_assets.upload(dest, assets)
+
+    # The hashed QR never needs invalidating, but /news/<date>/* is one path
+    # either way.
+    invalidate_paths = [f"/news/{date}/*", "/news/index.html", "/news/archive.json", "/news/feed.json"]
+    if args.defer_invalidation:
+        invalidations.enqueue(work_dir, DESTINATION, invalidate_paths)
+    else:
+        invalidations.invalidate_now(DESTINATION, invalidate_paths)
+
     print()
     print(f"🎉 Published https://sixwandsstudios.com/news/{date}/")
     return 0
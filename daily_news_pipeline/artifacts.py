@@ -0,0 +1,85 @@
+"""
+In-process cache for what the steps hand each other: JSON artifacts in
+work/<date>/ (feeds, chosen, script*, bundle*), the YAML configs and the
+Lexicon stores.
+
+A step run on its own reads everything from disk once, exactly as before.
+Under run.py (all steps in one process) step 2's `write_json(script.json)`
+is step 2b's `read_json(script.json)` without a re-read, llm.yaml is parsed
+once for steps 1, 2 and 2b×2, and the Lexicon step 2 saved is the one step 3
+attaches audio to.
+
+Files are still the source of truth: a cached JSON object is only returned
+while the file's mtime and size are the ones it was read or written with,
+so an edit between steps (or another process) is picked up. read_json and
+load_yaml hand out deep copies and write_json keeps its own, so a step can
+change what it read (2b fills glosses in, 3_synthesize --tts overrides a
+key) without touching the cached object — changes reach the next step only
+through write_json.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+_json: dict[Path, tuple[tuple[int, int], Any]] = {}
+_yaml: dict[Path, tuple[tuple[int, int], Any]] = {}
+_lexicons: dict[str, Any] = {}
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def read_json(path: Path) -> Any:
+    """A JSON artifact, parsed once per (mtime, size); the caller's own copy."""
+    path = path.resolve()
+    stamp = _stamp(path)
+    hit = _json.get(path)
+    if hit is None or hit[0] != stamp:
+        hit = (stamp, json.loads(path.read_text(encoding="utf-8")))
+        _json[path] = hit
+    return copy.deepcopy(hit[1])
+
+
+def write_json(path: Path, data: Any, indent: int = 2) -> None:
+    """Write `data` the way every step does (UTF-8, indented, trailing
+    newline) and keep it for the next read_json of `path`."""
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=indent) + "\n", encoding="utf-8")
+    path = path.resolve()
+    _json[path] = (_stamp(path), copy.deepcopy(data))
+
+
+def load_yaml(path: Path) -> dict:
+    """A YAML config (`{}` for an empty file), parsed once per process."""
+    path = path.resolve()
+    stamp = _stamp(path)
+    hit = _yaml.get(path)
+    if hit is None or hit[0] != stamp:
+        hit = (stamp, yaml.safe_load(path.read_text(encoding="utf-8")) or {})
+        _yaml[path] = hit
+    return copy.deepcopy(hit[1])
+
+
+def lexicon(ed: str):
+    """The edition's shared Lexicon store (ko → ko-en, en → en-ko), loaded
+    once per process. Steps still save() it when they're done with it."""
+    pair = "ko-en" if ed == "ko" else "en-ko"
+    if pair not in _lexicons:
+        from lexicon import Lexicon
+        _lexicons[pair] = Lexicon.load() if ed == "ko" else Lexicon.load(pair="en-ko")
+    return _lexicons[pair]
+
+
+def clear() -> None:
+    """Forget everything (run.py, after a failed step: its in-memory objects
+    may be half-updated)."""
+    _json.clear()
+    _yaml.clear()
+    _lexicons.clear()
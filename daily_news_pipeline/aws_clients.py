@@ -0,0 +1,22 @@
+"""
+The repo's shared boto3 client factory (bundle_pipeline/aws_clients.py),
+importable as a sibling like every other helper here: the steps import
+only their siblings, so this puts the repo root on sys.path once and
+re-exports the factory.
+
+    s3 = aws_clients.client("s3")
+    ses = aws_clients.client("ses", "us-east-1")
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from bundle_pipeline.aws_clients import MAX_POOL_CONNECTIONS, clear, client  # noqa: E402
+
+__all__ = ["MAX_POOL_CONNECTIONS", "clear", "client"]
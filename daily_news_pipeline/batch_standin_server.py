@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Anthropic Message Batches and OpenAI Batch APIs, so
+`chat_batch` (and 2b --batch / translate_bundle --batch) can be exercised
+offline without spending anything.
+
+Implements just what llm_providers uses:
+    Anthropic: POST /v1/messages/batches, GET /v1/messages/batches/<id>,
+               GET /v1/messages/batches/<id>/results, POST /v1/messages
+    OpenAI:    POST /v1/files, GET /v1/files/<id>/content,
+               POST /v1/batches, GET /v1/batches/<id>, POST /v1/chat/completions
+(non-streaming only).
+
+Jobs report in_progress for --delay seconds, then end. Replies are stubs
+shaped after this repo's batch prompts: a numbered-sentence prompt (2b) gets
+a JSON array with one "[stub] <sentence>" per line, a "[i] text" line list
+(translate_bundle) gets [{"line": i, "translation": "[stub] text"}, ...],
+anything else gets {"stub": true}. --fail-every N errors every Nth request,
+to exercise the callers' realtime fallback.
+
+Usage:
+    python batch_standin_server.py [--port 8765] [--delay 3] [--fail-every 0]
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stub \\
+        python 2b_translate_easy.py --date 2026-10-01 --force --batch
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import email.parser
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_NUMBERED = re.compile(r"^(\d+)\. (.*)$", re.MULTILINE)
+_BRACKETED = re.compile(r"^\[(\d+)\] (.*)$", re.MULTILINE)
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Offline stand-in for provider batch APIs")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--delay", type=float, default=3.0,
+                   help="seconds a job stays in_progress before it ends")
+    p.add_argument("--fail-every", type=int, default=0,
+                   help="error every Nth request (0 = never)")
+    return p.parse_args()
+
+
+def stub_reply(prompt: str) -> str:
+    if "Lines:" in prompt:
+        lines = _BRACKETED.findall(prompt.split("Lines:", 1)[1])
+        return json.dumps([{"line": int(i), "translation": f"[stub] {t}"} for i, t in lines],
+                          ensure_ascii=False)
+    sentences = _NUMBERED.findall(prompt)
+    if sentences:
+        return json.dumps([f"[stub] {t}" for _, t in sentences], ensure_ascii=False)
+    return json.dumps({"stub": True})
+
+
+def prompt_of(messages: list[dict]) -> str:
+    content = messages[-1]["content"]
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content)
+
+
+class Store:
+    """All jobs and files, in memory."""
+
+    def __init__(self, delay: float, fail_every: int) -> None:
+        self.delay = delay
+        self.fail_every = fail_every
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.seen = itertools.count(1)
+        self.jobs: dict[str, dict] = {}
+        self.files: dict[str, bytes] = {}
+
+    def new_id(self, prefix: str) -> str:
+        with self.lock:
+            return f"{prefix}_stub{next(self.ids):04d}"
+
+    def fails(self) -> bool:
+        with self.lock:
+            n = next(self.seen)
+        return bool(self.fail_every) and n % self.fail_every == 0
+
+    def ended(self, job: dict) -> bool:
+        return time.time() - job["created"] >= self.delay
+
+
+STORE: Store | None = None
+
+
+def _iso(t: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+
+
+# ─── Anthropic ────────────────────────────────────────────────────────────────
+
+
+def anthropic_message(params: dict, msg_id: str) -> dict:
+    prompt = prompt_of(params["messages"])
+    text = stub_reply(prompt)
+    return {
+        "id": msg_id, "type": "message", "role": "assistant",
+        "model": params["model"], "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn", "stop_sequence": None,
+        "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4,
+                  "cache_read_input_tokens": 0, "cache_creation_input_tokens": 0},
+    }
+
+
+def anthropic_result(req: dict) -> dict:
+    if STORE.fails():
+        return {"custom_id": req["custom_id"], "result": {
+            "type": "errored",
+            "error": {"type": "error", "error": {"type": "api_error", "message": "stub failure"}}}}
+    return {"custom_id": req["custom_id"], "result": {
+        "type": "succeeded", "message": anthropic_message(req["params"], f"msg_{req['custom_id']}")}}
+
+
+def anthropic_batch(job: dict, base: str) -> dict:
+    ended = STORE.ended(job)
+    counts = {"processing": 0 if ended else len(job["requests"]),
+              "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+    if ended:
+        for r in job["results"]:
+            counts[r["result"]["type"]] += 1
+    return {
+        "id": job["id"], "type": "message_batch",
+        "processing_status": "ended" if ended else "in_progress",
+        "request_counts": counts,
+        "created_at": _iso(job["created"]), "expires_at": _iso(job["created"] + 86400),
+        "ended_at": _iso(job["created"] + STORE.delay) if ended else None,
+        "archived_at": None, "cancel_initiated_at": None,
+        "results_url": f"{base}/v1/messages/batches/{job['id']}/results" if ended else None,
+    }
+
+
+# ─── OpenAI ───────────────────────────────────────────────────────────────────
+
+
+def openai_completion(body: dict, completion_id: str) -> dict:
+    prompt = prompt_of(body["messages"])
+    text = stub_reply(prompt)
+    return {
+        "id": completion_id, "object": "chat.completion",
+        "created": int(time.time()), "model": body["model"],
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": text}}],
+        "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(text) // 4,
+                  "total_tokens": (len(prompt) + len(text)) // 4,
+                  "prompt_tokens_details": {"cached_tokens": 0}},
+    }
+
+
+def openai_row(req: dict) -> tuple[dict, bool]:
+    """(output line, ok?) for one input line."""
+    if STORE.fails():
+        return {"id": f"batch_req_{req['custom_id']}", "custom_id": req["custom_id"],
+                "response": {"status_code": 500, "request_id": "stub",
+                             "body": {"error": {"message": "stub failure", "type": "server_error"}}},
+                "error": None}, False
+    completion = openai_completion(req["body"], f"chatcmpl-{req['custom_id']}")
+    return {"id": f"batch_req_{req['custom_id']}", "custom_id": req["custom_id"],
+            "response": {"status_code": 200, "request_id": "stub", "body": completion},
+            "error": None}, True
+
+
+def openai_batch(job: dict) -> dict:
+    ended = STORE.ended(job)
+    if ended and "output_file_id" not in job:
+        ok, failed = [], []
+        for line in job["rows"]:
+            row, good = openai_row(line)
+            (ok if good else failed).append(json.dumps(row, ensure_ascii=False))
+        for key, rows in (("output_file_id", ok), ("error_file_id", failed)):
+            job[key] = None
+            if rows:
+                job[key] = STORE.new_id("file")
+                STORE.files[job[key]] = ("\n".join(rows) + "\n").encode("utf-8")
+        job["counts"] = {"total": len(job["rows"]), "completed": len(ok), "failed": len(failed)}
+    return {
+        "id": job["id"], "object": "batch", "endpoint": job["endpoint"],
+        "input_file_id": job["input_file_id"], "completion_window": "24h",
+        "status": "completed" if ended else "in_progress",
+        "created_at": int(job["created"]),
+        "output_file_id": job.get("output_file_id"), "error_file_id": job.get("error_file_id"),
+        "request_counts": job.get("counts") or {"total": len(job["rows"]), "completed": 0, "failed": 0},
+    }
+
+
+def multipart_file(content_type: str, body: bytes) -> bytes:
+    msg = email.parser.BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+    for part in msg.get_payload():
+        if part.get_param("name", header="content-disposition") == "file":
+            return part.get_payload(decode=True)
+    raise ValueError("no `file` field in upload")
+
+
+# ─── HTTP ─────────────────────────────────────────────────────────────────────
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _send(self, status: int, payload, content_type: str = "application/json") -> None:
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self) -> None:
+        self._send(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+
+    def _base(self) -> str:
+        return f"http://{self.headers.get('Host')}"
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_POST(self) -> None:
+        path = self.path.split("?")[0]
+        # Realtime endpoints too, for the callers' fallback on failed batch items.
+        if path == "/v1/messages":
+            return self._send(200, anthropic_message(json.loads(self._body()), STORE.new_id("msg")))
+        if path == "/v1/chat/completions":
+            return self._send(200, openai_completion(json.loads(self._body()), STORE.new_id("chatcmpl")))
+        if path == "/v1/messages/batches":
+            req = json.loads(self._body())
+            job = {"id": STORE.new_id("msgbatch"), "created": time.time(),
+                   "requests": req["requests"]}
+            job["results"] = [anthropic_result(r) for r in req["requests"]]
+            STORE.jobs[job["id"]] = job
+            print(f"📦 anthropic batch {job['id']}: {len(job['requests'])} requests")
+            self._send(200, anthropic_batch(job, self._base()))
+        elif path == "/v1/files":
+            data = multipart_file(self.headers["Content-Type"], self._body())
+            file_id = STORE.new_id("file")
+            STORE.files[file_id] = data
+            self._send(200, {"id": file_id, "object": "file", "bytes": len(data),
+                             "created_at": int(time.time()), "filename": "batch.jsonl",
+                             "purpose": "batch", "status": "processed"})
+        elif path == "/v1/batches":
+            req = json.loads(self._body())
+            data = STORE.files.get(req["input_file_id"])
+            if data is None:
+                return self._not_found()
+            rows = [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+            job = {"id": STORE.new_id("batch"), "created": time.time(), "rows": rows,
+                   "endpoint": req["endpoint"], "input_file_id": req["input_file_id"]}
+            STORE.jobs[job["id"]] = job
+            print(f"📦 openai batch {job['id']}: {len(rows)} requests")
+            self._send(200, openai_batch(job))
+        else:
+            self._not_found()
+
+    def do_GET(self) -> None:
+        parts = self.path.split("?")[0].strip("/").split("/")
+        if parts[:3] == ["v1", "messages", "batches"] and len(parts) in (4, 5):
+            job = STORE.jobs.get(parts[3])
+            if job is None:
+                return self._not_found()
+            if len(parts) == 4:
+                return self._send(200, anthropic_batch(job, self._base()))
+            if parts[4] == "results" and STORE.ended(job):
+                lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in job["results"])
+                return self._send(200, lines.encode("utf-8"), "application/x-jsonl")
+        elif parts[:2] == ["v1", "batches"] and len(parts) == 3:
+            job = STORE.jobs.get(parts[2])
+            if job is not None:
+                return self._send(200, openai_batch(job))
+        elif parts[:2] == ["v1", "files"] and len(parts) == 4 and parts[3] == "content":
+            data = STORE.files.get(parts[2])
+            if data is not None:
+                return self._send(200, data, "application/octet-stream")
+        self._not_found()
+
+    def log_message(self, fmt: str, *args) -> None:
+        pass  # one line per job is plenty; polling would flood the console
+
+
+def make_server(host: str, port: int, delay: float, fail_every: int) -> ThreadingHTTPServer:
+    """A server with a fresh Store; port 0 picks a free one (tests)."""
+    global STORE
+    STORE = Store(delay, fail_every)
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main() -> int:
+    args = parse_args()
+    server = make_server(args.host, args.port, args.delay, args.fail_every)
+    print(f"🧪 batch stand-in on http://{args.host}:{args.port} "
+          f"(delay={args.delay}s, fail_every={args.fail_every or 'never'})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
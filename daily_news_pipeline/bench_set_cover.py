@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: naive vs indexed greedy set cover (set_cover.py) on synthetic
+example libraries.
+
+The naive side is the loop apply_library_reuse used to run — rescan every
+candidate per pick, `ex in picks` list membership (dict equality), set
+intersections. Each query is one day's vocab (10 terms, Zipf-ish so common
+words recur) against the whole library, up to 12 picks. Both sides must make
+identical picks; the script exits non-zero if they ever differ.
+
+Usage:
+    python bench_set_cover.py                     # 10k and 100k examples
+    python bench_set_cover.py --sizes 1000,10000 --queries 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import time
+
+from set_cover import ExampleIndex
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Benchmark greedy example set cover")
+    p.add_argument("--sizes", default="10000,100000", help="comma-separated library sizes")
+    p.add_argument("--vocab", type=int, default=5000, help="distinct terms in the library")
+    p.add_argument("--queries", type=int, default=20, help="days (vocab lists) per size")
+    p.add_argument("--seed", type=int, default=7)
+    return p.parse_args()
+
+
+def make_library(n: int, vocab: list[str], rng: random.Random) -> list[dict]:
+    cum = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+    return [{"ko": f"예문 {i}", "en": f"example {i}",
+             "vocab_covered": sorted(set(rng.choices(vocab, cum_weights=cum, k=rng.randint(1, 4))))}
+            for i in range(n)]
+
+
+def naive_cover(candidates: list[dict], day: list[str], max_picks: int) -> tuple[list[dict], set[str]]:
+    remaining = set(day)
+    picks: list[dict] = []
+    while remaining and len(picks) < max_picks:
+        best = None
+        best_n = 0
+        for ex in candidates:
+            if ex in picks:
+                continue
+            n = len(set(ex["vocab_covered"]) & remaining)
+            if n > best_n:
+                best = ex
+                best_n = n
+        if not best:
+            break
+        picks.append(best)
+        remaining -= set(best["vocab_covered"])
+    return picks, remaining
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    vocab = [f"단어{i}" for i in range(args.vocab)]
+    print(f"{'examples':>9} {'build ms':>9} {'naive ms/q':>11} {'indexed ms/q':>13} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        library = make_library(size, vocab, rng)
+        days = [rng.sample(vocab[:500], 6) + rng.sample(vocab, 4) for _ in range(args.queries)]
+
+        t0 = time.perf_counter()
+        index = ExampleIndex()
+        for ex in library:
+            index.add(ex["vocab_covered"])
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        naive = [naive_cover(library, day, 12) for day in days]
+        naive_ms = (time.perf_counter() - t0) * 1000 / len(days)
+
+        t0 = time.perf_counter()
+        indexed = [index.cover(day, day, 12) for day in days]
+        indexed_ms = (time.perf_counter() - t0) * 1000 / len(days)
+
+        for day, (n_picks, n_left), (i_picks, i_left) in zip(days, naive, indexed):
+            if [library[i] for i in i_picks] != n_picks or i_left != n_left:
+                print(f"❌ picks differ for {day}")
+                return 1
+        print(f"{size:>9} {build_ms:>9.1f} {naive_ms:>11.2f} {indexed_ms:>13.3f} "
+              f"{naive_ms / indexed_ms:>7.0f}×")
+    print("✅ identical picks on every query")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+Per-story checkpoints, so a re-run after a failure redoes only the
+(story, stage) pairs that didn't finish:
+
+    work/<date>/checkpoints/<ed>/<story_id>.<stage>.json
+
+Stages:
+    generated   step 2 LLM half (script → QA → verbatim gate): {"data", "qa_changes"},
+                or null when the copyright gate dropped the story
+    scripted    step 2 library half: the story as it went into script.json.
+                Written only once the Lexicon holding its vocab / examples
+                has been saved (defer + flush), so reusing it never skips a
+                library write
+    translated  step 2b: the easy-summary gloss sentences
+
+Each record carries a key — a hash of everything the stage's output depends
+on (the prompt text and models for the LLM stages, the generated data for
+`scripted`). A checkpoint is used only when the key still matches, so a new
+chosen.json, a prompt change or a different model recomputes the story.
+
+Step 3 has no checkpoint of its own: voicebox's content-addressed TTS cache
+already makes a re-run pay only for the turns that weren't synthesized.
+
+Usage (see 2_generate_script.generate_story):
+    cp = Checkpoints(work_dir, "ko")
+    hit = cp.get("generated", story_id, key)
+    if hit is not None:
+        return hit["result"]
+    ...
+    cp.put("generated", story_id, key, result)
+    recorder.extra["checkpoints"] = cp.report()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+STAGES = ("generated", "scripted", "translated")
+
+
+def fingerprint(*parts: Any) -> str:
+    blob = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class Checkpoints:
+    """One edition's checkpoints for one step run, plus what this run
+    reused and computed. `enabled=False` (--fresh / --force) ignores the
+    existing ones but still writes new ones."""
+
+    def __init__(self, work_dir: Path, ed: str, enabled: bool = True) -> None:
+        self.dir = work_dir / "checkpoints" / ed
+        self.ed = ed
+        self.enabled = enabled
+        self.reused: dict[str, list[str]] = {}
+        self.computed: dict[str, list[str]] = {}
+        self._pending: list[tuple[str, str, str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _path(self, stage: str, story_id: str) -> Path:
+        if stage not in STAGES:
+            raise ValueError(f"unknown checkpoint stage {stage!r}; choose from {STAGES}")
+        return self.dir / f"{story_id}.{stage}.json"
+
+    def get(self, stage: str, story_id: str, key: str) -> dict | None:
+        """The stored record ({"key", "at", "result"}) if it matches `key`;
+        counts as reused."""
+        path = self._path(stage, story_id)
+        if not self.enabled or not path.exists():
+            return None
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return None
+        if record.get("key") != key:
+            return None
+        with self._lock:
+            self.reused.setdefault(stage, []).append(story_id)
+        return record
+
+    def put(self, stage: str, story_id: str, key: str, result: Any) -> None:
+        path = self._path(stage, story_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"stage": stage, "story_id": story_id, "key": key,
+                  "at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "result": result}
+        # Write-then-rename: a crash mid-write never leaves a checkpoint
+        # that parses but is truncated.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(record, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+        with self._lock:
+            self.computed.setdefault(stage, []).append(story_id)
+
+    def defer(self, stage: str, story_id: str, key: str, result: Any) -> None:
+        """put() once flush() is called (after the state the checkpoint
+        assumes — the saved Lexicon — is on disk)."""
+        with self._lock:
+            self._pending.append((stage, story_id, key, result))
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for stage, story_id, key, result in pending:
+            self.put(stage, story_id, key, result)
+
+    def report(self) -> dict[str, Any]:
+        """For the step's cost report `extra` (and the run log)."""
+        return {"edition": self.ed,
+                "reused": {s: sorted(ids) for s, ids in self.reused.items()},
+                "computed": {s: sorted(ids) for s, ids in self.computed.items()}}
+
+    def summary(self) -> str:
+        parts = [f"{stage} {len(self.reused.get(stage, []))} reused / "
+                 f"{len(self.computed.get(stage, []))} computed"
+                 for stage in STAGES if stage in self.reused or stage in self.computed]
+        return f"♻️  [{self.ed}] Checkpoints: " + ("; ".join(parts) if parts else "none used")
+
+
+def run_report(work_dir: Path) -> list[str]:
+    """One line per step report in work/<date>/costs/ that reused
+    checkpoints — what run.py prints after the finalize."""
+    costs_dir = work_dir / "costs"
+    lines = []
+    for f in sorted(costs_dir.glob("*.json")) if costs_dir.exists() else []:
+        report = json.loads(f.read_text(encoding="utf-8")).get("extra", {}).get("checkpoints")
+        if not report or not report.get("reused"):
+            continue
+        reused = "; ".join(f"{stage} {', '.join(ids)}" for stage, ids in report["reused"].items())
+        lines.append(f"{f.stem}: reused {reused}")
+    return lines
@@ -1,48 +1,136 @@
 #!/usr/bin/env python3
 """
-Print the aggregated daily cost ledger from cache/cost_history/YYYY/MM/*.json.
+Query the cost ledger (cache/cost_ledger.sqlite, see cost_ledger.py).
 (Formerly the `cost-history` subcommand of library_inspect.py — vocab
 inspection moved to the langpack `lexicon` CLI.)
 
 Usage:
-    python cost_history.py [--since YYYY-MM-DD]
+    python cost_history.py [--since YYYY-MM-DD | --days N]      # totals per run
+    python cost_history.py by story,model --days 90              # cost per story by model
+    python cost_history.py by model --kind llm --days 30
+    python cost_history.py cache-trend [--kind tts] [--period week] --days 90
+    python cost_history.py import                                # backfill from work/ + cache/cost_history/
+
+`by` dimensions: day, month, step, edition, kind, provider, model, tier,
+story, lang (comma-separated). When `story` isn't one of them, a $/story
+column divides the group's cost by the distinct stories it touched.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
-from datetime import date as _date
+import time
+from datetime import date as _date, timedelta
 from pathlib import Path
 
+from cost_ledger import DIMENSIONS, LEDGER_NAME, CostLedger
+
 HERE = Path(__file__).resolve().parent
-HISTORY_ROOT = HERE / "cache" / "cost_history"
+CACHE_ROOT = HERE / "cache"
+WORK_ROOT = HERE / "work"
+HISTORY_ROOT = CACHE_ROOT / "cost_history"
+
+
+def cmd_runs(ledger: CostLedger, since: str | None) -> None:
+    rows = ledger.runs(since)
+    grand_total = 0.0
+    print(f"{'Date / finalized':32s}  {'LLM':10s}  {'TTS':10s}  {'Total':10s}")
+    print("-" * 68)
+    for r in rows:
+        grand_total += r["total_cost_usd"]
+        print(f"{r['date'] + '  ' + r['finalized_at'][11:19]:32s}  ${r['llm_cost_usd']:9.4f}  "
+              f"${r['tts_cost_usd']:9.4f}  ${r['total_cost_usd']:9.4f}")
+    print("-" * 68)
+    print(f"{'GRAND TOTAL':32s}  {'':10s}  {'':10s}  ${grand_total:9.4f}")
+    print(f"\n{len(rows)} run(s) recorded in {ledger.path}")
+
+
+def cmd_by(ledger: CostLedger, dims: list[str], since: str | None, kind: str | None) -> None:
+    try:
+        rows = ledger.breakdown(dims, since, kind)
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    per_story = "story" not in dims
+    widths = [max([len(d)] + [len(str(r[d])) for r in rows]) for d in dims]
+    header = "  ".join(f"{d:{w}s}" for d, w in zip(dims, widths))
+    header += f"  {'calls':>7s}  {'hit%':>5s}  {'in tok':>10s}  {'out tok':>9s}  {'chars':>9s}  {'avg ms':>7s}  {'cost':>10s}"
+    if per_story:
+        header += f"  {'stories':>7s}  {'$/story':>8s}"
+    print(header)
+    print("-" * len(header))
+    total = 0.0
+    for r in rows:
+        total += r["cost_usd"]
+        line = "  ".join(f"{str(r[d]):{w}s}" for d, w in zip(dims, widths))
+        line += (f"  {r['calls']:7d}  {100 * r['cache_hits'] / r['calls']:5.1f}  {r['input_tokens']:10d}  "
+                 f"{r['output_tokens']:9d}  {r['chars_debited']:9d}  "
+                 f"{format(r['avg_ms'], '7.0f') if r['avg_ms'] is not None else '-':>7s}  ${r['cost_usd']:9.4f}")
+        if per_story:
+            line += (f"  {r['stories']:7d}  ${r['cost_usd'] / r['stories']:7.4f}" if r["stories"]
+                     else f"  {0:7d}  {'-':>8s}")
+        print(line)
+    print("-" * len(header))
+    print(f"{len(rows)} group(s), ${total:.4f} total")
+
+
+def cmd_cache_trend(ledger: CostLedger, kind: str, since: str | None, period: str) -> None:
+    rows = ledger.cache_trend(kind, since, period)
+    print(f"{period:10s}  {'calls':>7s}  {'hits':>7s}  {'hit rate':>8s}  {'cost':>10s}")
+    print("-" * 50)
+    for r in rows:
+        bar = "█" * round(r["hit_rate"] * 20)
+        print(f"{r['period']:10s}  {r['calls']:7d}  {r['cache_hits']:7d}  {100 * r['hit_rate']:7.1f}%  "
+              f"${r['cost_usd']:9.4f}  {bar}")
+
+
+def cmd_import(ledger: CostLedger) -> None:
+    """Backfill: every work/<date>/costs/ report and cache/cost_history/ summary
+    not already in the ledger."""
+    rows = 0
+    dates = sorted(d for d in WORK_ROOT.iterdir() if (d / "costs").is_dir()) if WORK_ROOT.exists() else []
+    for d in dates:
+        rows += ledger.ingest_work_dir(d, d.name)
+    summaries = sorted(HISTORY_ROOT.glob("*/*/*.json"))
+    for f in summaries:
+        s = json.loads(f.read_text(encoding="utf-8"))
+        ledger.add_run(s["date"], s.get("finalized_at") or f.stem, s.get("totals", {}))
+    print(f"✅ Imported {rows} call row(s) from {len(dates)} work dir(s), "
+          f"{len(summaries)} run summary file(s) → {ledger.path}")
 
 
 def main() -> int:
-    p = argparse.ArgumentParser(description="Aggregated daily cost ledger")
-    p.add_argument("--since", help="YYYY-MM-DD (inclusive)")
+    # --since / --days work before or after the subcommand.
+    common = argparse.ArgumentParser(add_help=False)
+    window = common.add_mutually_exclusive_group()
+    window.add_argument("--since", default=argparse.SUPPRESS, help="YYYY-MM-DD (inclusive)")
+    window.add_argument("--days", type=int, default=argparse.SUPPRESS, help="Only the last N days")
+    p = argparse.ArgumentParser(description="Cost ledger queries", parents=[common])
+    sub = p.add_subparsers(dest="cmd")
+    by = sub.add_parser("by", parents=[common], help="Cost breakdown grouped by dimensions")
+    by.add_argument("dims", help=f"Comma-separated: {', '.join(DIMENSIONS)}")
+    by.add_argument("--kind", choices=["llm", "tts"])
+    trend = sub.add_parser("cache-trend", parents=[common], help="Cache hit rate over time")
+    trend.add_argument("--kind", choices=["llm", "tts"], default="tts")
+    trend.add_argument("--period", choices=["day", "week", "month"], default="day")
+    sub.add_parser("import", help="Backfill the ledger from work/ and cache/cost_history/")
     args = p.parse_args()
 
-    files = sorted(HISTORY_ROOT.glob("*/*/*.json"))
-    if args.since:
-        cutoff = _date.fromisoformat(args.since)
-        files = [f for f in files if _date.fromisoformat(f.name[:10]) >= cutoff]
+    since = getattr(args, "since", None)
+    if getattr(args, "days", None):
+        since = (_date.today() - timedelta(days=args.days - 1)).isoformat()
 
-    grand_total = 0.0
-    print(f"{'Date / time':22s}  {'LLM':10s}  {'TTS':10s}  {'Total':10s}")
-    print("-" * 55)
-    for f in files:
-        d = json.loads(f.read_text(encoding="utf-8"))
-        t = d.get("totals", {})
-        llm = t.get("llm_cost_usd", 0)
-        tts = t.get("tts_cost_usd", 0)
-        total = t.get("estimated_cost_usd", 0)
-        grand_total += total
-        print(f"{f.stem:22s}  ${llm:9.4f}  ${tts:9.4f}  ${total:9.4f}")
-    print("-" * 55)
-    print(f"{'GRAND TOTAL':22s}  {'':10s}  {'':10s}  ${grand_total:9.4f}")
-    print(f"\n{len(files)} run(s) recorded under {HISTORY_ROOT}")
+    t0 = time.perf_counter()
+    with CostLedger(CACHE_ROOT / LEDGER_NAME) as ledger:
+        if args.cmd == "by":
+            cmd_by(ledger, [d.strip() for d in args.dims.split(",") if d.strip()], since, args.kind)
+        elif args.cmd == "cache-trend":
+            cmd_cache_trend(ledger, args.kind, since, args.period)
+        elif args.cmd == "import":
+            cmd_import(ledger)
+        else:
+            cmd_runs(ledger, since)
+    print(f"⏱  {(time.perf_counter() - t0) * 1000:.1f} ms")
     return 0
 
 
@@ -0,0 +1,266 @@
+"""
+Append-only cost ledger: every LLM and TTS call the pipeline records, one
+row each, in cache/cost_ledger.sqlite.
+
+The per-step reports in work/<date>/costs/*.json stay the source of truth
+for a run; `cost_tracker.finalize_run` appends their calls here (and the run
+totals to `runs`). A step report is ingested once — it's keyed by
+(date, step, started_at), so re-finalizing a date only adds the steps that
+actually re-ran, and their calls sit next to the earlier attempt's, the way
+both were billed.
+
+Rows carry the date, step and edition denormalized, and ingest also folds
+them into `daily` — one row per (date, edition, step, provider, model,
+story, lang, cache_hit) with summed tokens / chars / cost / latency, about
+50 rows a day against ~600 calls. The aggregate queries read that, so
+"cost per story by model over 90 days" scans a few thousand narrow rows
+instead of tens of thousands of calls; `calls` keeps the per-call detail.
+
+    ledger = CostLedger(CACHE_ROOT / LEDGER_NAME)
+    ledger.breakdown(["story", "model"], since="2026-03-01")
+    ledger.cache_trend("tts", since="2026-03-01")
+
+Story ids come from call labels ("script:story_3", "tts:story_3"); calls
+without one (curation) have story NULL.
+
+`python cost_history.py import` backfills from existing work/ and
+cache/cost_history/ files.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+LEDGER_NAME = "cost_ledger.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS step_runs (
+    id           INTEGER PRIMARY KEY,
+    date         TEXT NOT NULL,
+    step         TEXT NOT NULL,
+    started_at   TEXT NOT NULL,
+    completed_at TEXT,
+    UNIQUE (date, step, started_at)
+);
+CREATE TABLE IF NOT EXISTS calls (
+    step_run           INTEGER NOT NULL REFERENCES step_runs(id),
+    date               TEXT NOT NULL,
+    step               TEXT NOT NULL,
+    edition            TEXT NOT NULL,
+    kind               TEXT NOT NULL,     -- llm | tts
+    provider           TEXT NOT NULL,
+    model              TEXT,
+    tier               TEXT,              -- tts tier / engine
+    label              TEXT,
+    story              TEXT,
+    lang               TEXT,
+    input_tokens       INTEGER,
+    output_tokens      INTEGER,
+    cache_read_tokens  INTEGER,
+    cache_write_tokens INTEGER,
+    chars              INTEGER,
+    cache_hit          INTEGER NOT NULL,
+    batch              INTEGER NOT NULL DEFAULT 0,
+    ttft_ms            INTEGER,
+    duration_ms        INTEGER,
+    cost_usd           REAL NOT NULL,
+    at                 TEXT
+);
+CREATE INDEX IF NOT EXISTS calls_by_date ON calls (date, kind);
+CREATE TABLE IF NOT EXISTS daily (
+    date               TEXT NOT NULL,
+    edition            TEXT NOT NULL,
+    step               TEXT NOT NULL,
+    kind               TEXT NOT NULL,
+    provider           TEXT NOT NULL,
+    model              TEXT NOT NULL,     -- '' when unknown (same for tier / story / lang)
+    tier               TEXT NOT NULL,
+    story              TEXT NOT NULL,
+    lang               TEXT NOT NULL,
+    cache_hit          INTEGER NOT NULL,
+    calls              INTEGER NOT NULL,
+    input_tokens       INTEGER NOT NULL,
+    output_tokens      INTEGER NOT NULL,
+    chars              INTEGER NOT NULL,
+    cost_usd           REAL NOT NULL,
+    timed_calls        INTEGER NOT NULL,
+    duration_ms        INTEGER NOT NULL,  -- sum over timed_calls
+    PRIMARY KEY (date, edition, step, kind, provider, model, tier, story, lang, cache_hit)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS runs (
+    date           TEXT NOT NULL,
+    finalized_at   TEXT NOT NULL,
+    llm_cost_usd   REAL NOT NULL,
+    tts_cost_usd   REAL NOT NULL,
+    total_cost_usd REAL NOT NULL,
+    PRIMARY KEY (date, finalized_at)
+);
+"""
+
+# Folds one step run's calls into `daily`.
+_ROLLUP = """
+INSERT INTO daily
+SELECT date, edition, step, kind, provider, coalesce(model, ''), coalesce(tier, ''),
+       coalesce(story, ''), coalesce(lang, ''), cache_hit, count(*),
+       coalesce(sum(input_tokens), 0), coalesce(sum(output_tokens), 0), coalesce(sum(chars), 0),
+       sum(cost_usd), count(duration_ms), coalesce(sum(duration_ms), 0)
+FROM calls WHERE step_run = ?
+GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10
+ON CONFLICT (date, edition, step, kind, provider, model, tier, story, lang, cache_hit) DO UPDATE SET
+    calls = calls + excluded.calls,
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens,
+    chars = chars + excluded.chars,
+    cost_usd = cost_usd + excluded.cost_usd,
+    timed_calls = timed_calls + excluded.timed_calls,
+    duration_ms = duration_ms + excluded.duration_ms
+"""
+
+# Grouping dimensions cost_history.py accepts → SQL expression over `daily`.
+DIMENSIONS = {
+    "day": "date",
+    "month": "substr(date, 1, 7)",
+    "step": "step",
+    "edition": "edition",
+    "kind": "kind",
+    "provider": "provider",
+    "model": "provider || '/' || coalesce(nullif(model, ''), nullif(tier, ''), '?')",
+    "tier": "provider || '/' || coalesce(nullif(tier, ''), nullif(model, ''), '?')",
+    "story": "coalesce(nullif(story, ''), '-')",
+    "lang": "coalesce(nullif(lang, ''), '-')",
+}
+
+
+def _edition(step: str) -> str:
+    # Mirrors edition.suffix(): en steps end in "_en", ko (and shared) don't.
+    return "en" if step.endswith("_en") else "ko"
+
+
+def _story(label: str | None) -> str | None:
+    return label.split(":", 1)[1] if label and ":" in label else None
+
+
+def _call_rows(step_run: int, date: str, step: str, payload: dict[str, Any]) -> Iterable[tuple]:
+    edition = _edition(step)
+    for c in payload.get("llm_calls", []):
+        label = c.get("label") or None
+        yield (step_run, date, step, edition, "llm", c["provider"], c["model"], None, label,
+               _story(label), None, c.get("input_tokens"), c.get("output_tokens"),
+               c.get("cache_read_tokens", 0), c.get("cache_write_tokens", 0),
+               c.get("response_chars"), int(bool(c.get("cache_hit"))), int(bool(c.get("batch"))),
+               c.get("ttft_ms"), c.get("duration_ms"), c.get("estimated_cost_usd", 0.0), c.get("at"))
+    for c in payload.get("tts_calls", []):
+        label = c.get("label") or None
+        yield (step_run, date, step, edition, "tts", c["provider"], c.get("model"),
+               c.get("tier_or_engine"), label, _story(label), c.get("lang"), None, None, None, None,
+               c.get("chars"), int(bool(c.get("cache_hit"))), 0, None, c.get("duration_ms"),
+               c.get("estimated_cost_usd", 0.0), None)
+
+
+class CostLedger:
+    """cache/cost_ledger.sqlite. Usable as a context manager (closes on exit)."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "CostLedger":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ─── Writes ──────────────────────────────────────────────────────────────
+
+    def ingest_step(self, date: str, payload: dict[str, Any]) -> int:
+        """Append one step report's calls; returns the number of rows added
+        (0 if this report was ingested before)."""
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT OR IGNORE INTO step_runs (date, step, started_at, completed_at) VALUES (?, ?, ?, ?)",
+                (date, payload["step"], payload.get("started_at") or "", payload.get("completed_at")))
+            if not cur.rowcount:
+                return 0
+            rows = list(_call_rows(cur.lastrowid, date, payload["step"], payload))
+            self.conn.executemany(f"INSERT INTO calls VALUES ({', '.join('?' * 22)})", rows)
+            self.conn.execute(_ROLLUP, (cur.lastrowid,))
+        return len(rows)
+
+    def ingest_work_dir(self, work_dir: Path, date: str) -> int:
+        """ingest_step() for every work/<date>/costs/*.json."""
+        costs_dir = work_dir / "costs"
+        files = sorted(costs_dir.glob("*.json")) if costs_dir.exists() else []
+        return sum(self.ingest_step(date, json.loads(f.read_text(encoding="utf-8"))) for f in files)
+
+    def add_run(self, date: str, finalized_at: str, totals: dict[str, float]) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?, ?)",
+                (date, finalized_at, totals.get("llm_cost_usd", 0.0), totals.get("tts_cost_usd", 0.0),
+                 totals.get("estimated_cost_usd", 0.0)))
+
+    # ─── Queries ─────────────────────────────────────────────────────────────
+
+    def runs(self, since: str | None = None) -> list[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT * FROM runs WHERE date >= ? ORDER BY date, finalized_at", (since or "",)).fetchall()
+
+    def breakdown(self, dims: list[str], since: str | None = None,
+                  kind: str | None = None) -> list[sqlite3.Row]:
+        """Calls, billed tokens / chars, cache hits, cost, mean latency and
+        distinct stories per group of `dims` (keys of DIMENSIONS), costliest
+        first."""
+        unknown = [d for d in dims if d not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"unknown dimension(s) {unknown}; choose from {sorted(DIMENSIONS)}")
+        cols = [f"{DIMENSIONS[d]} AS {d}" for d in dims]
+        group = f"GROUP BY {', '.join(dims)}" if dims else ""
+        where, params = self._where(since, kind)
+        sql = f"""
+            SELECT {', '.join(cols + [''])}
+                   sum(calls) AS calls,
+                   sum(CASE WHEN cache_hit THEN calls ELSE 0 END) AS cache_hits,
+                   sum(CASE WHEN cache_hit THEN 0 ELSE input_tokens END) AS input_tokens,
+                   sum(CASE WHEN cache_hit THEN 0 ELSE output_tokens END) AS output_tokens,
+                   sum(CASE WHEN cache_hit OR kind != 'tts' THEN 0 ELSE chars END) AS chars_debited,
+                   count(DISTINCT CASE WHEN story != '' THEN date || '/' || edition || '/' || story END)
+                       AS stories,
+                   1.0 * sum(duration_ms) / nullif(sum(timed_calls), 0) AS avg_ms,
+                   sum(cost_usd) AS cost_usd
+            FROM daily {where} {group}
+            ORDER BY cost_usd DESC"""
+        return self.conn.execute(sql, params).fetchall()
+
+    def cache_trend(self, kind: str = "tts", since: str | None = None,
+                    period: str = "day") -> list[sqlite3.Row]:
+        """Cache hit rate per day / week / month for one call kind."""
+        bucket = {"day": "date", "week": "strftime('%Y-W%W', date)",
+                  "month": "substr(date, 1, 7)"}[period]
+        where, params = self._where(since, kind)
+        sql = f"""
+            SELECT {bucket} AS period,
+                   sum(calls) AS calls,
+                   sum(CASE WHEN cache_hit THEN calls ELSE 0 END) AS cache_hits,
+                   1.0 * sum(CASE WHEN cache_hit THEN calls ELSE 0 END) / sum(calls) AS hit_rate,
+                   sum(cost_usd) AS cost_usd
+            FROM daily {where}
+            GROUP BY period ORDER BY period"""
+        return self.conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _where(since: str | None, kind: str | None) -> tuple[str, list[str]]:
+        clauses, params = ["date >= ?"], [since or ""]
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        return "WHERE " + " AND ".join(clauses), params
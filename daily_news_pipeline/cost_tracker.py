@@ -3,7 +3,8 @@ Per-step cost recording for the daily news pipeline.
 
 Each step writes its own report to work/<date>/costs/<step>.json. After the
 run completes, `finalize_run` aggregates all step files into a single
-timestamped cost ledger entry under cache/cost_history/YYYY/MM/.
+timestamped summary under cache/cost_history/YYYY/MM/ and appends their
+per-call rows to the queryable ledger (cost_ledger.py, cache/cost_ledger.sqlite).
 
 Estimated cost rates are conservative ballparks — they're for *trend* visibility,
 not invoice reconciliation.
@@ -12,30 +13,47 @@ not invoice reconciliation.
 from __future__ import annotations
 
 import json
+import statistics
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from cost_ledger import LEDGER_NAME, CostLedger
 
 # Approximate USD-per-token / per-char rates. Update as pricing changes.
+# Prompt caching: cache_read = cached prefix tokens (discounted), cache_write =
+# tokens written to the cache (Anthropic 5-min TTL: 1.25× input; OpenAI: free).
+# Missing cache rates fall back to the input rate.
 LLM_PRICING = {
     # Anthropic — per million tokens (sonnet 4.5)
     "anthropic": {
-        "claude-sonnet-4-5":   {"input_per_mtok": 3.00,  "output_per_mtok": 15.00},
-        "claude-opus-4":       {"input_per_mtok": 15.00, "output_per_mtok": 75.00},
-        "claude-haiku-4-5":    {"input_per_mtok": 0.80,  "output_per_mtok": 4.00},
+        "claude-sonnet-4-5":   {"input_per_mtok": 3.00,  "output_per_mtok": 15.00,
+                                "cache_read_per_mtok": 0.30, "cache_write_per_mtok": 3.75},
+        "claude-opus-4":       {"input_per_mtok": 15.00, "output_per_mtok": 75.00,
+                                "cache_read_per_mtok": 1.50, "cache_write_per_mtok": 18.75},
+        "claude-haiku-4-5":    {"input_per_mtok": 0.80,  "output_per_mtok": 4.00,
+                                "cache_read_per_mtok": 0.08, "cache_write_per_mtok": 1.00},
     },
     # OpenAI — per million tokens (Nov 2025 published rates)
     "openai": {
-        "gpt-4o":              {"input_per_mtok": 2.50,  "output_per_mtok": 10.00},
-        "gpt-4o-mini":         {"input_per_mtok": 0.15,  "output_per_mtok": 0.60},
-        "gpt-5":               {"input_per_mtok": 1.25,  "output_per_mtok": 10.00},
-        "gpt-5.5":             {"input_per_mtok": 2.00,  "output_per_mtok": 10.00},  # placeholder; update with official rates
-        "o1":                  {"input_per_mtok": 15.00, "output_per_mtok": 60.00},
+        "gpt-4o":              {"input_per_mtok": 2.50,  "output_per_mtok": 10.00,
+                                "cache_read_per_mtok": 1.25, "cache_write_per_mtok": 0.0},
+        "gpt-4o-mini":         {"input_per_mtok": 0.15,  "output_per_mtok": 0.60,
+                                "cache_read_per_mtok": 0.075, "cache_write_per_mtok": 0.0},
+        "gpt-5":               {"input_per_mtok": 1.25,  "output_per_mtok": 10.00,
+                                "cache_read_per_mtok": 0.125, "cache_write_per_mtok": 0.0},
+        "gpt-5.5":             {"input_per_mtok": 2.00,  "output_per_mtok": 10.00,
+                                "cache_read_per_mtok": 0.20, "cache_write_per_mtok": 0.0},  # placeholder; update with official rates
+        "o1":                  {"input_per_mtok": 15.00, "output_per_mtok": 60.00,
+                                "cache_read_per_mtok": 7.50, "cache_write_per_mtok": 0.0},
     },
 }
 
+# Batch jobs (Anthropic Message Batches, OpenAI Batch API) bill every token
+# class at half the realtime rate.
+BATCH_DISCOUNT = 0.5
+
 TTS_PRICING = {
     "elevenlabs": {
         # Approximate Creator-tier credit cost; Korean multi-byte chars cost
@@ -50,11 +68,17 @@ TTS_PRICING = {
 }
 
 
-def estimate_llm_cost(provider: str, model: str, input_tokens: int, output_tokens: int) -> float:
+def estimate_llm_cost(provider: str, model: str, input_tokens: int, output_tokens: int,
+                      cache_read_tokens: int = 0, cache_write_tokens: int = 0,
+                      batch: bool = False) -> float:
     rates = LLM_PRICING.get(provider, {}).get(model)
     if not rates:
         return 0.0
-    return (input_tokens * rates["input_per_mtok"] + output_tokens * rates["output_per_mtok"]) / 1_000_000
+    read_rate = rates.get("cache_read_per_mtok", rates["input_per_mtok"])
+    write_rate = rates.get("cache_write_per_mtok", rates["input_per_mtok"])
+    cost = (input_tokens * rates["input_per_mtok"] + output_tokens * rates["output_per_mtok"]
+            + cache_read_tokens * read_rate + cache_write_tokens * write_rate) / 1_000_000
+    return cost * BATCH_DISCOUNT if batch else cost
 
 
 def estimate_tts_cost(provider: str, tier_or_engine: str, chars: int, lang: str = "en") -> float:
@@ -67,6 +91,11 @@ def estimate_tts_cost(provider: str, tier_or_engine: str, chars: int, lang: str
     return cost
 
 
+def _median(values) -> float | None:
+    present = [v for v in values if v is not None]
+    return round(statistics.median(present), 1) if present else None
+
+
 @dataclass
 class StepCostRecorder:
     """
@@ -98,15 +127,33 @@ class StepCostRecorder:
         return False
 
     def add_llm_call(self, *, provider: str, model: str, input_tokens: int, output_tokens: int,
-                     label: str = "", response_chars: int | None = None) -> float:
-        cost = estimate_llm_cost(provider, model, input_tokens, output_tokens)
+                     label: str = "", response_chars: int | None = None,
+                     cache_hit: bool = False, cache_read_tokens: int = 0,
+                     cache_write_tokens: int = 0, ttft_ms: int | None = None,
+                     duration_ms: int | None = None, attempts: int = 1,
+                     batch: bool = False) -> float:
+        # Response-cache hits keep the original token counts for reference but cost nothing.
+        cost = 0.0 if cache_hit else estimate_llm_cost(provider, model, input_tokens, output_tokens,
+                                                       cache_read_tokens, cache_write_tokens,
+                                                       batch=batch)
         self.llm_calls.append({
             "label": label,
             "provider": provider,
             "model": model,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            # Streamed calls: time to first token, and generation speed after it.
+            "ttft_ms": ttft_ms,
+            "duration_ms": duration_ms,
+            "output_tokens_per_s": (round(output_tokens / ((duration_ms - ttft_ms) / 1000), 1)
+                                    if ttft_ms is not None and duration_ms and duration_ms > ttft_ms
+                                    else None),
+            "attempts": attempts,
             "response_chars": response_chars,
+            "cache_hit": cache_hit,
+            "batch": batch,
             "estimated_cost_usd": round(cost, 5),
             "at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         })
@@ -114,10 +161,11 @@ class StepCostRecorder:
 
     def add_tts_call(self, *, provider: str, tier_or_engine: str, voice_id: str, voice_label: str,
                      model: str, lang: str, text: str, audio_key: str, cache_hit: bool = False,
-                     duration_ms: int | None = None) -> float:
+                     duration_ms: int | None = None, label: str = "") -> float:
         chars = len(text)
         cost = 0.0 if cache_hit else estimate_tts_cost(provider, tier_or_engine, chars, lang)
         self.tts_calls.append({
+            "label": label,
             "provider": provider,
             "tier_or_engine": tier_or_engine,
             "voice_id": voice_id,
@@ -135,12 +183,20 @@ class StepCostRecorder:
     def totals(self) -> dict:
         llm_total = sum(c["estimated_cost_usd"] for c in self.llm_calls)
         tts_total = sum(c["estimated_cost_usd"] for c in self.tts_calls)
+        llm_billed = [c for c in self.llm_calls if not c.get("cache_hit")]
         cache_hits = sum(1 for c in self.tts_calls if c["cache_hit"])
         cache_misses = sum(1 for c in self.tts_calls if not c["cache_hit"])
         return {
             "llm_calls": len(self.llm_calls),
-            "llm_input_tokens": sum(c["input_tokens"] for c in self.llm_calls),
-            "llm_output_tokens": sum(c["output_tokens"] for c in self.llm_calls),
+            "llm_cache_hits": len(self.llm_calls) - len(llm_billed),
+            "llm_batch_calls": sum(1 for c in llm_billed if c.get("batch")),
+            "llm_input_tokens": sum(c["input_tokens"] for c in llm_billed),
+            "llm_output_tokens": sum(c["output_tokens"] for c in llm_billed),
+            "llm_cache_read_tokens": sum(c.get("cache_read_tokens", 0) for c in llm_billed),
+            "llm_cache_write_tokens": sum(c.get("cache_write_tokens", 0) for c in llm_billed),
+            "llm_ttft_ms_p50": _median(c.get("ttft_ms") for c in llm_billed),
+            "llm_output_tokens_per_s_p50": _median(c.get("output_tokens_per_s") for c in llm_billed),
+            "llm_aborted_streams": sum(c.get("attempts", 1) - 1 for c in llm_billed),
             "llm_cost_usd": round(llm_total, 5),
             "tts_turns": len(self.tts_calls),
             "tts_cache_hits": cache_hits,
@@ -172,8 +228,9 @@ class StepCostRecorder:
 def finalize_run(work_dir: Path, cache_root: Path, date: str) -> Path:
     """
     Aggregate all work/<date>/costs/*.json files into a single timestamped
-    cost ledger entry at cache/cost_history/YYYY/MM/YYYY-MM-DD_HHMMSS.json.
-    Returns the written path.
+    cost ledger entry at cache/cost_history/YYYY/MM/YYYY-MM-DD_HHMMSS.json,
+    and append the steps' calls (those not ingested by an earlier finalize)
+    to cache/cost_ledger.sqlite. Returns the written path.
     """
     costs_dir = work_dir / "costs"
     step_files = sorted(costs_dir.glob("*.json")) if costs_dir.exists() else []
@@ -192,10 +249,16 @@ def finalize_run(work_dir: Path, cache_root: Path, date: str) -> Path:
         tts_total += totals.get("tts_cost_usd", 0.0)
         for c in step.get("llm_calls", []):
             key = f"{c['provider']}/{c['model']}"
-            agg = provider_breakdown.setdefault(key, {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0})
+            agg = provider_breakdown.setdefault(key, {"calls": 0, "cache_hits": 0, "input_tokens": 0, "output_tokens": 0,
+                                                      "cache_read_tokens": 0, "cache_write_tokens": 0, "cost_usd": 0.0})
             agg["calls"] += 1
+            if c.get("cache_hit"):
+                agg["cache_hits"] += 1
+                continue
             agg["input_tokens"] += c["input_tokens"]
             agg["output_tokens"] += c["output_tokens"]
+            agg["cache_read_tokens"] += c.get("cache_read_tokens", 0)
+            agg["cache_write_tokens"] += c.get("cache_write_tokens", 0)
             agg["cost_usd"] += c["estimated_cost_usd"]
         for c in step.get("tts_calls", []):
             key = f"{c['provider']}/{c['tier_or_engine']}"
@@ -217,9 +280,10 @@ def finalize_run(work_dir: Path, cache_root: Path, date: str) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"{date}_{ts}.json"
 
+    finalized_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     payload = {
         "date": date,
-        "finalized_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "finalized_at": finalized_at,
         "totals": {
             "estimated_cost_usd": round(grand_total, 5),
             "llm_cost_usd": round(llm_total, 5),
@@ -229,4 +293,9 @@ def finalize_run(work_dir: Path, cache_root: Path, date: str) -> Path:
         "steps": {k: v.get("totals", {}) for k, v in steps_data.items()},
     }
     out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    with CostLedger(cache_root / LEDGER_NAME) as ledger:
+        for step in steps_data.values():
+            ledger.ingest_step(date, step)
+        ledger.add_run(date, finalized_at, payload["totals"])
     return out_path
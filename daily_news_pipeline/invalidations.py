@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Batched CloudFront invalidations: one invalidation per distribution per run
+instead of one per publish() call.
+
+A daily run used to invalidate five times — each edition's
+/lmaudio/<pack>/bundle.json, the news_latest and news_en_latest aliases,
+then step 6's /news/<date>/* + /news/index.html — each counted against the
+invalidation quota and each propagating on its own. With
+`--defer-invalidation` (run.py passes it to steps 5 and 6) the steps publish
+with no invalidate_paths and enqueue the paths instead:
+
+    work/<date>/invalidations.json
+        {"pending":   {"<destination>": ["/path", ...]},
+         "submitted": [{"distribution", "destinations", "id", "paths",
+                        "submitted_at", "status", "propagation_s"}]}
+
+`flush(work_dir)` — run.py's last step, run even when an earlier step failed
+so whatever was published still gets invalidated — groups the pending paths
+by the CloudFront distribution serving each destination's public host,
+drops paths a wildcard in the same batch already covers, submits one
+invalidation per distribution, then polls until they're Completed and
+reports the propagation time. Paths stay pending until their invalidation
+is accepted, so a failed flush is retried by the next one. A step run on its
+own calls `invalidate_now(destination, paths)` instead, which leaves the
+queue alone:
+
+    python invalidations.py --date 2026-07-21          # flush what's pending
+    python invalidations.py --date 2026-07-21 --no-wait
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import fnmatch
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import aws_clients
+import tracing
+
+HERE = Path(__file__).resolve().parent
+WORK_ROOT = HERE / "work"
+QUEUE_NAME = "invalidations.json"
+
+POLL_SECONDS = 10
+WAIT_TIMEOUT_SECONDS = 20 * 60
+
+# Step 5 --all-editions enqueues from two threads.
+_lock = threading.Lock()
+
+
+def _load(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {"pending": {}, "submitted": []}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save(path: Path, queue: dict[str, Any]) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(queue, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def enqueue(work_dir: Path, destination: str, paths: list[str]) -> None:
+    """Queue `paths` on `destination` (a publisher destination name) for
+    this run's batched invalidation."""
+    path = work_dir / QUEUE_NAME
+    with _lock:
+        queue = _load(path)
+        queued = queue["pending"].setdefault(destination, [])
+        queued += [p for p in paths if p not in queued]
+        _save(path, queue)
+    print(f"🌀 Queued CloudFront invalidation of {', '.join(paths)} (batched at end of run)")
+
+
+def invalidate_now(destination: str, paths: list[str]) -> str:
+    """Submit `paths` on `destination` as one invalidation right away,
+    bypassing the queue (steps run without --defer-invalidation). Returns
+    the invalidation id; doesn't wait for it."""
+    cf = aws_clients.client("cloudfront")
+    with tracing.span(f"resolve distribution ({destination})", "http"):
+        dist = distribution_id(cf, destination)
+    paths = collapse(paths)
+    resp = _submit(cf, dist, paths, f"{destination}-{time.time():.0f}")
+    print(f"🌀 Invalidation {resp['Id']} on {dist} ({destination}): {', '.join(paths)}")
+    return resp["Id"]
+
+
+def pending(work_dir: Path) -> dict[str, list[str]]:
+    return _load(work_dir / QUEUE_NAME)["pending"]
+
+
+def collapse(paths: list[str]) -> list[str]:
+    """Unique paths minus those a wildcard path in the list already covers
+    (CloudFront bills per path; /news/<date>/* makes /news/<date>/qr.png
+    redundant)."""
+    unique = list(dict.fromkeys(paths))
+    wildcards = [p for p in unique if p.endswith("*")]
+    return [p for p in unique
+            if not any(w != p and fnmatch.fnmatchcase(p, w) for w in wildcards)]
+
+
+def distribution_id(cf, destination: str) -> str:
+    """The distribution whose domain name or alias (CNAME) is the host of
+    the destination's public URLs."""
+    from publisher import load_destination
+
+    host = urlparse(load_destination(destination).public_url("x")).netloc
+    for page in cf.get_paginator("list_distributions").paginate():
+        for d in page["DistributionList"].get("Items", []):
+            if host == d["DomainName"] or host in d.get("Aliases", {}).get("Items", []):
+                return d["Id"]
+    raise SystemExit(f"❌ No CloudFront distribution serves {host} (destination {destination!r}).")
+
+
+def _submit(cf, dist: str, paths: list[str], caller_reference: str) -> dict[str, Any]:
+    with tracing.span(f"create invalidation {dist} ({len(paths)} paths)", "http"):
+        return cf.create_invalidation(
+            DistributionId=dist,
+            InvalidationBatch={"Paths": {"Quantity": len(paths), "Items": paths},
+                               "CallerReference": caller_reference})["Invalidation"]
+
+
+def flush(work_dir: Path, wait: bool = True) -> list[dict[str, Any]]:
+    """Submit the pending paths, one invalidation per distribution, and (with
+    `wait`) poll until each has Completed. Returns the submitted records."""
+    path = work_dir / QUEUE_NAME
+    queue = _load(path)
+    if not queue["pending"]:
+        print("🌀 No CloudFront invalidations pending.")
+        return []
+    cf = aws_clients.client("cloudfront")
+
+    batches: dict[str, dict[str, list[str]]] = {}
+    for destination, paths in queue["pending"].items():
+        with tracing.span(f"resolve distribution ({destination})", "http"):
+            dist = distribution_id(cf, destination)
+        batch = batches.setdefault(dist, {"destinations": [], "paths": []})
+        batch["destinations"].append(destination)
+        batch["paths"] += paths
+
+    records = []
+    for dist, batch in batches.items():
+        paths = collapse(batch["paths"])
+        resp = _submit(cf, dist, paths, f"{work_dir.name}-{dist}-{time.time():.0f}")
+        record = {"distribution": dist, "destinations": batch["destinations"],
+                  "id": resp["Id"], "paths": paths,
+                  "submitted_at": time.time(), "status": resp["Status"],
+                  "propagation_s": None}
+        records.append(record)
+        # Accepted: these paths are no longer pending even if the wait fails.
+        for destination in batch["destinations"]:
+            queue["pending"].pop(destination, None)
+        queue["submitted"].append(record)
+        _save(path, queue)
+        print(f"🌀 Invalidation {record['id']} on {dist} ({', '.join(batch['destinations'])}): "
+              f"{len(paths)} paths")
+        for p in paths:
+            print(f"   {p}")
+
+    if wait:
+        _wait(cf, records)
+        _save(path, queue)
+    return records
+
+
+def _wait(cf, records: list[dict[str, Any]]) -> None:
+    waiting = [r for r in records if r["status"] != "Completed"]
+    deadline = time.time() + WAIT_TIMEOUT_SECONDS
+    with tracing.span(f"await {len(records)} invalidation(s)", "wait"):
+        while waiting and time.time() < deadline:
+            time.sleep(POLL_SECONDS)
+            for r in list(waiting):
+                r["status"] = cf.get_invalidation(DistributionId=r["distribution"],
+                                                  Id=r["id"])["Invalidation"]["Status"]
+                if r["status"] == "Completed":
+                    r["propagation_s"] = round(time.time() - r["submitted_at"], 1)
+                    waiting.remove(r)
+                    print(f"✅ Invalidation {r['id']} ({r['distribution']}) completed in "
+                          f"{r['propagation_s']:.0f}s")
+    for r in waiting:
+        print(f"⚠ Invalidation {r['id']} ({r['distribution']}) still {r['status']} after "
+              f"{WAIT_TIMEOUT_SECONDS // 60} min — it will finish on its own.")
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Submit a run's batched CloudFront invalidations")
+    p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
+    p.add_argument("--no-wait", action="store_true", help="Submit, don't poll for completion")
+    args = p.parse_args(argv)
+    date = args.date or dt.datetime.now(dt.timezone(dt.timedelta(hours=-4))).strftime("%Y-%m-%d")
+    work_dir = WORK_ROOT / date
+    if pending(work_dir):
+        tracing.start_step("invalidations", work_dir)
+    flush(work_dir, wait=not args.no_wait)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
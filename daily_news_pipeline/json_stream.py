@@ -0,0 +1,208 @@
+"""
+Incremental JSON structure validator for streamed LLM responses.
+
+Feed it the response text as it arrives; it raises `JsonStreamError` at the
+first character that can't be part of a valid JSON document — a prose
+preamble, a missing comma, a mismatched bracket, trailing chatter after the
+closing brace — so the caller can abort the stream instead of paying for the
+remaining few thousand tokens and then failing in json.loads.
+
+Tolerates what strip_fences() tolerates: surrounding whitespace and a
+``` / ```json code fence around the document. It checks structure only;
+the caller still json.loads the full text (values are not materialized here).
+
+`JsonStreamError` subclasses json.JSONDecodeError, so existing
+`except json.JSONDecodeError` handlers cover both.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+
+_NUMBER_RE = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+_NUMBER_CHARS = set("0123456789+-.eE")
+_ESCAPES = set('"\\/bfnrtu')
+_HEX = set("0123456789abcdefABCDEF")
+_WS = set(" \t\r\n")
+
+
+class JsonStreamError(json.JSONDecodeError):
+    """Structural error found mid-stream. `doc` is the text received so far."""
+
+
+class JsonStreamValidator:
+    """Pushdown validator over a character stream. `root` restricts the
+    top-level value ("{" for the step-2 objects, "[" for arrays, None = any)."""
+
+    def __init__(self, root: str | None = "{") -> None:
+        self.root = root
+        self.buf: list[str] = []
+        self.pos = 0
+        self.stack: list[str] = []
+        # Expectation: fence_open | value | key_or_end | key | colon |
+        # after_value | value_or_end | string | number | literal | done | fence_close
+        self.state = "start"
+        self._string_is_key = False
+        self._escape = 0          # 0 = none, 1 = after '\', 2-5 = \u hex digits remaining+1
+        self._token = ""          # number / literal accumulator
+        self._literal = ""
+        self._fence = ""          # backticks / language tag being consumed
+
+    # ── public ──────────────────────────────────────────────────────────
+
+    def feed(self, chunk: str) -> None:
+        for ch in chunk:
+            self.buf.append(ch)
+            self._step(ch)
+            self.pos += 1
+
+    def close(self) -> None:
+        """Call at end of stream: raises if the document is incomplete."""
+        if self.state == "number":
+            self._end_number()
+        if self.state not in ("done", "fence_close"):
+            self._fail("response ended before the JSON document was complete")
+
+    @property
+    def text(self) -> str:
+        return "".join(self.buf)
+
+    # ── internals ───────────────────────────────────────────────────────
+
+    def _fail(self, msg: str) -> None:
+        raise JsonStreamError(msg, self.text, self.pos)
+
+    def _step(self, ch: str) -> None:
+        st = self.state
+        if st == "start":
+            if ch in _WS:
+                return
+            if ch == "`":
+                self.state, self._fence = "fence_open", "`"
+                return
+            self._begin_root(ch)
+        elif st == "fence_open":
+            # ``` then an optional language tag, up to the newline
+            if len(self._fence) < 3:
+                if ch != "`":
+                    self._fail("malformed opening code fence")
+                self._fence += ch
+            elif ch == "\n":
+                self.state = "root"
+            elif not (ch.isalnum() or ch in "-_ \t\r"):
+                self._fail("unexpected text after opening code fence")
+        elif st == "root":
+            if ch not in _WS:
+                self._begin_root(ch)
+        elif st == "string":
+            self._string_char(ch)
+        elif st == "number":
+            if ch in _NUMBER_CHARS:
+                self._token += ch
+            else:
+                self._end_number()
+                self._step(ch)
+        elif st == "literal":
+            self._token += ch
+            if not self._literal.startswith(self._token):
+                self._fail(f"invalid literal (expected {self._literal!r})")
+            if self._token == self._literal:
+                self._after_value()
+        elif st in ("done", "fence_close"):
+            if ch in _WS or ch == "`":
+                self.state = "fence_close"
+                return
+            self._fail("unexpected text after the JSON document")
+        elif ch in _WS:
+            return
+        elif st in ("value", "value_or_end"):
+            if st == "value_or_end" and ch == "]":
+                self._close("]")
+            else:
+                self._begin_value(ch)
+        elif st == "key_or_end":
+            if ch == "}":
+                self._close("}")
+            elif ch == '"':
+                self._begin_string(is_key=True)
+            else:
+                self._fail("expected an object key or '}'")
+        elif st == "key":
+            if ch != '"':
+                self._fail("expected an object key")
+            self._begin_string(is_key=True)
+        elif st == "colon":
+            if ch != ":":
+                self._fail("expected ':' after object key")
+            self.state = "value"
+        elif st == "after_value":
+            top = self.stack[-1]
+            if ch == ",":
+                self.state = "key" if top == "{" else "value"
+            elif ch in "}]":
+                self._close(ch)
+            else:
+                self._fail(f"expected ',' or '{'}' if top == '{' else ']'}'")
+
+    def _begin_root(self, ch: str) -> None:
+        if self.root is not None and ch != self.root:
+            self._fail(f"response does not start with {self.root!r}")
+        self._begin_value(ch)
+
+    def _begin_value(self, ch: str) -> None:
+        if ch == "{":
+            self.stack.append("{")
+            self.state = "key_or_end"
+        elif ch == "[":
+            self.stack.append("[")
+            self.state = "value_or_end"
+        elif ch == '"':
+            self._begin_string(is_key=False)
+        elif ch == "-" or ch.isdigit():
+            self.state, self._token = "number", ch
+        elif ch in "tfn":
+            self._literal = {"t": "true", "f": "false", "n": "null"}[ch]
+            self.state, self._token = "literal", ch
+        else:
+            self._fail(f"unexpected character {ch!r} where a value was expected")
+
+    def _begin_string(self, *, is_key: bool) -> None:
+        self.state = "string"
+        self._string_is_key = is_key
+        self._escape = 0
+
+    def _string_char(self, ch: str) -> None:
+        if self._escape == 1:
+            if ch not in _ESCAPES:
+                self._fail(f"invalid escape '\\{ch}'")
+            self._escape = 5 if ch == "u" else 0
+        elif self._escape > 1:
+            if ch not in _HEX:
+                self._fail("invalid \\u escape")
+            self._escape = self._escape - 1 if self._escape > 2 else 0
+        elif ch == "\\":
+            self._escape = 1
+        elif ch == '"':
+            if self._string_is_key:
+                self.state = "colon"
+            else:
+                self._after_value()
+        elif ord(ch) < 0x20:
+            self._fail("unescaped control character in string")
+
+    def _end_number(self) -> None:
+        if not _NUMBER_RE.fullmatch(self._token):
+            self._fail(f"invalid number {self._token!r}")
+        self._after_value()
+
+    def _close(self, ch: str) -> None:
+        opener = "{" if ch == "}" else "["
+        if not self.stack or self.stack[-1] != opener:
+            self._fail(f"mismatched {ch!r}")
+        self.stack.pop()
+        self._after_value()
+
+    def _after_value(self) -> None:
+        self._token = ""
+        self.state = "after_value" if self.stack else "done"
@@ -5,52 +5,368 @@ Each pipeline step selects its provider via `llm.yaml` (or environment overrides
 The cost tracker records per-call usage with provider+model attribution, so the
 same step can use different models on different days and the ledger reflects it.
 
-Adding a new provider: subclass `LLMProvider`, implement `chat`, register in
-`make_provider()`.
+Adding a new provider: subclass `LLMProvider`, implement `chat` (and `achat`
+if the SDK has an async client), register in `make_provider()`.
+
+Prompt caching: a prompt can be a `Prompt(static, dynamic)` instead of a str.
+The static part (instructions, schema — identical across calls) is sent
+first; Anthropic gets it as a `cache_control` block, OpenAI caches long
+identical prefixes automatically. Cached-token usage comes back on
+LLMResponse and is priced via cost_tracker.LLM_PRICING.
+
+Streaming: `stream_chat(..., expect_json=True)` streams the response through
+json_stream.JsonStreamValidator and aborts at the first structural error,
+re-asking once (JSON_STREAM_ATTEMPTS) instead of paying full latency for a
+response json.loads would reject. Streamed responses carry ttft_ms /
+duration_ms for the cost report.
+
+Batch mode: `chat_batch({key: prompt}, max_tokens)` submits every prompt as
+one provider batch job (Anthropic Message Batches / OpenAI Batch API), polls
+until it finishes and maps results back to the caller's keys. Half price and
+no realtime rate limits, but minutes-to-hours of latency — for backfills and
+other work nobody is waiting on (2b --batch, translate_bundle --batch). For
+offline runs, point ANTHROPIC_BASE_URL / OPENAI_BASE_URL at
+batch_standin_server.py.
+
+Concurrency: every request, sync or async, goes through the process-wide
+`GOVERNOR`, which enforces per-provider `max_concurrent` / `requests_per_minute`
+from llm.yaml `governor:`. Steps can therefore fan out freely (threads or
+asyncio.gather) without coordinating with each other.
+
+Response cache (opt-in, `response_cache:` in llm.yaml): `provider_for_step`
+wraps the provider in `CachedProvider`, which serves identical
+(provider, model, max_tokens, prompt) requests from disk, so re-running a step
+after a downstream failure costs nothing. Hits come back with
+`cache_hit=True` and are recorded at zero cost.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
+from pathlib import Path
+
+import tracing
+from json_stream import JsonStreamError, JsonStreamValidator
 
 # Retry transient API failures (2026-07-20: back-to-back Anthropic 529s and a
 # read timeout each killed a daily run that would have succeeded minutes later).
 MAX_ATTEMPTS = 4
-RETRY_DELAYS = (10, 30, 90)  # seconds between attempts
+RETRY_DELAYS = (10, 30, 90)  # seconds between attempts (jittered, see _retry_delay)
 
 
-def _with_retries(call, label: str):
-    """Run `call()` with retries on transient failures.
+def _retryable_status(e: Exception) -> tuple[bool, object]:
+    """(retryable?, status) for an SDK exception.
 
     Retryable: 429, any 5xx (incl. Anthropic 529 overloaded), and exceptions
     carrying no HTTP status (read timeouts, connection resets). Client errors
-    (4xx auth/validation) raise immediately. Only the SDK request belongs
-    inside `call` — retrying is billed.
+    (4xx auth/validation) are not, and neither is a mid-stream JSON failure
+    (handled by _validated_stream).
+    """
+    if isinstance(e, JsonStreamError):
+        return False, None
+    status = getattr(e, "status_code", None) or getattr(e, "status", None)
+    retryable = status is None or status == 429 or (isinstance(status, int) and 500 <= status < 600)
+    return retryable, status
+
+
+def _retry_delay(attempt: int, e: Exception) -> float:
+    """Backoff before the next attempt: RETRY_DELAYS scaled by a random 0.5-1.0
+    (so a burst of calls that failed together don't all come back together),
+    but never shorter than a server-sent Retry-After."""
+    delay = RETRY_DELAYS[attempt] * random.uniform(0.5, 1.0)
+    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+    try:
+        delay = max(delay, float(headers.get("retry-after", 0)))
+    except (TypeError, ValueError):
+        pass
+    return round(delay, 1)
+
+
+def _with_retries(call, label: str, provider: str | None = None):
+    """Run `call()` with retries on transient failures (see _retryable_status).
+    Only the SDK request belongs inside `call` — retrying is billed.
+
+    With `provider`, each attempt runs inside a GOVERNOR slot; the backoff
+    sleep happens outside it, so a retrying call doesn't hold capacity other
+    threads could use.
+
+    Each attempt is a tracing span; time queued for the slot is a "wait" span.
     """
     for attempt in range(MAX_ATTEMPTS):
         try:
-            return call()
+            if provider is None:
+                with tracing.span(label, "llm", attempt=attempt + 1):
+                    return call()
+            queued = time.time()
+            with GOVERNOR.slot(provider):
+                _record_queue(provider, queued)
+                with tracing.span(label, "llm", attempt=attempt + 1):
+                    return call()
         except Exception as e:
-            status = getattr(e, "status_code", None) or getattr(e, "status", None)
-            retryable = status is None or status == 429 or (isinstance(status, int) and 500 <= status < 600)
+            retryable, status = _retryable_status(e)
             if attempt == MAX_ATTEMPTS - 1 or not retryable:
                 raise
-            delay = RETRY_DELAYS[attempt]
+            delay = _retry_delay(attempt, e)
             print(f"     ⚠ {label}: transient error ({status or type(e).__name__}); "
                   f"retrying in {delay}s (attempt {attempt + 2}/{MAX_ATTEMPTS})", flush=True)
-            time.sleep(delay)
+            with tracing.span(f"{label} backoff", "wait", status=str(status or type(e).__name__)):
+                time.sleep(delay)
+
+
+async def _awith_retries(acall, label: str, provider: str):
+    """Async `_with_retries`: `acall()` returns an awaitable. Backoff is an
+    asyncio.sleep, so other in-flight calls on the loop keep running."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            queued = time.time()
+            async with GOVERNOR.aslot(provider):
+                _record_queue(provider, queued)
+                with tracing.span(label, "llm", attempt=attempt + 1):
+                    return await acall()
+        except Exception as e:
+            retryable, status = _retryable_status(e)
+            if attempt == MAX_ATTEMPTS - 1 or not retryable:
+                raise
+            delay = _retry_delay(attempt, e)
+            print(f"     ⚠ {label}: transient error ({status or type(e).__name__}); "
+                  f"retrying in {delay}s (attempt {attempt + 2}/{MAX_ATTEMPTS})", flush=True)
+            with tracing.span(f"{label} backoff", "wait", status=str(status or type(e).__name__)):
+                await asyncio.sleep(delay)
+
+
+def _record_queue(provider: str, queued: float) -> None:
+    """Trace time spent waiting for a GOVERNOR slot (skipped when negligible)."""
+    now = time.time()
+    if now - queued > 0.005:
+        tracing.record(f"{provider} slot", "wait", queued, now)
+
+
+# ─── Concurrency governor ─────────────────────────────────────────────────────
+
+
+@dataclass
+class ProviderLimits:
+    max_concurrent: int = 8
+    requests_per_minute: float = 0  # 0 = no rate limit, concurrency cap only
+
+
+class _RateLimiter:
+    """Spaces request starts at least 60/rpm seconds apart, across threads and
+    event loops alike: callers reserve a start time and wait until it."""
+
+    def __init__(self, rpm: float) -> None:
+        self.interval = 60.0 / rpm if rpm else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Seconds the caller must wait before starting its request."""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+            return start - now
+
+
+class ProviderGovernor:
+    """Process-wide per-provider caps: at most `max_concurrent` requests in
+    flight and at most `requests_per_minute` started, whichever step, thread
+    or coroutine they come from. Configured from llm.yaml `governor:`
+    (see configure_governor); unconfigured providers get ProviderLimits().
+
+    Sync callers share a threading semaphore; async callers a per-event-loop
+    asyncio semaphore of the same size (a process runs one style per step).
+    The rate limiter is shared by both."""
+
+    def __init__(self) -> None:
+        self._limits: dict[str, ProviderLimits] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._aslots: dict[tuple[str, int], asyncio.Semaphore] = {}
+        self._limiters: dict[str, _RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, provider: str, limits: ProviderLimits) -> None:
+        with self._lock:
+            if self._limits.get(provider) == limits:
+                return  # unchanged — keep the live semaphores (calls may be in flight)
+            self._limits[provider] = limits
+            self._slots.pop(provider, None)
+            self._limiters.pop(provider, None)
+            for k in [k for k in self._aslots if k[0] == provider]:
+                del self._aslots[k]
+
+    def limits(self, provider: str) -> ProviderLimits:
+        return self._limits.get(provider) or ProviderLimits()
+
+    def _sync_parts(self, provider: str) -> tuple[threading.BoundedSemaphore, _RateLimiter]:
+        with self._lock:
+            lim = self.limits(provider)
+            sem = self._slots.setdefault(provider, threading.BoundedSemaphore(max(1, lim.max_concurrent)))
+            rl = self._limiters.setdefault(provider, _RateLimiter(lim.requests_per_minute))
+            return sem, rl
+
+    def _async_parts(self, provider: str) -> tuple[asyncio.Semaphore, _RateLimiter]:
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            lim = self.limits(provider)
+            sem = self._aslots.setdefault((provider, loop_id), asyncio.Semaphore(max(1, lim.max_concurrent)))
+            rl = self._limiters.setdefault(provider, _RateLimiter(lim.requests_per_minute))
+            return sem, rl
+
+    @contextmanager
+    def slot(self, provider: str):
+        sem, rl = self._sync_parts(provider)
+        with sem:
+            wait = rl.reserve()
+            if wait:
+                time.sleep(wait)
+            yield
+
+    @asynccontextmanager
+    async def aslot(self, provider: str):
+        sem, rl = self._async_parts(provider)
+        async with sem:
+            wait = rl.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+            yield
+
+
+GOVERNOR = ProviderGovernor()
+
+
+def configure_governor(llm_cfg: dict) -> None:
+    """Apply llm.yaml `governor: {<provider>: {max_concurrent, requests_per_minute}}`."""
+    for provider, cfg in (llm_cfg.get("governor") or {}).items():
+        GOVERNOR.configure(provider, ProviderLimits(
+            max_concurrent=int(cfg.get("max_concurrent", ProviderLimits.max_concurrent)),
+            requests_per_minute=float(cfg.get("requests_per_minute", 0)),
+        ))
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """A prompt split for provider-side prompt caching: `static` is
+    byte-identical across calls, `dynamic` is the per-call part (the story).
+    Appending a str extends the dynamic part."""
+    static: str
+    dynamic: str = ""
+
+    @property
+    def text(self) -> str:
+        return self.static + self.dynamic
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return len(self.static) + len(self.dynamic)
+
+    def __add__(self, other: str) -> "Prompt":
+        return Prompt(self.static, self.dynamic + other)
+
+
+def prompt_text(prompt: str | Prompt) -> str:
+    return prompt.text if isinstance(prompt, Prompt) else prompt
 
 
 @dataclass
 class LLMResponse:
     text: str
-    input_tokens: int
+    input_tokens: int        # uncached input tokens (billed at the full input rate)
     output_tokens: int
     provider: str
     model: str
+    cache_hit: bool = False  # served by ResponseCache — no API call at all
+    cache_read_tokens: int = 0   # prompt-cache reads (discounted)
+    cache_write_tokens: int = 0  # prompt-cache writes (Anthropic: surcharged)
+    ttft_ms: int | None = None       # streamed calls: request start → first text
+    duration_ms: int | None = None   # streamed calls: request start → last token
+    attempts: int = 1                # >1 when a malformed stream was aborted and re-asked
+    batch: bool = False              # served by a provider batch job (discounted, see cost_tracker)
+
+
+# ─── Batch jobs ───────────────────────────────────────────────────────────────
+
+BATCH_POLL_S = 30               # seconds between status checks
+BATCH_TIMEOUT_S = 24 * 3600     # both providers' completion window
+
+
+class BatchError(RuntimeError):
+    """A batch job that failed as a whole, or (as a value in chat_batch's
+    result) one request in it that errored, expired or was cancelled."""
+
+
+def _batch_ids(prompts: dict) -> dict[str, str]:
+    """caller key → custom_id. The caller's keys may be anything; custom ids
+    must match ^[a-zA-Z0-9_-]{1,64}$ (Anthropic) and be unique per job."""
+    return {key: f"req-{n:05d}" for n, key in enumerate(prompts)}
+
+
+def _poll_batch(retrieve, done, progress, label: str, poll_s: float):
+    """Poll `retrieve()` until `done(job)`, printing `progress(job)` whenever
+    it changes. Returns the finished job."""
+    deadline = time.monotonic() + BATCH_TIMEOUT_S
+    last = None
+    with tracing.span(f"{label} job", "llm"):
+        while True:
+            job = _with_retries(retrieve, label)
+            status = progress(job)
+            if status != last:
+                print(f"     ⏳ {label}: {status}", flush=True)
+                last = status
+            if done(job):
+                return job
+            if time.monotonic() > deadline:
+                raise BatchError(f"{label}: job {job.id} still unfinished after "
+                                 f"{BATCH_TIMEOUT_S // 3600}h ({status})")
+            time.sleep(poll_s)
+
+
+JSON_STREAM_ATTEMPTS = 2
+
+
+def _validated_stream(run_attempt, label: str) -> LLMResponse:
+    """Call `run_attempt()` (one streamed request; raises JsonStreamError with
+    `.usage` on a structural failure) until one passes, up to
+    JSON_STREAM_ATTEMPTS. Aborted attempts were billed, so their usage is
+    folded into the returned response — or, if every attempt fails, into the
+    raised error's `.usage`."""
+    spent = [0, 0, 0, 0]  # input, output, cache_read, cache_write
+    for attempt in range(1, JSON_STREAM_ATTEMPTS + 1):
+        try:
+            resp = run_attempt()
+        except JsonStreamError as e:
+            u = getattr(e, "usage", None)
+            if u is not None:
+                spent = [spent[0] + u.input_tokens, spent[1] + u.output_tokens,
+                         spent[2] + u.cache_read_tokens, spent[3] + u.cache_write_tokens]
+            if attempt == JSON_STREAM_ATTEMPTS:
+                if u is not None:
+                    u.input_tokens, u.output_tokens, u.cache_read_tokens, u.cache_write_tokens = spent
+                    u.attempts = attempt
+                raise
+            print(f"     ⚠ {label}: malformed JSON at char {e.pos} ({e.msg}) — "
+                  f"aborted the stream, re-asking (attempt {attempt + 1}/{JSON_STREAM_ATTEMPTS})",
+                  flush=True)
+            continue
+        resp.input_tokens += spent[0]
+        resp.output_tokens += spent[1]
+        resp.cache_read_tokens += spent[2]
+        resp.cache_write_tokens += spent[3]
+        resp.attempts = attempt
+        return resp
 
 
 class LLMProvider(ABC):
@@ -58,9 +374,56 @@ class LLMProvider(ABC):
     model: str
 
     @abstractmethod
-    def chat(self, prompt: str, max_tokens: int) -> LLMResponse:
+    def chat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
         """Single-turn chat. Returns the response text + usage."""
 
+    async def achat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        """Async single-turn chat. Providers with an async SDK override this;
+        the default runs `chat` in a worker thread."""
+        return await asyncio.to_thread(self.chat, prompt, max_tokens)
+
+    def stream_chat(self, prompt: str | Prompt, max_tokens: int, *,
+                    expect_json: bool = False) -> LLMResponse:
+        """Streamed single-turn chat (see module docstring). Providers with a
+        streaming SDK override this; the default is `chat` plus a post-hoc
+        structure check (no early abort, no timing metrics)."""
+        def attempt() -> LLMResponse:
+            resp = self.chat(prompt, max_tokens)
+            if expect_json:
+                v = JsonStreamValidator()
+                try:
+                    v.feed(resp.text)
+                    v.close()
+                except JsonStreamError as e:
+                    e.usage = resp
+                    raise
+            return resp
+        return _validated_stream(attempt, f"{self.name}/{self.model}")
+
+    def chat_batch(self, prompts: dict[str, str | Prompt], max_tokens: int, *,
+                   poll_s: float = BATCH_POLL_S) -> dict[str, LLMResponse | BatchError]:
+        """Independent prompts as one provider batch job: submitted together,
+        polled until done, results mapped back to the caller's keys. Items
+        that failed come back as BatchError values, not raised. Providers
+        with a batch API override this; the default sends every prompt
+        concurrently through `achat` (same shape, no discount)."""
+        async def run_all():
+            return await asyncio.gather(*(self.achat(p, max_tokens) for p in prompts.values()),
+                                        return_exceptions=True)
+        results = asyncio.run(run_all()) if prompts else []
+        return {key: (BatchError(f"{type(r).__name__}: {r}") if isinstance(r, Exception) else r)
+                for key, r in zip(prompts, results)}
+
+
+def _loop_client(cache: dict, factory):
+    """An async SDK client for the running event loop (their HTTP pools are
+    loop-bound, and steps may call asyncio.run more than once)."""
+    loop_id = id(asyncio.get_running_loop())
+    if loop_id not in cache:
+        cache.clear()
+        cache[loop_id] = factory()
+    return cache[loop_id]
+
 
 # ─── Anthropic ────────────────────────────────────────────────────────────────
 
@@ -77,27 +440,122 @@ class AnthropicProvider(LLMProvider):
         if not api_key:
             raise SystemExit("ANTHROPIC_API_KEY is not set")
         self.model = model
+        self._api_key = api_key
         self._client = Anthropic(api_key=api_key)
+        self._aclients: dict = {}
+
+    def _request(self, prompt: str | Prompt, max_tokens: int) -> dict:
+        if isinstance(prompt, Prompt):
+            # Cache breakpoint after the static block. Prefixes under the
+            # model's minimum (1024 tokens for Sonnet) are simply not cached.
+            content = [{"type": "text", "text": prompt.static,
+                        "cache_control": {"type": "ephemeral"}}]
+            if prompt.dynamic:
+                content.append({"type": "text", "text": prompt.dynamic})
+        else:
+            content = prompt
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": content}],
+        }
 
-    def chat(self, prompt: str, max_tokens: int) -> LLMResponse:
-        msg = _with_retries(
-            lambda: self._client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}],
-            ),
-            label=f"{self.name}/{self.model}",
-        )
+    def _response(self, msg) -> LLMResponse:
         parts = []
         for block in msg.content:
             if getattr(block, "type", None) == "text":
                 parts.append(block.text)
         text = "".join(parts).strip()
         usage = getattr(msg, "usage", None)
+        # input_tokens already excludes cache reads/writes on Anthropic.
         in_tok = getattr(usage, "input_tokens", 0) if usage else 0
         out_tok = getattr(usage, "output_tokens", 0) if usage else 0
+        read = (getattr(usage, "cache_read_input_tokens", 0) or 0) if usage else 0
+        write = (getattr(usage, "cache_creation_input_tokens", 0) or 0) if usage else 0
         return LLMResponse(text=text, input_tokens=in_tok, output_tokens=out_tok,
-                           provider=self.name, model=self.model)
+                           provider=self.name, model=self.model,
+                           cache_read_tokens=read, cache_write_tokens=write)
+
+    def chat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        req = self._request(prompt, max_tokens)
+        msg = _with_retries(lambda: self._client.messages.create(**req),
+                            label=f"{self.name}/{self.model}", provider=self.name)
+        return self._response(msg)
+
+    async def achat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        from anthropic import AsyncAnthropic
+        client = _loop_client(self._aclients, lambda: AsyncAnthropic(api_key=self._api_key))
+        req = self._request(prompt, max_tokens)
+        msg = await _awith_retries(lambda: client.messages.create(**req),
+                                   label=f"{self.name}/{self.model}", provider=self.name)
+        return self._response(msg)
+
+    def _stream_once(self, req: dict, expect_json: bool) -> LLMResponse:
+        validator = JsonStreamValidator() if expect_json else None
+        t0 = time.monotonic()
+        ttft = None
+        with self._client.messages.stream(**req) as stream:
+            try:
+                for delta in stream.text_stream:
+                    if ttft is None:
+                        ttft = time.monotonic() - t0
+                    if validator:
+                        validator.feed(delta)
+                if validator:
+                    validator.close()
+            except JsonStreamError as e:
+                # Leaving the `with` closes the connection — generation stops here.
+                e.usage = self._response(stream.current_message_snapshot)
+                raise
+            msg = stream.get_final_message()
+        resp = self._response(msg)
+        resp.ttft_ms = round((ttft if ttft is not None else time.monotonic() - t0) * 1000)
+        resp.duration_ms = round((time.monotonic() - t0) * 1000)
+        return resp
+
+    def stream_chat(self, prompt: str | Prompt, max_tokens: int, *,
+                    expect_json: bool = False) -> LLMResponse:
+        req = self._request(prompt, max_tokens)
+        label = f"{self.name}/{self.model}"
+        return _validated_stream(
+            lambda: _with_retries(lambda: self._stream_once(req, expect_json),
+                                  label=label, provider=self.name),
+            label)
+
+    def chat_batch(self, prompts: dict[str, str | Prompt], max_tokens: int, *,
+                   poll_s: float = BATCH_POLL_S) -> dict[str, LLMResponse | BatchError]:
+        """Message Batches API. Batch traffic doesn't count against the
+        realtime limits, so it bypasses the GOVERNOR."""
+        if not prompts:
+            return {}
+        ids = _batch_ids(prompts)
+        label = f"{self.name}/{self.model} batch"
+        requests = [{"custom_id": cid, "params": self._request(prompts[key], max_tokens)}
+                    for key, cid in ids.items()]
+        batches = self._client.messages.batches
+        job = _with_retries(lambda: batches.create(requests=requests), label)
+        print(f"  📦 {label}: submitted {len(requests)} requests as {job.id}", flush=True)
+
+        def progress(j) -> str:
+            c = j.request_counts
+            return (f"{j.processing_status} — {c.processing} processing, {c.succeeded} succeeded, "
+                    f"{c.errored + c.canceled + c.expired} failed")
+        job = _poll_batch(lambda: batches.retrieve(job.id),
+                          lambda j: j.processing_status == "ended", progress, label, poll_s)
+
+        by_id: dict[str, LLMResponse | BatchError] = {}
+        for item in _with_retries(lambda: list(batches.results(job.id)), label):
+            result = item.result
+            if result.type == "succeeded":
+                resp = self._response(result.message)
+                resp.batch = True
+                by_id[item.custom_id] = resp
+            else:
+                err = getattr(getattr(result, "error", None), "error", None)
+                by_id[item.custom_id] = BatchError(
+                    f"{result.type}: {getattr(err, 'message', None) or 'no detail'}")
+        return {key: by_id.get(cid, BatchError("missing from batch results"))
+                for key, cid in ids.items()}
 
 
 # ─── OpenAI ───────────────────────────────────────────────────────────────────
@@ -115,16 +573,20 @@ class OpenAIProvider(LLMProvider):
         if not api_key:
             raise SystemExit("OPENAI_API_KEY is not set")
         self.model = model
+        self._api_key = api_key
         self._client = OpenAI(api_key=api_key)
+        self._aclients: dict = {}
 
-    def chat(self, prompt: str, max_tokens: int) -> LLMResponse:
+    def _request(self, prompt: str | Prompt, max_tokens: int) -> dict:
         # Reasoning models (o1, o3) require slightly different params, but
         # chat.completions accepts both. max_tokens semantics: for reasoning
         # models, it's a hard ceiling on visible output (reasoning tokens are
         # separate and billed but unobservable).
+        # Prompt caching is automatic on OpenAI for identical prefixes of
+        # 1024+ tokens; a Prompt's static-first layout is all it needs.
         kwargs = {
             "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [{"role": "user", "content": prompt_text(prompt)}],
         }
         # Newer models (o1/o3/o4 reasoning + gpt-5+) use max_completion_tokens;
         # older gpt-4* / gpt-4o use max_tokens.
@@ -132,17 +594,318 @@ class OpenAIProvider(LLMProvider):
             kwargs["max_completion_tokens"] = max_tokens
         else:
             kwargs["max_tokens"] = max_tokens
+        return kwargs
+
+    def _response(self, resp) -> LLMResponse:
+        return self._usage_response((resp.choices[0].message.content or "").strip(),
+                                    getattr(resp, "usage", None))
 
+    def _usage_response(self, text: str, usage) -> LLMResponse:
+        in_tok = getattr(usage, "prompt_tokens", 0) if usage else 0
+        out_tok = getattr(usage, "completion_tokens", 0) if usage else 0
+        details = getattr(usage, "prompt_tokens_details", None) if usage else None
+        read = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+        # prompt_tokens includes the cached ones; report them separately.
+        return LLMResponse(text=text, input_tokens=in_tok - read, output_tokens=out_tok,
+                           provider=self.name, model=self.model, cache_read_tokens=read)
+
+    def chat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        kwargs = self._request(prompt, max_tokens)
         resp = _with_retries(
             lambda: self._client.chat.completions.create(**kwargs),
-            label=f"{self.name}/{self.model}",
+            label=f"{self.name}/{self.model}", provider=self.name,
         )
-        text = (resp.choices[0].message.content or "").strip()
-        usage = getattr(resp, "usage", None)
-        in_tok = getattr(usage, "prompt_tokens", 0) if usage else 0
-        out_tok = getattr(usage, "completion_tokens", 0) if usage else 0
-        return LLMResponse(text=text, input_tokens=in_tok, output_tokens=out_tok,
-                           provider=self.name, model=self.model)
+        return self._response(resp)
+
+    async def achat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        from openai import AsyncOpenAI
+        client = _loop_client(self._aclients, lambda: AsyncOpenAI(api_key=self._api_key))
+        kwargs = self._request(prompt, max_tokens)
+        resp = await _awith_retries(
+            lambda: client.chat.completions.create(**kwargs),
+            label=f"{self.name}/{self.model}", provider=self.name,
+        )
+        return self._response(resp)
+
+    def _stream_once(self, prompt: str | Prompt, kwargs: dict, expect_json: bool) -> LLMResponse:
+        validator = JsonStreamValidator() if expect_json else None
+        t0 = time.monotonic()
+        ttft = None
+        parts: list[str] = []
+        usage = None
+        stream = self._client.chat.completions.create(
+            **kwargs, stream=True, stream_options={"include_usage": True})
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage  # final chunk only
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                if ttft is None:
+                    ttft = time.monotonic() - t0
+                parts.append(delta)
+                if validator:
+                    validator.feed(delta)
+            if validator:
+                validator.close()
+        except JsonStreamError as e:
+            stream.close()
+            # Usage only arrives in the final chunk; estimate the aborted
+            # attempt at ~4 chars/token so its spend isn't lost.
+            e.usage = LLMResponse(text="".join(parts), input_tokens=len(prompt) // 4,
+                                  output_tokens=len("".join(parts)) // 4,
+                                  provider=self.name, model=self.model)
+            raise
+        resp = self._usage_response("".join(parts).strip(), usage)
+        resp.ttft_ms = round((ttft if ttft is not None else time.monotonic() - t0) * 1000)
+        resp.duration_ms = round((time.monotonic() - t0) * 1000)
+        return resp
+
+    def stream_chat(self, prompt: str | Prompt, max_tokens: int, *,
+                    expect_json: bool = False) -> LLMResponse:
+        kwargs = self._request(prompt, max_tokens)
+        label = f"{self.name}/{self.model}"
+        return _validated_stream(
+            lambda: _with_retries(lambda: self._stream_once(prompt, kwargs, expect_json),
+                                  label=label, provider=self.name),
+            label)
+
+    def chat_batch(self, prompts: dict[str, str | Prompt], max_tokens: int, *,
+                   poll_s: float = BATCH_POLL_S) -> dict[str, LLMResponse | BatchError]:
+        """Batch API: upload a JSONL of chat.completions requests, poll the
+        job, read the output (and error) files. Bypasses the GOVERNOR."""
+        if not prompts:
+            return {}
+        from openai.types.chat import ChatCompletion
+        ids = _batch_ids(prompts)
+        label = f"{self.name}/{self.model} batch"
+        lines = [json.dumps({"custom_id": cid, "method": "POST", "url": "/v1/chat/completions",
+                             "body": self._request(prompts[key], max_tokens)}, ensure_ascii=False)
+                 for key, cid in ids.items()]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        client = self._client
+        upload = _with_retries(
+            lambda: client.files.create(file=("batch.jsonl", payload), purpose="batch"), label)
+        job = _with_retries(lambda: client.batches.create(
+            input_file_id=upload.id, endpoint="/v1/chat/completions", completion_window="24h"), label)
+        print(f"  📦 {label}: submitted {len(lines)} requests as {job.id}", flush=True)
+
+        def progress(j) -> str:
+            c = j.request_counts
+            return (f"{j.status} — {c.completed if c else 0}/{c.total if c else len(lines)} "
+                    f"completed, {c.failed if c else 0} failed")
+        job = _poll_batch(lambda: client.batches.retrieve(job.id),
+                          lambda j: j.status in ("completed", "failed", "expired", "cancelled"),
+                          progress, label, poll_s)
+        if job.status == "failed":
+            errors = getattr(getattr(job, "errors", None), "data", None) or []
+            raise BatchError(f"{label}: job {job.id} failed: "
+                             + "; ".join(getattr(e, "message", "") or "" for e in errors[:3]))
+
+        # An expired / cancelled job still returns whatever finished in time.
+        by_id: dict[str, LLMResponse | BatchError] = {}
+        for file_id in (job.output_file_id, job.error_file_id):
+            if not file_id:
+                continue
+            text = _with_retries(lambda fid=file_id: client.files.content(fid).text, label)
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                reply = row.get("response") or {}
+                if reply.get("status_code") == 200:
+                    resp = self._response(ChatCompletion.model_validate(reply["body"]))
+                    resp.batch = True
+                    by_id[row["custom_id"]] = resp
+                else:
+                    err = row.get("error") or (reply.get("body") or {}).get("error") or {}
+                    by_id[row["custom_id"]] = BatchError(
+                        f"{reply.get('status_code') or 'error'}: {err.get('message') or 'no detail'}")
+        return {key: by_id.get(cid, BatchError(f"missing from batch results (job {job.status})"))
+                for key, cid in ids.items()}
+
+
+# ─── Response cache ───────────────────────────────────────────────────────────
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_RESPONSE_CACHE_DIR = HERE / "cache" / "llm_responses"
+
+
+class ResponseCache:
+    """Content-addressed store of LLM responses: one JSON file per request at
+    <dir>/<key[:2]>/<key>.json. Entries older than `ttl_days` are misses;
+    once the store exceeds `max_mb`, least-recently-used entries (by mtime —
+    hits touch the file) are pruned."""
+
+    def __init__(self, root: Path, ttl_days: float = 30, max_mb: float = 200) -> None:
+        self.root = root
+        self.ttl_s = ttl_days * 86400
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._size: int | None = None  # lazily measured, then tracked on put
+
+    @staticmethod
+    def key(provider: str, model: str, max_tokens: int, prompt: str | Prompt) -> str:
+        blob = json.dumps([provider, model, max_tokens, prompt_text(prompt)], ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> LLMResponse | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created_at", 0) > self.ttl_s:
+            return None
+        try:
+            os.utime(path)  # LRU recency for _prune
+        except OSError:  # pruned by another thread / process since the read
+            pass
+        return LLMResponse(text=entry["text"], input_tokens=entry["input_tokens"],
+                           output_tokens=entry["output_tokens"], provider=entry["provider"],
+                           model=entry["model"], cache_hit=True,
+                           cache_read_tokens=entry.get("cache_read_tokens", 0),
+                           cache_write_tokens=entry.get("cache_write_tokens", 0))
+
+    def put(self, key: str, resp: LLMResponse) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        blob = json.dumps({
+            "text": resp.text,
+            "input_tokens": resp.input_tokens,
+            "output_tokens": resp.output_tokens,
+            "cache_read_tokens": resp.cache_read_tokens,
+            "cache_write_tokens": resp.cache_write_tokens,
+            "provider": resp.provider,
+            "model": resp.model,
+            "created_at": time.time(),
+        }, ensure_ascii=False).encode("utf-8")
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)  # atomic: concurrent readers never see a partial entry
+        with self._lock:
+            if self._size is None:
+                self._size = sum(p.stat().st_size for p in self.root.glob("*/*.json"))
+            else:
+                self._size += len(blob)
+            if self._size > self.max_bytes:
+                self._prune()
+
+    def discard(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Drop oldest-used entries until the store is back under 90% of the cap."""
+        entries = []
+        for p in self.root.glob("*/*.json"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+        size = sum(e[1] for e in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, nbytes, p in entries:
+            if size <= target:
+                break
+            p.unlink(missing_ok=True)
+            size -= nbytes
+        self._size = size
+
+
+class CachedProvider(LLMProvider):
+    """Wraps a provider with a ResponseCache. `refresh=True` skips reads
+    (always calls the API) but still writes, to replace stale entries."""
+
+    def __init__(self, inner: LLMProvider, cache: ResponseCache, refresh: bool = False) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.refresh = refresh
+        self.name = inner.name
+        self.model = inner.model
+
+    def chat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        key = ResponseCache.key(self.name, self.model, max_tokens, prompt)
+        if not self.refresh:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        resp = self.inner.chat(prompt, max_tokens=max_tokens)
+        self.cache.put(key, resp)
+        return resp
+
+    async def achat(self, prompt: str | Prompt, max_tokens: int) -> LLMResponse:
+        key = ResponseCache.key(self.name, self.model, max_tokens, prompt)
+        if not self.refresh:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        resp = await self.inner.achat(prompt, max_tokens=max_tokens)
+        self.cache.put(key, resp)
+        return resp
+
+    def stream_chat(self, prompt: str | Prompt, max_tokens: int, *,
+                    expect_json: bool = False) -> LLMResponse:
+        key = ResponseCache.key(self.name, self.model, max_tokens, prompt)
+        if not self.refresh:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        resp = self.inner.stream_chat(prompt, max_tokens=max_tokens, expect_json=expect_json)
+        self.cache.put(key, resp)
+        return resp
+
+    def chat_batch(self, prompts: dict[str, str | Prompt], max_tokens: int, *,
+                   poll_s: float = BATCH_POLL_S) -> dict[str, LLMResponse | BatchError]:
+        keys = {k: ResponseCache.key(self.name, self.model, max_tokens, p) for k, p in prompts.items()}
+        results: dict[str, LLMResponse | BatchError] = {}
+        if not self.refresh:
+            for k, key in keys.items():
+                hit = self.cache.get(key)
+                if hit is not None:
+                    results[k] = hit
+        misses = {k: p for k, p in prompts.items() if k not in results}
+        for k, resp in self.inner.chat_batch(misses, max_tokens, poll_s=poll_s).items():
+            if isinstance(resp, LLMResponse):
+                self.cache.put(keys[k], resp)
+            results[k] = resp
+        return {k: results[k] for k in prompts}
+
+    def discard(self, prompt: str | Prompt, max_tokens: int) -> None:
+        self.cache.discard(ResponseCache.key(self.name, self.model, max_tokens, prompt))
+
+
+def discard_cached(provider: LLMProvider, prompt: str | Prompt, max_tokens: int) -> None:
+    """Drop a cached response the caller couldn't use (e.g. unparseable JSON),
+    so a re-run asks the model again instead of replaying the bad answer.
+    No-op for uncached providers."""
+    if isinstance(provider, CachedProvider):
+        provider.discard(prompt, max_tokens)
+
+
+def response_cache_from_config(llm_cfg: dict) -> tuple[ResponseCache, bool] | None:
+    """(cache, refresh) from llm.yaml `response_cache:`, or None when disabled.
+    LLM_RESPONSE_CACHE=0|1|refresh overrides `enabled` for a single run."""
+    cfg = llm_cfg.get("response_cache") or {}
+    mode = os.getenv("LLM_RESPONSE_CACHE")
+    if mode is None:
+        mode = "1" if cfg.get("enabled") else "0"
+    if mode == "0":
+        return None
+    root = HERE / os.path.expanduser(cfg["dir"]) if cfg.get("dir") else DEFAULT_RESPONSE_CACHE_DIR
+    cache = ResponseCache(root, ttl_days=float(cfg.get("ttl_days", 30)),
+                          max_mb=float(cfg.get("max_mb", 200)))
+    return cache, mode == "refresh"
+
+
+_response_caches: dict[Path, ResponseCache] = {}
 
 
 # ─── Factory ──────────────────────────────────────────────────────────────────
@@ -154,10 +917,18 @@ PROVIDERS_BY_NAME: dict[str, type[LLMProvider]] = {
 }
 
 
+# One provider (and SDK client + connection pool) per provider/model per
+# process: steps run in-process by run.py share them.
+_providers: dict[tuple[str, str], LLMProvider] = {}
+
+
 def make_provider(provider_name: str, model: str) -> LLMProvider:
     if provider_name not in PROVIDERS_BY_NAME:
         raise SystemExit(f"unknown LLM provider '{provider_name}'. options: {sorted(PROVIDERS_BY_NAME)}")
-    return PROVIDERS_BY_NAME[provider_name](model=model)
+    key = (provider_name, model)
+    if key not in _providers:
+        _providers[key] = PROVIDERS_BY_NAME[provider_name](model=model)
+    return _providers[key]
 
 
 def provider_for_step(step_name: str, llm_cfg: dict) -> LLMProvider:
@@ -170,7 +941,15 @@ def provider_for_step(step_name: str, llm_cfg: dict) -> LLMProvider:
     model = step_cfg.get("model")
     if not provider_name or not model:
         raise SystemExit(f"llm.yaml steps.{step_name} must specify both `provider` and `model`")
-    return make_provider(provider_name, model)
+    configure_governor(llm_cfg)
+    provider = make_provider(provider_name, model)
+    cached = response_cache_from_config(llm_cfg)
+    if cached is None:
+        return provider
+    cache, refresh = cached
+    # One ResponseCache per directory, so every step's wrapper shares the size accounting.
+    cache = _response_caches.setdefault(cache.root, cache)
+    return CachedProvider(provider, cache, refresh=refresh)
 
 
 def max_tokens_for_step(step_name: str, llm_cfg: dict, default: int = 2048) -> int:
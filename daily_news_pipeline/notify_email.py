@@ -18,6 +18,9 @@ import os
 import sys
 from pathlib import Path
 
+import aws_clients
+import tracing
+
 REGION = "us-east-1"
 SENDER = "Six Wands News <news@sixwandsstudios.com>"
 DEFAULT_RECIPIENT = "flood.today@gmail.com"
@@ -26,16 +29,16 @@ DEFAULT_RECIPIENT = "flood.today@gmail.com"
 def send(subject: str, body: str) -> bool:
     recipient = os.environ.get("NEWS_NOTIFY_EMAIL", DEFAULT_RECIPIENT)
     try:
-        import boto3
-        ses = boto3.client("ses", region_name=REGION)
-        ses.send_email(
-            Source=SENDER,
-            Destination={"ToAddresses": [recipient]},
-            Message={
-                "Subject": {"Data": subject, "Charset": "UTF-8"},
-                "Body": {"Text": {"Data": body, "Charset": "UTF-8"}},
-            },
-        )
+        with tracing.span("ses send_email", "email"):
+            ses = aws_clients.client("ses", REGION)
+            ses.send_email(
+                Source=SENDER,
+                Destination={"ToAddresses": [recipient]},
+                Message={
+                    "Subject": {"Data": subject, "Charset": "UTF-8"},
+                    "Body": {"Text": {"Data": body, "Charset": "UTF-8"}},
+                },
+            )
         print(f"  ✉ notified {recipient}: {subject}")
         return True
     except Exception as e:  # noqa: BLE001 — notification must never break the caller
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Daily news pipeline runner: steps 0→6 (incl. 2b, and 3v with --verify) in
+ONE Python process. run_daily.sh execs this after setting up the
+environment (.env, venv python, PATH).
+
+Each step's `main(argv)` is called with the same arguments run_daily.sh
+used to pass on its command line, so the steps still write exactly the same
+files. What changes is what they no longer redo ~13 times over:
+
+  - imports (anthropic / openai / boto3 / yaml / studypack / voicebox ...)
+    happen once; LLM providers and their SDK clients are shared
+    (llm_providers.make_provider), as are boto3 clients
+    (bundle_pipeline.aws_clients) and a loaded Whisper model;
+  - llm.yaml / tts.yaml are parsed once, script*.json / bundle*.json /
+    chosen.json are handed from the writing step to the reading ones in
+    memory, and each edition's Lexicon is loaded once (artifacts.py).
+
+Unchanged from the shell chain: output goes to stdout AND
+work/<date>/run.log under a `═══ <step> ═══` header per step (subprocess
+output such as git's included), traces/steps.tsv gets each step's wall
+clock, the first failing step stops the run (exit 1), the cost / trace
+finalize runs at the end, and work/<date>/.completed makes a second run for
+the same date a no-op (FORCE_RERUN=1 overrides).
+
+Steps 5 and 6 run with --defer-invalidation: their CloudFront paths are
+queued and submitted as one invalidation per distribution after step 6
+(invalidations.py) — also after a failed step, so nothing that was
+published is left un-invalidated.
+
+Usage:
+    python -m daily_news_pipeline.run                     # today (Eastern), dry-run
+    python -m daily_news_pipeline.run --commit
+    python -m daily_news_pipeline.run --date 2026-05-24 --commit
+    python -m daily_news_pipeline.run --stream --commit   # steps 2→2b→3 pipelined per story
+    python -m daily_news_pipeline.run --verify --commit   # + Whisper check of new turns after step 3
+    (or `python run.py ...` from this directory)
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import importlib
+import os
+import shutil
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+# The steps import their siblings as top-level modules.
+if str(HERE) not in sys.path:
+    sys.path.insert(0, str(HERE))
+
+import artifacts  # noqa: E402
+import invalidations  # noqa: E402
+import tracing  # noqa: E402
+from checkpoints import run_report  # noqa: E402
+from cost_tracker import finalize_run  # noqa: E402
+
+WORK_ROOT = HERE / "work"
+CACHE_ROOT = HERE / "cache"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Run the daily news pipeline in one process")
+    p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
+    p.add_argument("--commit", action="store_true",
+                   help="Actually spend on the LLMs, TTS and S3 (default: dry-run, stops after step 1)")
+    p.add_argument("--stream", action="store_true",
+                   help="Steps 2→2b→3 pipelined per story (stream_daily.py)")
+    p.add_argument("--verify", action="store_true",
+                   help="Whisper-check the turns synthesized today after step 3")
+    return p.parse_args(argv)
+
+
+def today_eastern() -> str:
+    return dt.datetime.now(dt.timezone(dt.timedelta(hours=-4))).strftime("%Y-%m-%d")
+
+
+def plan_steps(date: str, commit: bool, stream: bool, verify: bool) -> list[tuple[str, str, list[str]]]:
+    """(label, module, argv) for every step after 0 and 1, in run order."""
+    c = ["--commit"] if commit else []
+    d = ["--date", date]
+    defer = ["--defer-invalidation"] if commit else []
+    steps: list[tuple[str, str, list[str]]] = []
+    # Two editions from one curate pass (ENGLISH_NEWS_EDITION_SPEC.md):
+    #   ko — Korean-audio pack for English speakers (news_latest)
+    #   en — English-audio pack for Korean learners (news_en_latest)
+    if stream:
+        steps.append(("2-3/7 stream script→translate→synth (ko+en)", "stream_daily", d + c))
+    else:
+        steps.append(("2/7 generate script (ko+en)", "2_generate_script", d + ["--all-editions"] + c))
+    for ed in ("ko", "en"):
+        e = d + ["--edition", ed]
+        if not stream:
+            steps.append((f"2b/7 translate easy ({ed})", "2b_translate_easy", e))
+            steps.append((f"3/7 synthesize ({ed})", "3_synthesize", e + c))
+        if verify:
+            # Only turns synthesized today whose audio_key isn't in the
+            # verification ledger yet are transcribed.
+            steps.append((f"3v/7 verify whisper ({ed})", "verify_whisper", e + ["--new-only"]))
+        steps.append((f"4/7 assemble bundle ({ed})", "4_assemble_bundle", e))
+    # Both editions' uploads at once; each still lands its MP3s before its
+    # bundle.json and alias.
+    steps.append(("5/7 publish s3 (ko+en)", "5_publish_s3", d + ["--all-editions"] + c + defer))
+    steps.append(("6/7 deploy web (ko)", "6_deploy_news_page", d + c + defer))
+    return steps
+
+
+@contextmanager
+def tee_output(log_path: Path):
+    """Everything written to fds 1 and 2 — Python prints and child processes
+    alike — also goes to `log_path` (run_daily.sh's `2>&1 | tee -a`)."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    read_fd, write_fd = os.pipe()
+    os.dup2(write_fd, 1)
+    os.dup2(write_fd, 2)
+    os.close(write_fd)
+
+    def pump() -> None:
+        with open(log_path, "ab") as log:
+            while chunk := os.read(read_fd, 65536):
+                os.write(saved[0], chunk)
+                log.write(chunk)
+                log.flush()
+
+    reader = threading.Thread(target=pump, name="run.log tee", daemon=True)
+    reader.start()
+    sys.stdout.reconfigure(line_buffering=True)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        reader.join()
+        os.close(read_fd)
+        for fd in saved:
+            os.close(fd)
+
+
+def log(msg: str) -> None:
+    print(f"[{time.strftime('%H:%M:%S')}] {msg}", flush=True)
+
+
+def run_step(label: str, module: str, argv: list[str], traces: Path) -> bool:
+    """Import and run one step's main(argv). True if it succeeded."""
+    log(f"═══ {label} ═══")
+    t0 = time.time()
+    try:
+        rc = importlib.import_module(module).main(argv)
+    except SystemExit as e:
+        # The steps abort with SystemExit("❌ ...") — print it the way the
+        # interpreter would have.
+        if isinstance(e.code, str):
+            print(e.code, file=sys.stderr)
+        rc = e.code if isinstance(e.code, int) else (1 if e.code else 0)
+    except Exception:
+        traceback.print_exc()
+        rc = 1
+    ok = not rc
+    # The step's trace is written either way (the spans up to a failure are
+    # the interesting ones).
+    tracing.finish_step()
+    with open(traces / "steps.tsv", "a", encoding="utf-8") as f:
+        f.write(f"{label}\t{t0:.6f}\t{time.time():.6f}\t{'ok' if ok else 'failed'}\n")
+    if ok:
+        log(f"✓ {label}")
+    else:
+        # A failed step may leave shared objects half-updated.
+        artifacts.clear()
+        log(f"❌ {label} failed")
+    return ok
+
+
+def run(args: argparse.Namespace, work_dir: Path) -> int:
+    date = args.date
+    log("═══════════════════════════════════════════════════════════")
+    log(f"  Daily news pipeline · date={date} · commit={'--commit' if args.commit else 'NO'}")
+    log(f"  Log: {work_dir / 'run.log'}")
+    log("═══════════════════════════════════════════════════════════")
+
+    # Idempotence guard: launchd can fire twice on unusual sleep/wake
+    # patterns (e.g. a suspended run resuming + the missed 08:00 event
+    # coalescing on a later wake, seen 2026-07-13). If today already
+    # completed, exit quietly.
+    stamp = work_dir / ".completed"
+    if stamp.exists() and os.getenv("FORCE_RERUN") != "1":
+        log(f"⏭ {date} already completed at {stamp.read_text(encoding='utf-8').strip()} — "
+            f"skipping duplicate run (FORCE_RERUN=1 overrides)")
+        return 0
+    # One timeline per run: drop spans left by an earlier attempt at this date.
+    traces = work_dir / "traces"
+    shutil.rmtree(traces, ignore_errors=True)
+    traces.mkdir(parents=True, exist_ok=True)
+
+    c = ["--commit"] if args.commit else []
+    head = [("0/7 fetch feeds", "0_fetch_feeds", ["--date", date]),
+            ("1/7 curate", "1_curate", ["--date", date] + c)]
+    for label, module, argv in head:
+        if not run_step(label, module, argv, traces):
+            return 1
+    if not args.commit:
+        log("(dry-run mode — stopping after step 1; re-run with --commit to continue)")
+        return 0
+    ok = all(run_step(label, module, argv, traces)
+             for label, module, argv in plan_steps(date, args.commit, args.stream, args.verify))
+    # What steps 5/6 queued, as one invalidation per distribution — even if
+    # a later step failed, the manifests that did go up must propagate.
+    if invalidations.pending(work_dir):
+        ok = run_step("6b/7 CloudFront invalidation (batched)", "invalidations",
+                      ["--date", date], traces) and ok
+    if not ok:
+        return 1
+
+    # Aggregate per-step cost reports into a cost_history entry + the cost
+    # ledger, and the per-step traces into trace.json + timeline.html.
+    out = finalize_run(work_dir, CACHE_ROOT, date)
+    print(f"💰 Cost ledger: {out}")
+    for line in run_report(work_dir):
+        print(f"♻️  {line}")
+    merged = tracing.merge_run(work_dir)
+    if merged:
+        print(f"⏱  Trace: {merged[0]}  Timeline: {merged[1]}")
+
+    stamp.write_text(time.strftime("%a %b %d %H:%M:%S %Z %Y") + "\n", encoding="utf-8")
+    log(f"🎉 Daily pipeline complete for {date}")
+    log(f"   Manifests: {work_dir}/bundle.json + bundle_en.json")
+    log(f"   QR:        {work_dir}/qr.png + qr_en.png")
+    log(f"   Web:      https://sixwandsstudios.com/news/{date}/")
+    log(f"   Timeline:  {work_dir}/timeline.html")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    args.date = args.date or today_eastern()
+    work_dir = WORK_ROOT / args.date
+    work_dir.mkdir(parents=True, exist_ok=True)
+    with tee_output(work_dir / "run.log"):
+        return run(args, work_dir)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,15 @@
 #!/usr/bin/env bash
 #
-# Daily news pipeline driver. Runs steps 0→6 (incl. 2b translate) in sequence. Logs all output to
-# work/<date>/run.log AND echoes to stdout. Exits non-zero on any step failure.
+# Daily news pipeline driver. Runs steps 0→6 (incl. 2b translate) in sequence,
+# all in one Python process (run.py). Logs all output to work/<date>/run.log
+# AND echoes to stdout. Exits non-zero on any step failure.
 #
 # Usage:
 #   ./run_daily.sh                  # today (Eastern), dry-run by default
 #   ./run_daily.sh --commit         # actually spend on Claude + ElevenLabs + S3
 #   ./run_daily.sh --date 2026-05-24 --commit
+#   ./run_daily.sh --stream --commit   # steps 2→2b→3 pipelined per story
+#   ./run_daily.sh --verify --commit   # + Whisper check of new turns after step 3
 #
 # Pre-reqs:
 #   - source the .env at the repo root so ANTHROPIC_API_KEY and
@@ -25,29 +28,9 @@ PY="$HOME/.pyenv/versions/six_wands_language_mirror/bin/python"
 export PATH="/opt/homebrew/bin:/usr/local/bin:$PATH"
 REPO_ROOT="$(cd "$HERE/.." && pwd)"
 
-COMMIT_FLAG=""
-DATE=""
-
-while [ $# -gt 0 ]; do
-    case "$1" in
-        --commit) COMMIT_FLAG="--commit"; shift ;;
-        --date)   DATE="$2"; shift 2 ;;
-        --help|-h)
-            sed -n '2,15p' "$0"
-            exit 0
-            ;;
-        *) echo "Unknown arg: $1" >&2; exit 1 ;;
-    esac
-done
-
-if [ -z "$DATE" ]; then
-    # Default to today in US/Eastern (matches step scripts)
-    DATE=$(TZ=America/New_York date +%Y-%m-%d)
-fi
-
-WORK_DIR="$HERE/work/$DATE"
-mkdir -p "$WORK_DIR"
-LOG="$WORK_DIR/run.log"
+case "${1:-}" in
+    --help|-h) sed -n '2,18p' "$0"; exit 0 ;;
+esac
 
 # Source secrets from the repo root .env if it exists
 if [ -f "$REPO_ROOT/.env" ]; then
@@ -57,58 +40,8 @@ if [ -f "$REPO_ROOT/.env" ]; then
     set +a
 fi
 
-log() { echo "[$(date +%H:%M:%S)] $*" | tee -a "$LOG"; }
-
-step() {
-    local label="$1"; shift
-    log "═══ $label ═══"
-    if "$@" 2>&1 | tee -a "$LOG"; then
-        log "✓ $label"
-    else
-        log "❌ $label failed"
-        exit 1
-    fi
-}
-
-log "═══════════════════════════════════════════════════════════"
-log "  Daily news pipeline · date=$DATE · commit=${COMMIT_FLAG:-NO}"
-log "  Log: $LOG"
-log "═══════════════════════════════════════════════════════════"
-
-# Idempotence guard: launchd can fire twice on unusual sleep/wake patterns
-# (e.g. a suspended run resuming + the missed 08:00 event coalescing on a
-# later wake, seen 2026-07-13). If today already completed, exit quietly.
-STAMP="$WORK_DIR/.completed"
-if [ -f "$STAMP" ] && [ "${FORCE_RERUN:-}" != "1" ]; then
-    log "⏭ $DATE already completed at $(cat "$STAMP") — skipping duplicate run (FORCE_RERUN=1 overrides)"
-    exit 0
-fi
-
-step "0/7 fetch feeds"   "$PY" "$HERE/0_fetch_feeds.py" --date "$DATE"
-step "1/7 curate"        "$PY" "$HERE/1_curate.py" --date "$DATE" $COMMIT_FLAG
-[ -n "$COMMIT_FLAG" ] || { log "(dry-run mode — stopping after step 1; re-run with --commit to continue)"; exit 0; }
-# Two editions from one curate pass (ENGLISH_NEWS_EDITION_SPEC.md):
-#   ko — Korean-audio pack for English speakers (news_latest)
-#   en — English-audio pack for Korean learners (news_en_latest)
-for ED in ko en; do
-    step "2/7 generate script ($ED)" "$PY" "$HERE/2_generate_script.py" --date "$DATE" --edition "$ED" $COMMIT_FLAG
-    step "2b/7 translate easy ($ED)" "$PY" "$HERE/2b_translate_easy.py" --date "$DATE" --edition "$ED"
-    step "3/7 synthesize ($ED)"      "$PY" "$HERE/3_synthesize.py" --date "$DATE" --edition "$ED" $COMMIT_FLAG
-    step "4/7 assemble bundle ($ED)" "$PY" "$HERE/4_assemble_bundle.py" --date "$DATE" --edition "$ED"
-    step "5/7 publish s3 ($ED)"      "$PY" "$HERE/5_publish_s3.py" --date "$DATE" --edition "$ED" $COMMIT_FLAG
-done
-step "6/7 deploy web (ko)" "$PY" "$HERE/6_deploy_news_page.py" --date "$DATE" $COMMIT_FLAG
-
-# Aggregate per-step cost reports into a single cost_history entry
-python3 -c "
-from pathlib import Path
-from cost_tracker import finalize_run
-out = finalize_run(Path('$WORK_DIR'), Path('$HERE/cache'), '$DATE')
-print(f'💰 Cost ledger: {out}')
-" 2>&1 | tee -a "$LOG"
-
-date > "$STAMP"
-log "🎉 Daily pipeline complete for $DATE"
-log "   Manifests: $WORK_DIR/bundle.json + bundle_en.json"
-log "   QR:        $WORK_DIR/qr.png + qr_en.png"
-log "   Web:      https://sixwandsstudios.com/news/$DATE/"
+# Steps, logging, the .completed idempotence stamp, steps.tsv and the
+# cost / trace finalize all live in run.py now — one interpreter for the
+# whole run instead of one per step.
+cd "$REPO_ROOT"
+exec "$PY" -m daily_news_pipeline.run "$@"
@@ -0,0 +1,96 @@
+"""
+Greedy set cover for example selection: which examples to keep so that
+today's vocab is covered by as few of them as possible.
+
+Same choice rule as the original rescan-every-candidate loop in
+apply_library_reuse — each pick is the candidate covering the most
+still-uncovered terms, ties going to the earliest candidate — but indexed:
+
+  - `ExampleIndex` keeps an inverted index term → candidate ids, so a query
+    only touches candidates that cover at least one of its terms;
+  - coverage is an int bitset over the query's terms, so a gain is
+    `(mask & remaining).bit_count()`;
+  - lazy greedy: candidates sit in a max-heap keyed by their last known gain.
+    Gains only shrink as terms get covered, so a popped candidate whose
+    recomputed gain still equals its key is the true best (any earlier
+    candidate with that gain would have been popped first).
+
+bench_set_cover.py checks the picks against the naive loop and times both
+on synthetic 10k / 100k-example libraries.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Iterable
+
+from vocab_matcher import VocabMatcher
+
+
+class ExampleIndex:
+    """Inverted index of examples by the vocab terms they cover. Example ids
+    are insertion positions (0, 1, 2, ...)."""
+
+    def __init__(self) -> None:
+        self.postings: dict[str, list[int]] = {}
+        self.size = 0
+
+    def add(self, terms: Iterable[str]) -> int:
+        """Index one example by the terms it covers; returns its id."""
+        idx = self.size
+        self.size += 1
+        for term in dict.fromkeys(terms):
+            self.postings.setdefault(term, []).append(idx)
+        return idx
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], matcher: VocabMatcher) -> "ExampleIndex":
+        """Index raw example texts by the matcher's terms they contain."""
+        index = cls()
+        for ids in matcher.coverage(texts):
+            index.add(matcher.terms[i] for i in sorted(ids))
+        return index
+
+    def masks(self, terms: list[str]) -> dict[int, int]:
+        """id → bitset of `terms` (bit i = terms[i]) for every example that
+        covers at least one of them."""
+        out: dict[int, int] = {}
+        for bit, term in enumerate(terms):
+            flag = 1 << bit
+            for idx in self.postings.get(term, ()):
+                out[idx] = out.get(idx, 0) | flag
+        return out
+
+    def cover(self, terms: list[str], wanted: Iterable[str],
+              max_picks: int) -> tuple[list[int], set[str]]:
+        """Greedily pick up to `max_picks` examples covering `wanted` (a
+        subset of `terms`). Returns (picked ids in pick order, terms still
+        uncovered)."""
+        terms = list(dict.fromkeys(terms))
+        wanted = set(wanted)
+        bits = {t: 1 << i for i, t in enumerate(terms)}
+        target = 0
+        for term in wanted:
+            target |= bits.get(term, 0)
+        picks, left = lazy_greedy(self.masks(terms), target, max_picks)
+        still = {t for t in wanted if t not in bits or left & bits[t]}
+        return picks, still
+
+
+def lazy_greedy(masks: dict[int, int], target: int, max_picks: int) -> tuple[list[int], int]:
+    """Lazy-greedy set cover over bitsets. Returns (picked ids, uncovered bits)."""
+    heap = [(-(m & target).bit_count(), idx, m) for idx, m in masks.items() if m & target]
+    heapq.heapify(heap)
+    picks: list[int] = []
+    remaining = target
+    while heap and remaining and len(picks) < max_picks:
+        neg_gain, idx, mask = heapq.heappop(heap)
+        gain = (mask & remaining).bit_count()
+        if gain == 0:
+            continue
+        if gain == -neg_gain:
+            picks.append(idx)
+            remaining &= ~mask
+        else:
+            heapq.heappush(heap, (-gain, idx, mask))
+    return picks, remaining
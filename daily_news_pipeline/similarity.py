@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Transcript-vs-script similarity for verify_whisper.py.
+
+The score is the normalized indel similarity of the two normalized texts:
+2 × LCS / (len(a) + len(b)). That is the formula difflib's
+SequenceMatcher.ratio() approximates, but computed exactly (no autojunk,
+no greedy matching-block heuristic), so the KO/EN thresholds keep their
+meaning. rapidfuzz's C implementation is used when installed; otherwise a
+bit-parallel LCS over Python ints (one big-int op per character of the
+longer text) is still far faster than SequenceMatcher.
+
+Korean extras:
+  - jamo_similarity() scores on decomposed jamo (ㅎ ㅐ ㅆ, not 했), so a
+    near-homophone Whisper slip (했 / 햇) loses a third of a syllable, not a
+    whole one. Reported next to the score for flagged Korean turns.
+  - diff_spans() aligns two texts and returns the edit spans the report
+    renders as `[-expected-]{+whisper+}`.
+
+Library use:
+    from similarity import normalize, similarity, score_pairs, diff_spans
+    scores = score_pairs([(expected, transcript), ...])   # normalizes each text once
+
+CLI (debug one pair):
+    python similarity.py "오늘 날씨가 좋네요" "오늘 날씨 좋네요"
+"""
+
+from __future__ import annotations
+
+import difflib
+import re
+import sys
+
+try:
+    from rapidfuzz.distance import Indel as _Indel
+except ImportError:  # optional speedup; the pure-Python path gives identical scores
+    _Indel = None
+
+# Whisper output and our script text differ in trivial ways (punctuation,
+# spacing, casing). Normalize both before comparing so the similarity score
+# reflects actual content mismatches.
+_PUNCT_RE = re.compile(r"[、。，．！？!?,.…\"'\"\"`·:;()\[\]\{\}\-—–_/]")
+_WS_RE = re.compile(r"\s+")
+
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+
+
+def normalize(text: str) -> str:
+    text = text.lower()
+    text = _PUNCT_RE.sub("", text)
+    text = _WS_RE.sub(" ", text)
+    return text.strip()
+
+
+def to_jamo(text: str) -> str:
+    """Decompose precomposed Hangul syllables into conjoining jamo
+    (lead, vowel, optional tail); everything else passes through."""
+    out: list[str] = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            s = code - _HANGUL_BASE
+            out.append(chr(0x1100 + s // 588))
+            out.append(chr(0x1161 + (s % 588) // 28))
+            if s % 28:
+                out.append(chr(0x11A7 + s % 28))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def lcs_length(a: str, b: str) -> int:
+    """Length of the longest common subsequence (Hyyrö's bit-parallel
+    algorithm: bit i of `v` tracks column i of the DP row for `b`)."""
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    masks: dict[str, int] = {}
+    for i, ch in enumerate(b):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    full = (1 << len(b)) - 1
+    v = full
+    for ch in a:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(b) - v.bit_count()
+
+
+def indel_ratio(a: str, b: str) -> float:
+    """2 × LCS / (len(a) + len(b)) on already-normalized text; 1.0 for two
+    empty strings."""
+    if _Indel is not None:
+        return _Indel.normalized_similarity(a, b)
+    total = len(a) + len(b)
+    return 2 * lcs_length(a, b) / total if total else 1.0
+
+
+def similarity(a: str, b: str) -> float:
+    return indel_ratio(normalize(a), normalize(b))
+
+
+def jamo_similarity(a: str, b: str) -> float:
+    return indel_ratio(to_jamo(normalize(a)), to_jamo(normalize(b)))
+
+
+def score_pairs(pairs: list[tuple[str, str]]) -> list[float]:
+    """similarity() for many (expected, transcript) pairs, normalizing each
+    distinct text once (script lines and transcripts repeat across turns)."""
+    normalized: dict[str, str] = {}
+
+    def norm(text: str) -> str:
+        if text not in normalized:
+            normalized[text] = normalize(text)
+        return normalized[text]
+
+    return [indel_ratio(norm(a), norm(b)) for a, b in pairs]
+
+
+def diff_spans(a: str, b: str) -> list[tuple[str, str, str]]:
+    """Align normalized `a` and `b`; returns (tag, a_text, b_text) runs with
+    tag in equal / replace / delete / insert, adjacent delete + insert
+    merged into replace."""
+    a, b = normalize(a), normalize(b)
+    if _Indel is not None:
+        ops = [(op.tag, op.src_start, op.src_end, op.dest_start, op.dest_end)
+               for op in _Indel.opcodes(a, b)]
+    else:
+        ops = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    spans: list[tuple[str, str, str]] = []
+    for tag, i1, i2, j1, j2 in ops:
+        piece = (tag, a[i1:i2], b[j1:j2])
+        if spans and tag != "equal" and spans[-1][0] != "equal":
+            _, pa, pb = spans.pop()
+            piece = ("replace", pa + piece[1], pb + piece[2])
+        spans.append(piece)
+    return spans
+
+
+def render_diff(spans: list[tuple[str, str, str]]) -> str:
+    """`[-expected-]{+whisper+}` markup for the markdown report."""
+    out: list[str] = []
+    for tag, a, b in spans:
+        if tag == "equal":
+            out.append(a)
+            continue
+        if a:
+            out.append(f"[-{a}-]")
+        if b:
+            out.append(f"{{+{b}+}}")
+    return "".join(out)
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 2:
+        print("usage: python similarity.py EXPECTED TRANSCRIPT")
+        return 1
+    a, b = argv
+    print(f"similarity:      {similarity(a, b):.3f}  (engine: {'rapidfuzz' if _Indel else 'bit-parallel LCS'})")
+    print(f"jamo similarity: {jamo_similarity(a, b):.3f}")
+    print(f"difflib ratio:   {difflib.SequenceMatcher(None, normalize(a), normalize(b)).ratio():.3f}")
+    print(f"diff:            {render_diff(diff_spans(a, b))}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,160 @@
+"""
+Asset build for step 6's website upload: what goes to s3://sixwandsstudios.com/
+is built from the site-tree files into work/<date>/site/ first.
+
+  - HTML is minified (comments dropped, whitespace runs collapsed; <pre>,
+    <textarea>, <script> and <style> left alone), JSON re-serialized compact.
+  - Text assets are pre-compressed: the object at the page's own key is the
+    gzip body, served with `Content-Encoding: gzip` (every browser and the
+    app accept it). No brotli variants: nothing at the CDN would pick them
+    by Accept-Encoding.
+  - The QR PNG is re-encoded 1-bit with Pillow's optimizer and given a
+    content-hashed name (qr.<hash>.png) the day page links to, so it can be
+    cached for a year. remove_stale_qrs() drops a day's earlier hashes from
+    the site tree when a redeploy changes the QR.
+  - Cache-Control per asset: IMMUTABLE for hashed files, SHORT for the day
+    page, meta.json and the rolling archive page / index / feed.
+
+The site tree itself (git-versioned) keeps the readable, uncompressed
+files.
+
+    qr = build_qr(work_dir / "qr.png", build_dir)          # qr.3f9c0a1b2d.png
+    assets = build([(day_html, "news/<date>/index.html", SHORT), ...], build_dir)
+    upload(dest, assets)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import aws_clients
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+SHORT = "public, max-age=300"
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+    ".png": "image/png",
+}
+COMPRESSIBLE = (".html", ".json")
+
+_RAW_BLOCK = re.compile(r"(<(pre|textarea|script|style)\b.*?</\2\s*>)", re.S | re.I)
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.S)
+_SPACE = re.compile(r"\s+")
+
+
+@dataclass
+class Asset:
+    """One object to upload: `path` holds the exact bytes (already
+    compressed when `content_encoding` is set)."""
+    key: str
+    path: Path
+    content_type: str
+    cache_control: str
+    content_encoding: str | None = None
+
+
+def minify_html(text: str) -> str:
+    """Drop comments and collapse whitespace runs to one space outside raw
+    blocks. Never removes whitespace entirely, so inline layout is kept."""
+    parts = _RAW_BLOCK.split(text)
+    out = []
+    # split() with two groups yields [text, block, tag, text, block, tag, ...].
+    for i in range(0, len(parts), 3):
+        out.append(_SPACE.sub(" ", _COMMENT.sub("", parts[i])))
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return "".join(out).strip() + "\n"
+
+
+def hashed_name(path: Path, digest_len: int = 10) -> str:
+    """qr.png → qr.<sha256 prefix>.png."""
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:digest_len]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+def build_qr(src: Path, out_dir: Path) -> Path:
+    """Optimized copy of the QR PNG under its content-hashed name."""
+    from PIL import Image
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / src.name
+    with Image.open(src) as im:
+        # A QR code is pure black/white: 1-bit is lossless and ~8× smaller
+        # than the RGB / palette image qrcode writes.
+        gray = im.convert("L")
+        if gray.getcolors(2) is not None:
+            gray.convert("1", dither=Image.Dither.NONE).save(tmp, optimize=True)
+        else:
+            im.save(tmp, optimize=True)
+    if tmp.stat().st_size >= src.stat().st_size:
+        shutil.copyfile(src, tmp)
+    out = out_dir / hashed_name(tmp)
+    tmp.replace(out)
+    return out
+
+
+def remove_stale_qrs(day_dir: Path, keep: Path) -> list[Path]:
+    """Delete the day's other qr.<hash>.png files (an earlier deploy's QR)
+    from the local site tree. Returns what was removed."""
+    stale = [p for p in day_dir.glob("qr.*.png") if p.name != keep.name]
+    for p in stale:
+        p.unlink()
+    return stale
+
+
+def build(entries: list[tuple[Path, str, str]], out_dir: Path) -> list[Asset]:
+    """(local file, key, Cache-Control) → the assets to upload, written
+    under `out_dir` by key."""
+    assets = []
+    for src, key, cache_control in entries:
+        content_type = CONTENT_TYPES.get(src.suffix, "application/octet-stream")
+        out = out_dir / key
+        out.parent.mkdir(parents=True, exist_ok=True)
+        if src.suffix not in COMPRESSIBLE:
+            shutil.copyfile(src, out)
+            assets.append(Asset(key, out, content_type, cache_control))
+            continue
+        text = src.read_text(encoding="utf-8")
+        if src.suffix == ".html":
+            body = minify_html(text).encode("utf-8")
+        else:
+            body = json.dumps(json.loads(text), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        # mtime=0: the same page gives the same bytes (and ETag) on a re-run.
+        out.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+        assets.append(Asset(key, out, content_type, cache_control, "gzip"))
+    return assets
+
+
+def report(entries: list[tuple[Path, str, str]], assets: list[Asset]) -> list[str]:
+    """Source → uploaded size per key, for the step log."""
+    sizes = {key: src.stat().st_size for src, key, _ in entries}
+    return [f"{a.key:40s} {sizes.get(a.key, 0):>8,d} → {a.path.stat().st_size:>8,d} B"
+            f"  {a.content_encoding or '-':4s} {a.cache_control}"
+            for a in assets]
+
+
+def upload(dest, assets: list[Asset]) -> None:
+    """PUT each asset with its headers and check it landed (HEAD size and
+    encoding), one at a time in list order, so `assets` must list linked-to
+    objects before the pages linking to them (build() keeps entry order).
+    The caller has already run publisher's clobber gate over these keys."""
+    s3 = aws_clients.client("s3")
+    for a in assets:
+        extra = {"ContentType": a.content_type, "CacheControl": a.cache_control}
+        if a.content_encoding:
+            extra["ContentEncoding"] = a.content_encoding
+        s3.upload_file(str(a.path), dest.bucket, a.key, ExtraArgs=extra)
+        head = s3.head_object(Bucket=dest.bucket, Key=a.key)
+        size = a.path.stat().st_size
+        if head["ContentLength"] != size or head.get("ContentEncoding") != a.content_encoding:
+            raise SystemExit(f"❌ Post-flight: s3://{dest.bucket}/{a.key} is {head['ContentLength']} B "
+                             f"({head.get('ContentEncoding')}), expected {size} B ({a.content_encoding}).")
+        print(f"   ✓ {a.key}")
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Steps 2 → 2b → 3, pipelined per story.
+
+The stage-at-a-time driver makes every story clear step 2 before the first
+turn is synthesized. Here each story × edition moves through
+
+    script → QA → verbatim gate → library → 2b translate → synth
+
+on its own, as soon as its previous stage finishes, so story 1 is in TTS
+while story 4 is still being scripted. The critical path becomes one story's
+chain (plus the short in-order library section) instead of the sum of the
+three steps; steps 4-6 then run unchanged on the outputs.
+
+The step modules do the work — this file only sequences them:
+
+  - 2_generate_script.generate_story / finish_story  (script, QA, gate, library)
+  - 2b_translate_easy.translate_story                 (easy-summary gloss)
+  - voicebox.synth_pack + 3_synthesize.write_legacy_outputs, one story at a time
+
+Ordering: the library section (gloss locking, example reuse, record_vocab)
+still runs in story order per edition — story N waits for story N-1's
+library section, not for its audio. Synth's library audio attachments are
+recorded per story and applied, in story order, only once every story has
+finished (finish_edition), so no story's library reuse can see another
+story's audio — script.json and the Lexicon come out as a stage-at-a-time
+run would write them.
+
+--concurrency caps the story × edition chains in flight; the provider calls
+themselves are capped by llm_providers.GOVERNOR. The first failing chain
+cancels the ones that haven't started.
+
+Spend gate: stories arrive one at a time, so --max-chars (and the provider
+balance, when readable) is enforced cumulatively: each story's cache-miss
+chars are debited against the cap before its TTS calls are made.
+
+Output (same files as steps 2 / 2b / 3, plus incremental progress):
+    work/<date>/script{,_en}.json
+    work/<date>/audio{,_en}/...                      (per story, as each finishes)
+    work/<date>/audio{,_en}/voicebox.manifest.json   (merged across stories)
+    work/<date>/stream/<ed>/<story_id>.json          (story + last stage reached)
+    work/<date>/checkpoints/<ed>/                    (same per-story checkpoints as steps 2 / 2b)
+    work/<date>/costs/{2_generate_script,2b_translate_easy,3_synthesize}{,_en}.json
+
+Usage:
+    python stream_daily.py [--date YYYY-MM-DD] [--edition ko|en]
+                           [--tts polly|elevenlabs] [--max-chars N]
+                           [--concurrency N] [--tts-concurrency N] [--no-qa] [--commit]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import importlib
+import json
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from studypack.adapters import news as news_adapter
+from voicebox import key_params, remaining_credits, synth_pack
+
+from lexicon import Lexicon
+
+import artifacts
+import edition
+import tracing
+from checkpoints import Checkpoints
+from cost_tracker import StepCostRecorder
+from llm_providers import LLMProvider, provider_for_step, max_tokens_for_step
+
+# Numbered step modules aren't importable with a plain `import` statement.
+gen = importlib.import_module("2_generate_script")
+translate = importlib.import_module("2b_translate_easy")
+synth = importlib.import_module("3_synthesize")
+
+HERE = Path(__file__).resolve().parent
+WORK_ROOT = HERE / "work"
+DEFAULT_LLM_CONFIG = HERE / "llm.yaml"
+DEFAULT_TTS_CONFIG = HERE / "tts.yaml"
+DEFAULT_TTS_CONCURRENCY = 2  # stories synthesizing at once (provider concurrency limits)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Pipelined steps 2 → 2b → 3, one story at a time")
+    p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
+    p.add_argument("--edition", choices=edition.EDITIONS,
+                   help="Only this edition (default: both)")
+    p.add_argument("--llm-config", type=Path, default=DEFAULT_LLM_CONFIG, help="llm.yaml path")
+    p.add_argument("--tts-config", type=Path, default=DEFAULT_TTS_CONFIG, help="tts.yaml path")
+    p.add_argument("--tts", help="Override provider from tts.yaml (polly | elevenlabs)")
+    p.add_argument("--max-chars", type=int, default=synth.DEFAULT_MAX_CHARS,
+                   help="Abort if freshly-debited (cache-miss) chars across the run would exceed this.")
+    p.add_argument("--concurrency", type=int,
+                   help="Max story × edition chains in flight (default: llm.yaml max_concurrent_calls)")
+    p.add_argument("--tts-concurrency", type=int, default=DEFAULT_TTS_CONCURRENCY,
+                   help=f"Max stories synthesizing at once (default {DEFAULT_TTS_CONCURRENCY})")
+    p.add_argument("--no-qa", action="store_true", help="Skip the QA review pass")
+    p.add_argument("--fresh", action="store_true",
+                   help="Ignore per-story checkpoints from an earlier run")
+    p.add_argument("--commit", action="store_true", help="Actually call the LLM and TTS providers.")
+    return p.parse_args(argv)
+
+
+class Turnstile:
+    """Admits story i only after stories 0..i-1 have passed through."""
+
+    def __init__(self) -> None:
+        self._next = 0
+        self._cv = threading.Condition()
+
+    @contextmanager
+    def turn(self, i: int):
+        with self._cv:
+            self._cv.wait_for(lambda: self._next == i)
+        try:
+            yield
+        finally:
+            with self._cv:
+                self._next += 1
+                self._cv.notify_all()
+
+
+class CharBudget:
+    """Cumulative cache-miss char cap shared by every story's synth."""
+
+    def __init__(self, cap: int) -> None:
+        self.cap = cap
+        self.debited = 0
+        self._lock = threading.Lock()
+
+    def debit(self, chars: int, tag: str) -> None:
+        with self._lock:
+            if self.debited + chars > self.cap:
+                raise SystemExit(f"❌ {tag}: debiting {chars} more chars would take the run to "
+                                 f"{self.debited + chars}, over the cap of {self.cap} — aborting "
+                                 f"(already-synthesized turns are cached).")
+            self.debited += chars
+
+
+@dataclass
+class EditionStream:
+    """Per-edition state shared by that edition's story workers."""
+    run: "gen.EditionRun"
+    library: Lexicon
+    llm_translate: LLMProvider
+    max_tokens_translate: int
+    tr_recorder: StepCostRecorder
+    synth_recorder: StepCostRecorder
+    out_dir: Path
+    header: dict
+    library_lock: threading.Lock = field(default_factory=threading.Lock)
+    turnstile: Turnstile = field(default_factory=Turnstile)
+    outputs: dict[int, dict] = field(default_factory=dict)
+    manifests: dict[int, dict] = field(default_factory=dict)
+    attachments: dict[int, "DeferredAttachments"] = field(default_factory=dict)
+    dropped: int = 0
+
+    @property
+    def ed(self) -> str:
+        return self.run.ed
+
+
+@dataclass
+class Synth:
+    """TTS settings shared by every story."""
+    cfg: dict
+    pause_ms: int
+    kp: object
+    budget: CharBudget
+    slots: threading.BoundedSemaphore
+
+
+class DeferredAttachments:
+    """Stands in for the Lexicon in write_legacy_outputs: records the audio
+    attachments so finish_edition can apply them after every story's library
+    section has run."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple]] = []
+
+    def attach_vocab_audio(self, *args) -> None:
+        self.calls.append(("attach_vocab_audio", args))
+
+    def attach_example_audio(self, *args) -> None:
+        self.calls.append(("attach_example_audio", args))
+
+    def apply(self, library: Lexicon) -> None:
+        for name, args in self.calls:
+            getattr(library, name)(*args)
+
+
+def write_progress(es: EditionStream, story: dict, stage: str, t0: float) -> None:
+    """Per-story work product: the story as of its last completed stage."""
+    path = WORK_ROOT / es.run.date / "stream" / es.ed / f"{story['story_id']}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    artifacts.write_json(path, {"stage": stage, "elapsed_s": round(time.monotonic() - t0, 1),
+                                "story": story})
+
+
+def synth_story(es: EditionStream, sy: Synth, i: int, story: dict) -> None:
+    """Step 3 for a single story: its own one-story pack through voicebox,
+    mapped into the shared legacy audio/ layout."""
+    story_id = story["story_id"]
+    tag = f"[{es.ed}/{story_id}]"
+    one = {**es.header, "stories": [story]}
+    try:
+        pack, warnings = news_adapter.convert(one)
+    except news_adapter.LegacyFormatError as e:
+        raise SystemExit(f"❌ {tag} {e}")
+    for w in warnings:
+        print(f"  ⚠ {tag} studypack: {w}", file=sys.stderr)
+
+    vb_dir = es.out_dir / "vb" / story_id
+    plan = synth_pack(pack, sy.cfg, vb_dir, commit=False)
+    sy.budget.debit(plan["costs"]["chars_debited"], tag)
+    print(f"   🔊 {tag} synthesizing {plan['costs']['calls']} turns "
+          f"({plan['costs']['cache_hits']} cached, {plan['costs']['chars_debited']} chars to debit)")
+    with sy.slots:
+        with tracing.span(f"voicebox synth {es.ed}/{story_id}", "tts", turns=plan["costs"]["calls"],
+                          synthesized=plan["costs"]["synthesized"],
+                          chars_debited=plan["costs"]["chars_debited"]):
+            manifest = synth_pack(pack, sy.cfg, vb_dir, commit=True, concat=True)
+    attachments = DeferredAttachments()
+    with es.library_lock, tracing.span(f"legacy outputs {es.ed}/{story_id}", "io"):
+        synth.write_legacy_outputs(manifest, one, vb_dir, es.out_dir, sy.pause_ms,
+                                   attachments, es.synth_recorder, sy.kp)
+    es.attachments[i] = attachments
+    es.manifests[i] = manifest
+
+
+def run_story(es: EditionStream, sy: Synth, i: int, s: dict, *, no_qa: bool, t0: float) -> None:
+    """One story × edition, end to end."""
+    g = failure = None
+    try:
+        g = gen.generate_story(es.run, s, no_qa=no_qa)
+    except BaseException as e:  # incl. SystemExit — later stories must not wait forever
+        failure = e
+    with es.turnstile.turn(i):
+        if failure is None and g is None:
+            es.dropped += 1
+        elif failure is None:
+            with es.library_lock:
+                story = gen.finish_or_reuse(es.run, s, g, es.library)
+    if failure is not None:
+        raise failure
+    if g is None:
+        return
+    write_progress(es, story, "scripted", t0)
+
+    translate.translate_story(story, es.ed, es.llm_translate, es.max_tokens_translate,
+                              es.tr_recorder, checkpoints=es.run.checkpoints)
+    es.outputs[i] = story
+    write_progress(es, story, "translated", t0)
+
+    synth_story(es, sy, i, story)
+    write_progress(es, story, "synthesized", t0)
+    print(f"   ⏱ [{es.ed}/{s['story_id']}] done at +{time.monotonic() - t0:.0f}s")
+
+
+def merge_manifests(manifests: list[tuple[str, dict]]) -> dict:
+    """One voicebox manifest for the edition, as a single whole-pack
+    synth_pack would have written it; per-story staging paths are prefixed
+    with the story's subdirectory."""
+    merged = {k: v for k, v in manifests[0][1].items() if k not in ("groups", "costs")}
+    merged["groups"] = []
+    costs: dict = {}
+    for sub, m in manifests:
+        for group in m["groups"]:
+            merged["groups"].append({
+                **group,
+                "track_file": f"{sub}/{group['track_file']}",
+                "spans": [{**span, "file": f"{sub}/{span['file']}"} for span in group["spans"]],
+            })
+        for k, v in m["costs"].items():
+            if isinstance(v, (int, float)):
+                costs[k] = costs.get(k, 0) + v
+    merged["costs"] = costs
+    return merged
+
+
+def finish_edition(es: EditionStream, n_stories: int) -> None:
+    """Write script.json, the merged manifest, the library (with synth's
+    audio attachments, in story order), and cost reports."""
+    ed, date, sfx = es.ed, es.run.date, es.run.sfx
+    order = sorted(es.outputs)
+    stories = [es.outputs[i] for i in order]
+    if es.dropped:
+        print(f"⚠ [{ed}] Copyright gate dropped {es.dropped} story(ies). {len(stories)} remain.")
+    if not stories:
+        raise SystemExit(f"❌ [{ed}] No stories survived the copyright gate — refusing to write "
+                         "an empty bundle. Re-run (fresh sources) or lower the risk.")
+
+    out_path = WORK_ROOT / date / f"script{sfx}.json"
+    payload = {
+        **es.header,
+        "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "stories": stories,
+    }
+    artifacts.write_json(out_path, payload)
+
+    manifest = merge_manifests([(es.outputs[i]["story_id"], es.manifests[i]) for i in order])
+    (es.out_dir / "voicebox.manifest.json").write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    shutil.rmtree(es.out_dir / "vb", ignore_errors=True)
+
+    for i in order:
+        es.attachments[i].apply(es.library)
+    es.library.save()
+    es.run.checkpoints.flush()
+    es.run.recorder.extra["checkpoints"] = es.run.checkpoints.report()
+    for recorder in (es.run.recorder, es.tr_recorder, es.synth_recorder):
+        recorder.write()
+    ct = manifest["costs"]
+    print(f"✅ [{ed}] Wrote {out_path} ({len(stories)}/{n_stories} stories) and {es.out_dir}")
+    print(f"   [{ed}] TTS: {ct['chars_debited']} chars debited, "
+          f"{ct['cache_hits']}/{ct['calls']} turns from cache")
+    print(f"   {es.run.checkpoints.summary()}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    date = args.date or synth.today_eastern()
+
+    chosen_path = WORK_ROOT / date / "chosen.json"
+    if not chosen_path.exists():
+        raise SystemExit(f"❌ chosen.json not found at {chosen_path}. Run step 1 first.")
+    stories = artifacts.read_json(chosen_path)["stories"]
+    editions = [args.edition] if args.edition else list(edition.EDITIONS)
+
+    if not args.llm_config.exists():
+        raise SystemExit(f"❌ llm.yaml not found: {args.llm_config}")
+    llm_cfg = artifacts.load_yaml(args.llm_config)
+    concurrency = args.concurrency or int(llm_cfg.get("max_concurrent_calls", gen.DEFAULT_CONCURRENCY))
+
+    if not args.tts_config.exists():
+        raise SystemExit(f"❌ tts config not found: {args.tts_config}")
+    tts_cfg = artifacts.load_yaml(args.tts_config)
+    if args.tts:
+        tts_cfg["provider"] = args.tts
+    if not tts_cfg.get("provider"):
+        raise SystemExit("❌ No TTS provider configured. Set `provider:` in tts.yaml or pass --tts.")
+
+    print(f"═══ Streaming script → translate → synth for {date} (edition: {', '.join(editions)}) ═══")
+    print(f"  Stories:        {len(stories)} × {len(editions)} edition(s)")
+    print(f"  Chains:         {concurrency} story × edition chains in flight")
+    print(f"  TTS:            {tts_cfg['provider']}, {args.tts_concurrency} stories at once, "
+          f"cap {args.max_chars} debited chars")
+    print()
+
+    if not args.commit:
+        print("--- DRY RUN — no LLM or TTS calls will be made ---")
+        print("Run steps 2 / 2b / 3 individually for their detailed dry-run plans,")
+        print("or re-run with --commit to stream.")
+        return 0
+
+    cap = args.max_chars
+    remaining = remaining_credits(tts_cfg)
+    if remaining is not None:
+        print(f"  Provider balance: {remaining} credits remaining")
+        cap = min(cap, remaining)
+    else:
+        print("  Provider balance: unknown (no user_read permission?) — proceeding")
+
+    work_date_dir = WORK_ROOT / date
+    tracing.start_step(f"stream_daily{edition.suffix(args.edition)}" if args.edition
+                       else "stream_daily", work_date_dir)
+    llm_script = provider_for_step("script", llm_cfg)
+    llm_qa = None if args.no_qa else provider_for_step("qa_review", llm_cfg)
+    llm_translate = provider_for_step("translate_easy", llm_cfg)
+    sy = Synth(
+        cfg=tts_cfg,
+        pause_ms=int(tts_cfg.get("inter_turn_pause_ms", 400)),
+        kp=key_params(tts_cfg["provider"], tts_cfg),
+        budget=CharBudget(cap),
+        slots=threading.BoundedSemaphore(max(1, args.tts_concurrency)),
+    )
+
+    streams = []
+    for ed in editions:
+        sfx = edition.suffix(ed)
+        run = gen.EditionRun(
+            ed=ed, date=date,
+            recorder=StepCostRecorder(f"2_generate_script{sfx}", work_date_dir),
+            llm_script=llm_script,
+            max_tokens_script=max_tokens_for_step("script", llm_cfg, default=4096),
+            llm_qa=llm_qa,
+            max_tokens_qa=max_tokens_for_step("qa_review", llm_cfg, default=4096),
+            checkpoints=Checkpoints(work_date_dir, ed, enabled=not args.fresh),
+        )
+        out_dir = work_date_dir / f"audio{sfx}"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        streams.append(EditionStream(
+            run=run,
+            library=artifacts.lexicon(ed),
+            llm_translate=llm_translate,
+            max_tokens_translate=max_tokens_for_step("translate_easy", llm_cfg),
+            tr_recorder=StepCostRecorder(f"2b_translate_easy{sfx}", work_date_dir),
+            synth_recorder=StepCostRecorder(f"3_synthesize{sfx}", work_date_dir),
+            out_dir=out_dir,
+            header=gen.script_header(ed, date),
+        ))
+
+    t0 = time.monotonic()
+    jobs = [(es, i, s) for es in streams for i, s in enumerate(stories)]
+    # Jobs start in submission order, so a story waiting at its edition's
+    # turnstile only ever waits on stories that are already running.
+    pool = ThreadPoolExecutor(max_workers=max(1, min(len(jobs), concurrency)))
+    try:
+        futures = [pool.submit(run_story, es, sy, i, s, no_qa=args.no_qa, t0=t0)
+                   for es, i, s in jobs]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for f in futures:
+            f.result()
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        pool.shutdown(wait=True)
+
+    print()
+    for es in streams:
+        finish_edition(es, len(stories))
+    print()
+    print(f"🎉 Streamed {len(jobs)} story × edition chains in {time.monotonic() - t0:.0f}s  "
+          f"(LLM est_cost=${gen._run_totals['cost_usd']:.4f}, "
+          f"TTS debited {sy.budget.debited} chars)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""chat_batch and 2b --batch against batch_standin_server.py on a free port.
+
+    python -m pytest daily_news_pipeline/tests -q
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import batch_standin_server as bss  # noqa: E402
+from cost_tracker import StepCostRecorder  # noqa: E402
+from llm_providers import AnthropicProvider, BatchError, LLMResponse, OpenAIProvider  # noqa: E402
+
+translate = importlib.import_module("2b_translate_easy")
+
+PROMPTS = {f"story_{n}": f"Sentences:\n1. first of {n}\n2. second of {n}" for n in range(4)}
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """start(delay, fail_every) → the server's base URL, with both SDKs
+    pointed at it."""
+    servers = []
+
+    def start(delay: float = 0.3, fail_every: int = 0) -> str:
+        server = bss.make_server("127.0.0.1", 0, delay, fail_every)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", base)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "stub")
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{base}/v1")
+        monkeypatch.setenv("OPENAI_API_KEY", "stub")
+        for var in ("NO_PROXY", "no_proxy"):
+            monkeypatch.setenv(var, "127.0.0.1,localhost")
+        return base
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("provider_cls", [AnthropicProvider, OpenAIProvider])
+def test_chat_batch_polls_until_done(standin, provider_cls):
+    standin(delay=0.3)
+    results = provider_cls("stub-model").chat_batch(PROMPTS, max_tokens=256, poll_s=0.1)
+    assert list(results) == list(PROMPTS)
+    for key, resp in results.items():
+        n = key.split("_")[1]
+        assert isinstance(resp, LLMResponse) and resp.batch
+        assert json.loads(resp.text) == [f"[stub] first of {n}", f"[stub] second of {n}"]
+
+
+@pytest.mark.parametrize("provider_cls", [AnthropicProvider, OpenAIProvider])
+def test_chat_batch_failed_items_are_values(standin, provider_cls):
+    standin(delay=0.1, fail_every=2)
+    results = provider_cls("stub-model").chat_batch(PROMPTS, max_tokens=256, poll_s=0.1)
+    failed = [key for key, resp in results.items() if isinstance(resp, BatchError)]
+    assert failed == ["story_1", "story_3"]
+
+
+def _stories() -> list[dict]:
+    return [{"story_id": f"story_{n}", "headline": f"Headline {n}",
+             "summary_ko_easy": [f"문장 {n}-1", f"문장 {n}-2"]} for n in range(3)]
+
+
+def test_translate_batch_resends_failed_requests(standin, tmp_path):
+    standin(delay=0, fail_every=2)
+    stories = _stories()
+    recorder = StepCostRecorder("2b_translate_easy", tmp_path)
+    done = translate.translate_batch(stories, "ko", AnthropicProvider("stub-model"), 256, recorder)
+
+    assert done == [True, True, True]
+    for n, story in enumerate(stories):
+        assert story["summary_en_easy"] == [f"[stub] 문장 {n}-1", f"[stub] 문장 {n}-2"]
+    # story_1's batch request errored: only its realtime call is recorded.
+    assert [c["label"] for c in recorder.llm_calls] == [
+        "translate_easy:story_0", "translate_easy:story_1", "translate_easy:story_2"]
+
+
+def test_translate_batch_resends_malformed_replies(standin, tmp_path, monkeypatch):
+    def malformed(req):
+        result = original(req)
+        if req["custom_id"] == "req-00001":
+            result["result"]["message"]["content"][0]["text"] = "no array here"
+        return result
+
+    original = bss.anthropic_result
+    monkeypatch.setattr(bss, "anthropic_result", malformed)
+    standin(delay=0)
+    stories = _stories()
+    recorder = StepCostRecorder("2b_translate_easy", tmp_path)
+    done = translate.translate_batch(stories, "ko", AnthropicProvider("stub-model"), 256, recorder)
+
+    assert done == [True, True, True]
+    assert stories[1]["summary_en_easy"] == ["[stub] 문장 1-1", "[stub] 문장 1-2"]
+    # The malformed batch reply was billed, then re-sent in realtime.
+    assert [c["label"] for c in recorder.llm_calls].count("translate_easy:story_1") == 2
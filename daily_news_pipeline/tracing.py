@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Wall-clock spans for the daily pipeline: where the run's minutes go.
+
+Each step process calls `start_step("<step>", work_dir)` once it knows its
+date; from then on `span(name, cat)` blocks anywhere in the process (LLM
+attempts in llm_providers, body fetches, voicebox synthesis, publisher
+uploads + invalidation, ...) are recorded, and at exit the step's spans are
+written next to its cost report as work/<date>/traces/<step>.json — a Chrome
+trace, loadable on its own in chrome://tracing or https://ui.perfetto.dev.
+Without start_step (library use, tests) span() is a no-op. run.py, which
+runs every step in one process, calls `finish_step()` after each one to
+write it and start the next step's clock.
+
+Spans nest per thread / asyncio task, so concurrent calls get their own
+lanes. Categories: step, llm, wait (governor queueing, retry backoff),
+http, tts, s3, git, email, cpu (local parsing / rendering), io.
+
+`merge_run(work_dir)` (called by run.py after the cost finalize) joins
+every step file plus run.py's own per-step wall clock
+(traces/steps.tsv) into work/<date>/trace.json and a self-contained
+work/<date>/timeline.html.
+
+CLI:
+    python tracing.py [--date YYYY-MM-DD]                # rebuild trace.json + timeline.html, print summary
+    python tracing.py --date 2026-07-21 --compare 2026-07-20   # per-step / per-category deltas
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import atexit
+import datetime as dt
+import html
+import json
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+HERE = Path(__file__).resolve().parent
+WORK_ROOT = HERE / "work"
+
+# Process start, as near as we can get it: tracing is imported with the
+# step's other top-level modules.
+_PROCESS_START = time.time()
+
+CATEGORY_COLORS = {
+    "step": "#9e9e9e", "llm": "#5c6bc0", "wait": "#e0e0e0", "http": "#26a69a",
+    "tts": "#ef6c00", "s3": "#8d6e63", "git": "#78909c", "email": "#ab47bc", "cpu": "#d4e157",
+    "io": "#bdbdbd",
+}
+
+
+class Tracer:
+    """Spans of one step process, as Chrome trace "X" events (µs)."""
+
+    def __init__(self, step: str, work_dir: Path, started: float = _PROCESS_START) -> None:
+        self.step = step
+        self.work_dir = work_dir
+        self.started = started
+        self.events: list[dict[str, Any]] = []
+        # Lane 1 is the main thread (the whole-step span lives there).
+        self._lanes: dict[tuple[int, int], int] = {(threading.main_thread().ident, 0): 1}
+        self._lane_names: dict[int, str] = {1: "main"}
+        self._lock = threading.Lock()
+
+    def _lane(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = (threading.get_ident(), id(task) if task else 0)
+        with self._lock:
+            if key not in self._lanes:
+                tid = len(self._lanes) + 1
+                self._lanes[key] = tid
+                self._lane_names[tid] = f"{'task' if task else 'thread'} {tid}"
+            return self._lanes[key]
+
+    def record(self, name: str, cat: str, start: float, end: float, **args: Any) -> None:
+        """Add a finished span (`start` / `end`: time.time() seconds)."""
+        event = {"name": name, "cat": cat, "ph": "X", "ts": round(start * 1e6),
+                 "dur": max(0, round((end - start) * 1e6)), "pid": 1, "tid": self._lane()}
+        if args:
+            event["args"] = {k: v for k, v in args.items() if v is not None}
+        with self._lock:
+            self.events.append(event)
+
+    def write(self) -> Path:
+        end = time.time()
+        out_dir = self.work_dir / "traces"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / f"{self.step}.json"
+        events = [{"name": self.step, "cat": "step", "ph": "X", "ts": round(self.started * 1e6),
+                   "dur": round((end - self.started) * 1e6), "pid": 1, "tid": 1}]
+        with self._lock:
+            events += sorted(self.events, key=lambda e: e["ts"])
+            lanes = dict(self._lane_names)
+        events += [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+                   for tid, name in lanes.items()]
+        payload = {"traceEvents": events, "displayTimeUnit": "ms",
+                   "otherData": {"step": self.step,
+                                 "started_at": _iso(self.started), "completed_at": _iso(end)}}
+        out_path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+        return out_path
+
+
+_tracer: Tracer | None = None
+_step_start = _PROCESS_START
+
+
+def start_step(step: str, work_dir: Path) -> Tracer:
+    """Start recording this process's spans as `step`; written at exit (or
+    by finish_step)."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(step, work_dir, started=_step_start)
+    return _tracer
+
+
+def finish_step() -> Path | None:
+    """Write the current step's trace (if it started one) and begin the next
+    step's clock now."""
+    global _tracer, _step_start
+    tracer, _tracer = _tracer, None
+    _step_start = time.time()
+    return tracer.write() if tracer is not None else None
+
+
+atexit.register(finish_step)
+
+
+@contextmanager
+def span(name: str, cat: str, **args: Any):
+    """Time the block as one span. Yields a dict; keys added to it inside the
+    block (token counts, sizes, status) are stored as the span's args."""
+    if _tracer is None:
+        yield {}
+        return
+    t0 = time.time()
+    extra: dict[str, Any] = {}
+    try:
+        yield extra
+    except BaseException as e:
+        extra["error"] = type(e).__name__
+        raise
+    finally:
+        _tracer.record(name, cat, t0, time.time(), **args, **extra)
+
+
+def record(name: str, cat: str, start: float, end: float, **args: Any) -> None:
+    """Add an already-timed span (no-op without start_step)."""
+    if _tracer is not None:
+        _tracer.record(name, cat, start, end, **args)
+
+
+def _iso(t: float) -> str:
+    return dt.datetime.fromtimestamp(t, dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")[:-4] + "Z"
+
+
+# ─── Per-run merge ────────────────────────────────────────────────────────────
+
+
+def _runner_steps(path: Path) -> list[dict[str, Any]]:
+    """run.py's `label<TAB>start<TAB>end<TAB>status` lines → events."""
+    if not path.exists():
+        return []
+    events = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        parts = line.split("\t")
+        if len(parts) != 4:
+            continue
+        label, start, end, status = parts
+        events.append({"name": label, "cat": "step", "ph": "X", "ts": round(float(start) * 1e6),
+                       "dur": round((float(end) - float(start)) * 1e6), "pid": 0, "tid": 1,
+                       "args": {"status": status}})
+    return events
+
+
+def merge_run(work_dir: Path) -> tuple[Path, Path] | None:
+    """work/<date>/traces/* → work/<date>/trace.json + timeline.html, one
+    trace process per step (pid 0 = run.py). None if nothing traced."""
+    traces_dir = work_dir / "traces"
+    step_files = sorted(traces_dir.glob("*.json")) if traces_dir.exists() else []
+    runner = _runner_steps(traces_dir / "steps.tsv")
+    if not step_files and not runner:
+        return None
+    events: list[dict[str, Any]] = []
+    if runner:
+        events += runner
+        events.append({"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "run.py"}})
+    steps = []
+    for f in step_files:
+        data = json.loads(f.read_text(encoding="utf-8"))
+        steps.append((data["traceEvents"][0]["ts"], f.stem, data["traceEvents"]))
+    for pid, (_, step, step_events) in enumerate(sorted(steps), start=1):
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": step}})
+        events.append({"name": "process_sort_index", "ph": "M", "pid": pid, "args": {"sort_index": pid}})
+        events += [{**e, "pid": pid} for e in step_events]
+    trace_path = work_dir / "trace.json"
+    trace_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"},
+                                     ensure_ascii=False) + "\n", encoding="utf-8")
+    html_path = work_dir / "timeline.html"
+    html_path.write_text(render_timeline(events, title=f"Pipeline timeline · {work_dir.name}"),
+                         encoding="utf-8")
+    return trace_path, html_path
+
+
+def summarize(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Step wall clock, and count / total / p50 / max ms per span category
+    (step spans excluded)."""
+    spans = [e for e in events if e.get("ph") == "X"]
+    names = {e["pid"]: e["args"]["name"] for e in events if e.get("name") == "process_name"}
+    steps: dict[str, float] = {}
+    for e in spans:
+        if e["cat"] == "step" and e["pid"] != 0 and e["name"] == names.get(e["pid"]):
+            steps[e["name"]] = steps.get(e["name"], 0) + e["dur"] / 1000
+    by_cat: dict[str, list[float]] = {}
+    for e in spans:
+        if e["cat"] != "step":
+            by_cat.setdefault(e["cat"], []).append(e["dur"] / 1000)
+    run_ms = ((max(e["ts"] + e["dur"] for e in spans) - min(e["ts"] for e in spans)) / 1000
+              if spans else 0)
+    return {
+        "run_ms": run_ms,
+        "steps": steps,
+        "categories": {cat: {"count": len(d), "total_ms": sum(d), "p50_ms": statistics.median(d),
+                             "max_ms": max(d)} for cat, d in by_cat.items()},
+        "slowest": sorted((e for e in spans if e["cat"] != "step"), key=lambda e: -e["dur"])[:10],
+    }
+
+
+def render_timeline(events: list[dict[str, Any]], title: str) -> str:
+    """Self-contained HTML: a bar per span, one row group per step process,
+    one row per lane (nested spans stacked), plus the summary tables."""
+    spans = [e for e in events if e.get("ph") == "X"]
+    if not spans:
+        return f"<!doctype html><title>{html.escape(title)}</title><p>No spans recorded.</p>"
+    t0 = min(e["ts"] for e in spans)
+    total = max(e["ts"] + e["dur"] for e in spans) - t0 or 1
+    proc_names = {e["pid"]: e["args"]["name"] for e in events if e.get("name") == "process_name"}
+    lane_names = {(e["pid"], e["tid"]): e["args"]["name"] for e in events if e.get("name") == "thread_name"}
+
+    rows: list[str] = []
+    for pid in sorted({e["pid"] for e in spans}):
+        rows.append(f'<div class="proc">{html.escape(proc_names.get(pid, str(pid)))}</div>')
+        for tid in sorted({e["tid"] for e in spans if e["pid"] == pid}):
+            lane = sorted((e for e in spans if e["pid"] == pid and e["tid"] == tid),
+                          key=lambda e: (e["ts"], -e["dur"]))
+            stack: list[int] = []  # end times of open spans → depth
+            bars = []
+            for e in lane:
+                while stack and stack[-1] <= e["ts"]:
+                    stack.pop()
+                depth = len(stack)
+                stack.append(e["ts"] + e["dur"])
+                args = "".join(f"\n{k}: {v}" for k, v in (e.get("args") or {}).items())
+                tip = html.escape(f"{e['name']} [{e['cat']}] {e['dur'] / 1000:.1f} ms "
+                                  f"@ +{(e['ts'] - t0) / 1e6:.2f}s{args}")
+                bars.append(
+                    f'<div class="bar" title="{tip}" style="left:{100 * (e["ts"] - t0) / total:.4f}%;'
+                    f'width:{100 * e["dur"] / total:.4f}%;top:{depth * 14}px;'
+                    f'background:{CATEGORY_COLORS.get(e["cat"], "#90a4ae")}">'
+                    f'{html.escape(e["name"])}</div>')
+            height = 14 * _max_depth(lane)
+            label = html.escape(lane_names.get((pid, tid), f"lane {tid}"))
+            rows.append(f'<div class="lane"><span class="lname">{label}</span>'
+                        f'<div class="track" style="height:{height}px">{"".join(bars)}</div></div>')
+
+    ticks = []
+    step_s = max(1, round(total / 1e6 / 12))
+    for s in range(0, int(total / 1e6) + 1, step_s):
+        ticks.append(f'<span class="tick" style="left:{100 * s * 1e6 / total:.4f}%">{s}s</span>')
+
+    summary = summarize(events)
+    step_rows = "".join(f"<tr><td>{html.escape(k)}</td><td>{v / 1000:.1f}</td></tr>"
+                        for k, v in summary["steps"].items())
+    cat_rows = "".join(
+        f"<tr><td>{html.escape(c)}</td><td>{s['count']}</td><td>{s['total_ms'] / 1000:.1f}</td>"
+        f"<td>{s['p50_ms']:.0f}</td><td>{s['max_ms']:.0f}</td></tr>"
+        for c, s in sorted(summary["categories"].items(), key=lambda kv: -kv[1]["total_ms"]))
+    legend = "".join(f'<span class="key" style="background:{c}">{k}</span>'
+                     for k, c in CATEGORY_COLORS.items())
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font: 12px -apple-system, sans-serif; margin: 16px; }}
+.proc {{ font-weight: 600; margin-top: 10px; border-top: 1px solid #ddd; padding-top: 4px; }}
+.lane {{ display: flex; align-items: flex-start; }}
+.lname {{ width: 90px; flex: none; color: #666; }}
+.track, .axis {{ position: relative; flex: 1; }}
+.axis {{ height: 16px; margin-left: 90px; border-bottom: 1px solid #ccc; }}
+.tick {{ position: absolute; color: #888; }}
+.bar {{ position: absolute; height: 13px; min-width: 1px; overflow: hidden; white-space: nowrap;
+        color: #fff; font-size: 10px; line-height: 13px; border-radius: 2px; }}
+.key {{ color: #fff; padding: 1px 6px; margin-right: 4px; border-radius: 2px; }}
+table {{ border-collapse: collapse; margin: 12px 24px 0 0; display: inline-table; vertical-align: top; }}
+td, th {{ border: 1px solid #ddd; padding: 2px 8px; text-align: right; }}
+td:first-child, th:first-child {{ text-align: left; }}
+</style></head><body>
+<h2>{html.escape(title)}</h2>
+<p>Run wall clock: {summary['run_ms'] / 1000:.1f}s · hover a bar for details · {legend}</p>
+<div class="axis">{"".join(ticks)}</div>
+{"".join(rows)}
+<table><tr><th>step</th><th>s</th></tr>{step_rows}</table>
+<table><tr><th>category</th><th>spans</th><th>total s</th><th>p50 ms</th><th>max ms</th></tr>{cat_rows}</table>
+</body></html>
+"""
+
+
+def _max_depth(lane: list[dict[str, Any]]) -> int:
+    """Deepest span nesting in a lane sorted by (ts, -dur)."""
+    stack: list[int] = []
+    deepest = 1
+    for e in lane:
+        while stack and stack[-1] <= e["ts"]:
+            stack.pop()
+        stack.append(e["ts"] + e["dur"])
+        deepest = max(deepest, len(stack))
+    return deepest
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+
+def print_summary(summary: dict[str, Any]) -> None:
+    print(f"  Run wall clock: {summary['run_ms'] / 1000:.1f}s")
+    for step, ms in summary["steps"].items():
+        print(f"    {step:28s} {ms / 1000:8.1f}s")
+    print(f"  {'category':10s} {'spans':>6s} {'total s':>9s} {'p50 ms':>8s} {'max ms':>8s}")
+    for cat, s in sorted(summary["categories"].items(), key=lambda kv: -kv[1]["total_ms"]):
+        print(f"  {cat:10s} {s['count']:6d} {s['total_ms'] / 1000:9.1f} {s['p50_ms']:8.0f} {s['max_ms']:8.0f}")
+    print("  Slowest spans:")
+    for e in summary["slowest"]:
+        print(f"    {e['dur'] / 1000:9.0f} ms  [{e['cat']}] {e['name']}")
+
+
+def _load_summary(date: str) -> dict[str, Any]:
+    path = WORK_ROOT / date / "trace.json"
+    if not path.exists() and merge_run(WORK_ROOT / date) is None:
+        raise SystemExit(f"❌ no traces for {date} under {WORK_ROOT / date / 'traces'}")
+    return summarize(json.loads(path.read_text(encoding="utf-8"))["traceEvents"])
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Merge and summarize a run's traces")
+    p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
+    p.add_argument("--compare", metavar="DATE", help="Print deltas against another run")
+    args = p.parse_args()
+    date = args.date or dt.datetime.now(dt.timezone(dt.timedelta(hours=-4))).strftime("%Y-%m-%d")
+
+    merged = merge_run(WORK_ROOT / date)
+    if merged is None:
+        raise SystemExit(f"❌ no traces for {date} under {WORK_ROOT / date / 'traces'}")
+    trace_path, html_path = merged
+    summary = summarize(json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"])
+    print(f"═══ Trace {date} ═══")
+    print_summary(summary)
+    print(f"✅ {trace_path}\n✅ {html_path}")
+
+    if args.compare:
+        base = _load_summary(args.compare)
+        print(f"\n═══ {date} vs {args.compare} ═══")
+        print(f"  {'run':28s} {base['run_ms'] / 1000:8.1f}s → {summary['run_ms'] / 1000:8.1f}s  "
+              f"({(summary['run_ms'] - base['run_ms']) / 1000:+.1f}s)")
+        for step in dict.fromkeys([*base["steps"], *summary["steps"]]):
+            a, b = base["steps"].get(step, 0), summary["steps"].get(step, 0)
+            print(f"  {step:28s} {a / 1000:8.1f}s → {b / 1000:8.1f}s  ({(b - a) / 1000:+.1f}s)")
+        for cat in dict.fromkeys([*base["categories"], *summary["categories"]]):
+            a = base["categories"].get(cat, {}).get("total_ms", 0)
+            b = summary["categories"].get(cat, {}).get("total_ms", 0)
+            print(f"  [{cat}]{'':{26 - len(cat)}s} {a / 1000:8.1f}s → {b / 1000:8.1f}s  ({(b - a) / 1000:+.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
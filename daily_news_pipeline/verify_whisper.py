@@ -9,63 +9,106 @@ script.json's turn text and flag turns where similarity drops below the
 threshold.
 
 Korean and English use different similarity thresholds since Whisper tends to
-miss/insert punctuation more aggressively in Korean.
+miss/insert punctuation more aggressively in Korean. Scoring lives in
+similarity.py (exact indel ratio; rapidfuzz when installed): all turns are
+scored in one batch, and flagged turns get an aligned diff — plus a jamo-level
+score for Korean — in the report.
+
+Built to be cheap enough for the daily job (run_daily.sh --verify):
+  - each story's turns/ dir is listed once (not globbed per turn);
+  - the model is loaded once and turns are decoded in padded 30-second mel
+    batches (--batch-size), one language per batch, while a thread pool
+    (--workers) decodes the next batch's mp3s. Turns over 30 s, and batched
+    decodes that look degenerate (whisper's own compression-ratio / logprob
+    fallback thresholds), go through model.transcribe instead;
+  - a verification ledger (cache/whisper_verify.json) keyed by audio_key —
+    voicebox's content key, from voicebox.manifest.json — records each
+    key's transcript (and the Whisper model) the first time it is verified,
+    and that is its verification for life: a turn served from the TTS cache
+    (most vocab words and library examples) is never transcribed again.
+    An entry made by a different --model is a miss (re-transcribed, entry
+    replaced). Turns without a manifest span (no audio_key, only the file's
+    key8 suffix) are always transcribed and never enter the ledger.
+    Similarity is always recomputed, so threshold changes apply to ledger
+    hits too. --no-cache re-transcribes (and overwrites the ledger entries);
+  - --new-only narrows the report to the turns step 3 actually synthesized
+    today (manifest spans with from_cache false) — what run_daily.sh
+    --verify uses.
 
 Output:
-    work/<date>/verify_report.md
-    work/<date>/verify_report.json
+    work/<date>/verify_report{,_en}.md
+    work/<date>/verify_report{,_en}.json
 
 Usage:
-    python verify_whisper.py [--date YYYY-MM-DD] [--model large-v3]
+    python verify_whisper.py [--date YYYY-MM-DD] [--edition ko|en] [--model large-v3]
                               [--threshold-ko 0.75] [--threshold-en 0.85]
-                              [--only-story story_1]
+                              [--only-story story_1] [--batch-size 16] [--workers 4]
+                              [--new-only] [--no-cache]
+    python verify_whisper.py --sweep [--edition ko|en]   # re-score every
+        work/<date> from the ledger alone (no Whisper), e.g. after a
+        threshold change
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
-import difflib
 import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+import artifacts
+import edition
+import tracing
+from similarity import diff_spans, jamo_similarity, render_diff, score_pairs
 
 HERE = Path(__file__).resolve().parent
 WORK_ROOT = HERE / "work"
+VERIFY_CACHE_PATH = HERE / "cache" / "whisper_verify.json"
 
 DEFAULT_WHISPER_MODEL = "large-v3"
 DEFAULT_KO_THRESHOLD = 0.75   # below this, flag as mismatch
 DEFAULT_EN_THRESHOLD = 0.85
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_WORKERS = 4
 
+SAMPLE_RATE = 16_000          # whisper.audio.SAMPLE_RATE
+CHUNK_SAMPLES = 30 * SAMPLE_RATE
+# model.transcribe's defaults for falling back to temperature sampling.
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
 
-# Whisper output and our script text differ in trivial ways (punctuation,
-# spacing, casing). Normalize both before comparing so the similarity score
-# reflects actual content mismatches.
-_PUNCT_RE = re.compile(r"[、。，．！？!?,.…\"'\"\"`·:;()\[\]\{\}\-—–_/]")
-_WS_RE = re.compile(r"\s+")
-
-
-def normalize(text: str) -> str:
-    text = text.lower()
-    text = _PUNCT_RE.sub("", text)
-    text = _WS_RE.sub(" ", text)
-    return text.strip()
+_TURN_FILE_RE = re.compile(r"^turn_(\d{3})_([0-9a-f]+)\.mp3$")
 
+# Loaded Whisper models by id: run.py verifies both editions in one process.
+_models: dict[str, Any] = {}
 
-def similarity(a: str, b: str) -> float:
-    return difflib.SequenceMatcher(None, normalize(a), normalize(b)).ratio()
 
-
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Whisper-vs-script mismatch report")
     p.add_argument("--date", help="YYYY-MM-DD (default: today, US/Eastern)")
+    edition.add_edition_arg(p)
     p.add_argument("--model", default=DEFAULT_WHISPER_MODEL, help=f"Whisper model id (default: {DEFAULT_WHISPER_MODEL})")
     p.add_argument("--threshold-ko", type=float, default=DEFAULT_KO_THRESHOLD)
     p.add_argument("--threshold-en", type=float, default=DEFAULT_EN_THRESHOLD)
     p.add_argument("--only-story", help="Restrict to a single story_id (e.g. story_1)")
-    return p.parse_args()
+    p.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                   help=f"Turns per padded mel batch (default: {DEFAULT_BATCH_SIZE}; 1 = one at a time)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                   help=f"Threads decoding mp3s ahead of the model (default: {DEFAULT_WORKERS})")
+    p.add_argument("--new-only", action="store_true",
+                   help="Only verify turns synthesized today (not served from the TTS cache)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Re-transcribe even turns already in the ledger (the ledger is still updated)")
+    p.add_argument("--sweep", action="store_true",
+                   help="Re-score every work/<date> from ledger transcripts only (no Whisper)")
+    return p.parse_args(argv)
 
 
 def today_eastern() -> str:
@@ -73,14 +116,116 @@ def today_eastern() -> str:
     return now.strftime("%Y-%m-%d")
 
 
-def transcribe_turn(model, mp3_path: Path, language: str) -> str:
-    result = model.transcribe(
-        str(mp3_path),
-        language=language,
-        fp16=False,
-        verbose=False,
-    )
-    return (result.get("text") or "").strip()
+@dataclass
+class TurnJob:
+    story_id: str
+    turn: int
+    lang: str
+    speaker: str
+    expected: str
+    path: Path
+    audio_key: str | None  # None: no manifest span — not ledgered
+
+
+class VerifyLedger:
+    """audio_key → {text, model, date, verified_at}: one entry per key, for
+    the key's lifetime (audio for a key never changes). One JSON file,
+    saved after every batch, so an interrupted run keeps what it already
+    paid for."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            self.entries = json.loads(path.read_text(encoding="utf-8"))
+
+    def get(self, audio_key: str, model: str | None = None) -> str | None:
+        """The key's transcript; with `model`, only if that model made it."""
+        entry = self.entries.get(audio_key)
+        if entry is None or (model is not None and entry.get("model") != model):
+            return None
+        return entry["text"]
+
+    def put(self, audio_key: str, text: str, model: str, date: str) -> None:
+        self.entries[audio_key] = {
+            "text": text, "model": model, "date": date,
+            "verified_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        }
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".json.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.entries, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def manifest_spans(audio_dir: Path) -> dict[tuple[str, int], dict]:
+    """(story_id, turn) → voicebox span (audio_key, from_cache, ...), from
+    the manifest step 3 copies next to the tracks ({} if it isn't there)."""
+    path = audio_dir / "voicebox.manifest.json"
+    if not path.exists():
+        return {}
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    return {(group["unit_id"].replace("-", "_"), span["index"]): span
+            for group in manifest.get("groups", []) for span in group.get("spans", [])}
+
+
+def list_turn_files(turns_dir: Path) -> dict[int, tuple[Path, str]]:
+    """turn index → (mp3, key8 suffix) from one directory listing. Per-turn
+    files are named turn_NNN_<key8>.mp3."""
+    found: dict[int, tuple[Path, str]] = {}
+    for entry in sorted(os.scandir(turns_dir), key=lambda e: e.name):
+        m = _TURN_FILE_RE.match(entry.name)
+        if m and int(m.group(1)) not in found:
+            found[int(m.group(1))] = (Path(entry.path), m.group(2))
+    return found
+
+
+def _prefetched(batches: list[list[TurnJob]], load, workers: int) -> Iterator[tuple[list[TurnJob], list[Any]]]:
+    """Yield (batch, decoded audio) with the next batch already loading."""
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        pending = None
+        for batch in batches:
+            futures = [ex.submit(load, str(job.path)) for job in batch]
+            if pending is not None:
+                yield pending[0], [f.result() for f in pending[1]]
+            pending = (batch, futures)
+        if pending is not None:
+            yield pending[0], [f.result() for f in pending[1]]
+
+
+def transcribe_jobs(whisper, model, jobs: list[TurnJob], batch_size: int, workers: int,
+                    on_batch) -> None:
+    """Transcribe `jobs`, calling on_batch([(job, text), ...]) per batch."""
+    import torch
+
+    n_mels = getattr(model.dims, "n_mels", 80)
+    batches: list[list[TurnJob]] = []
+    for lang in sorted({j.lang for j in jobs}):
+        same = [j for j in jobs if j.lang == lang]
+        batches += [same[k:k + batch_size] for k in range(0, len(same), max(1, batch_size))]
+
+    for batch, audios in _prefetched(batches, whisper.load_audio, workers):
+        lang = "ko" if batch[0].lang == "ko" else "en"
+        texts: list[str | None] = [None] * len(batch)
+        short = [k for k, a in enumerate(audios) if len(a) <= CHUNK_SAMPLES]
+        if short:
+            mel = torch.stack([
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(audios[k]), n_mels=n_mels)
+                for k in short
+            ]).to(model.device)
+            options = whisper.DecodingOptions(language=lang, fp16=False, without_timestamps=True)
+            for k, result in zip(short, whisper.decode(model, mel, options)):
+                if (result.compression_ratio <= COMPRESSION_RATIO_THRESHOLD
+                        and result.avg_logprob >= LOGPROB_THRESHOLD):
+                    texts[k] = result.text.strip()
+        for k, text in enumerate(texts):
+            if text is None:
+                # Long turn, or a decode the batched path can't retry at a
+                # higher temperature: let transcribe() handle it.
+                result = model.transcribe(audios[k], language=lang, fp16=False, verbose=False)
+                texts[k] = (result.get("text") or "").strip()
+        on_batch(list(zip(batch, texts)))
 
 
 def render_markdown(payload: dict) -> str:
@@ -88,7 +233,10 @@ def render_markdown(payload: dict) -> str:
     out.append(f"# Whisper verification report — {payload['date']}\n")
     out.append(f"- Model: `{payload['model']}`\n")
     out.append(f"- KO threshold: {payload['threshold_ko']}, EN threshold: {payload['threshold_en']}\n")
-    out.append(f"- Total turns checked: {payload['stats']['total']}\n")
+    out.append(f"- Total turns checked: {payload['stats']['total']} "
+               f"({payload['stats']['cached']} from the verification ledger)\n")
+    if payload.get("new_only"):
+        out.append(f"- New-only: {payload['stats']['skipped_tts_cache_hits']} TTS-cache turns not checked\n")
     out.append(f"- Mismatches flagged: **{payload['stats']['mismatches']}** ({payload['stats']['mismatch_pct']:.1f}%)\n")
     out.append(f"  - Korean turns flagged: {payload['stats']['ko_mismatches']} / {payload['stats']['ko_total']}\n")
     out.append(f"  - English turns flagged: {payload['stats']['en_mismatches']} / {payload['stats']['en_total']}\n")
@@ -103,70 +251,184 @@ def render_markdown(payload: dict) -> str:
             out.append(f"### turn {m['turn']:03d}  [{m['lang']}] similarity={m['similarity']:.2f}\n")
             out.append(f"- **expected**:  `{m['expected']}`\n")
             out.append(f"- **whisper**:   `{m['whisper']}`\n")
+            if m.get("diff"):
+                out.append(f"- **diff**:      `{m['diff']}`")
+                if "jamo_similarity" in m:
+                    out.append(f"  (jamo similarity {m['jamo_similarity']:.2f})")
+                out.append("\n")
             out.append("\n")
     return "".join(out)
 
 
-def main() -> int:
-    args = parse_args()
+def sweep(args: argparse.Namespace) -> int:
+    """Re-score every work/<date> of the edition from ledger transcripts —
+    no audio decoding, no model, one scoring batch for the whole archive.
+    Turns without a ledger entry (never verified) are counted, not scored."""
+    sfx = edition.suffix(args.edition)
+    ledger = VerifyLedger(VERIFY_CACHE_PATH)
+    days: dict[str, dict[str, Any]] = {}
+    pairs: list[tuple[str, str]] = []
+    owners: list[tuple[str, str]] = []
+    for day_dir in sorted(p for p in WORK_ROOT.iterdir() if p.is_dir()):
+        script_path = day_dir / f"script{sfx}.json"
+        spans = manifest_spans(day_dir / f"audio{sfx}")
+        if not script_path.exists() or not spans:
+            continue
+        script = json.loads(script_path.read_text(encoding="utf-8"))
+        day = days[day_dir.name] = {"turns": 0, "checked": 0, "flagged": 0, "sim_sum": 0.0}
+        for story in script["stories"]:
+            for i, turn in enumerate(story["turns"]):
+                day["turns"] += 1
+                span = spans.get((story["story_id"], i))
+                transcript = ledger.get(span["audio_key"]) if span else None
+                if transcript is not None:
+                    pairs.append((turn["text"], transcript))
+                    owners.append((day_dir.name, turn["lang"]))
+
+    t0 = time.perf_counter()
+    scores = score_pairs(pairs)
+    score_s = time.perf_counter() - t0
+    for (date, lang), sim in zip(owners, scores):
+        day = days[date]
+        day["checked"] += 1
+        day["sim_sum"] += sim
+        day["flagged"] += sim < (args.threshold_ko if lang == "ko" else args.threshold_en)
+
+    print(f"═══ Whisper sweep ({args.edition}) over {WORK_ROOT} ═══")
+    print(f"  KO threshold: {args.threshold_ko}  EN threshold: {args.threshold_en}")
+    print(f"  {'date':<12} {'turns':>6} {'checked':>8} {'flagged':>8} {'mean sim':>9}")
+    for date, day in days.items():
+        mean = f"{day['sim_sum'] / day['checked']:.3f}" if day["checked"] else "—"
+        print(f"  {date:<12} {day['turns']:>6} {day['checked']:>8} {day['flagged']:>8} {mean:>9}")
+    print(f"✅ {len(pairs)} turns scored across {len(days)} days in {score_s * 1000:.0f} ms")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.sweep:
+        return sweep(args)
     date = args.date or today_eastern()
 
-    script_path = WORK_ROOT / date / "script.json"
-    audio_dir = WORK_ROOT / date / "audio"
+    sfx = edition.suffix(args.edition)
+    tracing.start_step(f"verify_whisper{sfx}", WORK_ROOT / date)
+    script_path = WORK_ROOT / date / f"script{sfx}.json"
+    audio_dir = WORK_ROOT / date / f"audio{sfx}"
     if not script_path.exists():
-        raise SystemExit(f"❌ script.json not found at {script_path}. Run step 2 first.")
+        raise SystemExit(f"❌ {script_path.name} not found at {script_path}. Run step 2 first.")
     if not audio_dir.exists():
         raise SystemExit(f"❌ audio dir not found at {audio_dir}. Run step 3 first.")
 
-    script = json.loads(script_path.read_text(encoding="utf-8"))
+    script = artifacts.read_json(script_path)
 
-    try:
-        import whisper
-    except ImportError:
-        raise SystemExit("openai-whisper not installed. pip install openai-whisper")
-
-    print(f"═══ Whisper verification for {date} ═══")
+    print(f"═══ Whisper verification for {date} ({args.edition}) ═══")
     print(f"  Model: {args.model}")
     print(f"  KO threshold: {args.threshold_ko}  EN threshold: {args.threshold_en}")
     if args.only_story:
         print(f"  Scope: {args.only_story} only")
-    print()
-    print(f"⏳ Loading Whisper model '{args.model}' (one-time)...")
-    model = whisper.load_model(args.model)
-    print(f"   ✓ model ready")
-    print()
-
-    stats = {
-        "total": 0, "mismatches": 0,
-        "ko_total": 0, "ko_mismatches": 0,
-        "en_total": 0, "en_mismatches": 0,
-    }
-    stories_out: list[dict] = []
 
+    # Collect every turn up front: one listing per turns dir, audio keys from
+    # the voicebox manifest. A key8 file suffix alone is too short to be a
+    # lifetime ledger key, so turns without a span skip the ledger.
+    spans = manifest_spans(audio_dir)
+    if args.new_only and not spans:
+        raise SystemExit(f"❌ --new-only needs {audio_dir / 'voicebox.manifest.json'} "
+                         f"(which turns were synthesized today). Re-run step 3 or drop --new-only.")
+    skipped_old = 0
+    jobs: list[TurnJob] = []
+    stories: list[dict] = []
     for story in script["stories"]:
         if args.only_story and story["story_id"] != args.only_story:
             continue
-        print(f"━━━ {story['story_id']}: {story['track_title_ko']}")
-        story_mismatches: list[dict] = []
         turns_dir = audio_dir / "turns" / story["story_id"]
         if not turns_dir.exists():
             print(f"  ⚠ no turns/ subdir at {turns_dir} — skipping")
             continue
-
+        stories.append(story)
+        files = list_turn_files(turns_dir)
         for i, turn in enumerate(story["turns"]):
-            # Per-turn files carry an audio_key suffix: turn_NNN_<key8>.mp3
-            candidates = sorted(turns_dir.glob(f"turn_{i:03d}_*.mp3"))
-            if not candidates:
-                print(f"  ⚠ missing turn_{i:03d}_*.mp3")
+            if i not in files:
+                print(f"  ⚠ {story['story_id']}: missing turn_{i:03d}_*.mp3")
                 continue
-            mp3 = candidates[0]
-            lang = turn["lang"]
-            expected = turn["text"]
-            threshold = args.threshold_ko if lang == "ko" else args.threshold_en
-            whisper_lang = "ko" if lang == "ko" else "en"
+            span = spans.get((story["story_id"], i), {})
+            if args.new_only and span.get("from_cache", True):
+                skipped_old += 1
+                continue
+            path, _key8 = files[i]
+            jobs.append(TurnJob(
+                story_id=story["story_id"], turn=i, lang=turn["lang"], speaker=turn["speaker"],
+                expected=turn["text"], path=path, audio_key=span.get("audio_key"),
+            ))
+
+    ledger = VerifyLedger(VERIFY_CACHE_PATH)
+    transcripts: dict[tuple[str, int], str] = {}
+    todo: list[TurnJob] = []
+    for job in jobs:
+        known = (None if args.no_cache or job.audio_key is None
+                 else ledger.get(job.audio_key, args.model))
+        if known is None:
+            todo.append(job)
+        else:
+            transcripts[(job.story_id, job.turn)] = known
+    if args.new_only:
+        print(f"  New-only: {skipped_old} turns served from the TTS cache skipped")
+    print(f"  Turns: {len(jobs)}  (in ledger {len(jobs) - len(todo)}, to transcribe {len(todo)})")
+    print()
 
-            transcribed = transcribe_turn(model, mp3, whisper_lang)
-            sim = similarity(expected, transcribed)
+    t0 = time.monotonic()
+    if todo:
+        try:
+            import whisper
+        except ImportError:
+            raise SystemExit("openai-whisper not installed. pip install openai-whisper")
+        if args.model not in _models:
+            print(f"⏳ Loading Whisper model '{args.model}' (one-time)...")
+            with tracing.span(f"load whisper {args.model}", "cpu"):
+                _models[args.model] = whisper.load_model(args.model)
+        model = _models[args.model]
+        print(f"   ✓ model ready")
+        done = 0
+
+        def on_batch(results: list[tuple[TurnJob, str]]) -> None:
+            nonlocal done
+            for job, text in results:
+                transcripts[(job.story_id, job.turn)] = text
+                if job.audio_key is not None:
+                    ledger.put(job.audio_key, text, args.model, date)
+            ledger.save()
+            done += len(results)
+            print(f"  … transcribed {done}/{len(todo)} ({time.monotonic() - t0:.0f}s)", flush=True)
+
+        with tracing.span(f"transcribe {len(todo)} turns", "cpu", batch_size=args.batch_size):
+            transcribe_jobs(whisper, model, todo, args.batch_size, args.workers, on_batch)
+    transcribe_s = time.monotonic() - t0
+
+    stats = {
+        "total": 0, "mismatches": 0,
+        "ko_total": 0, "ko_mismatches": 0,
+        "en_total": 0, "en_mismatches": 0,
+        "cached": len(jobs) - len(todo), "transcribed": len(todo),
+        "skipped_tts_cache_hits": skipped_old,
+        "transcribe_s": round(transcribe_s, 1),
+    }
+    stories_out: list[dict] = []
+    jobs_by_story: dict[str, list[TurnJob]] = {}
+    for job in jobs:
+        jobs_by_story.setdefault(job.story_id, []).append(job)
+
+    # Score every turn in one pass.
+    scores = dict(zip(
+        ((job.story_id, job.turn) for job in jobs),
+        score_pairs([(job.expected, transcripts[(job.story_id, job.turn)]) for job in jobs]),
+    ))
+    for story in stories:
+        print(f"━━━ {story['story_id']}: {story['track_title_ko']}")
+        story_mismatches: list[dict] = []
+        for job in jobs_by_story.get(story["story_id"], []):
+            i, lang, expected = job.turn, job.lang, job.expected
+            threshold = args.threshold_ko if lang == "ko" else args.threshold_en
+            transcribed = transcripts[(job.story_id, i)]
+            sim = scores[(job.story_id, i)]
             stats["total"] += 1
             if lang == "ko":
                 stats["ko_total"] += 1
@@ -182,14 +444,18 @@ def main() -> int:
                     stats["ko_mismatches"] += 1
                 else:
                     stats["en_mismatches"] += 1
-                story_mismatches.append({
+                mismatch = {
                     "turn": i,
                     "lang": lang,
-                    "speaker": turn["speaker"],
+                    "speaker": job.speaker,
                     "similarity": round(sim, 3),
                     "expected": expected,
                     "whisper": transcribed,
-                })
+                    "diff": render_diff(diff_spans(expected, transcribed)),
+                }
+                if lang == "ko":
+                    mismatch["jamo_similarity"] = round(jamo_similarity(expected, transcribed), 3)
+                story_mismatches.append(mismatch)
 
         stories_out.append({
             "story_id": story["story_id"],
@@ -201,6 +467,8 @@ def main() -> int:
 
     payload: dict[str, Any] = {
         "date": date,
+        "edition": args.edition,
+        "new_only": args.new_only,
         "model": args.model,
         "threshold_ko": args.threshold_ko,
         "threshold_en": args.threshold_en,
@@ -209,14 +477,15 @@ def main() -> int:
         "stories": stories_out,
     }
 
-    json_path = WORK_ROOT / date / "verify_report.json"
-    md_path = WORK_ROOT / date / "verify_report.md"
+    json_path = WORK_ROOT / date / f"verify_report{sfx}.json"
+    md_path = WORK_ROOT / date / f"verify_report{sfx}.md"
     json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     md_path.write_text(render_markdown(payload), encoding="utf-8")
 
     print()
     print(f"✅ Verification complete.")
-    print(f"   Total turns:    {stats['total']}")
+    print(f"   Total turns:    {stats['total']}  ({stats['cached']} from ledger, "
+          f"{stats['transcribed']} transcribed in {transcribe_s:.0f}s)")
     print(f"   Mismatches:     {stats['mismatches']} ({stats['mismatch_pct']:.1f}%)")
     print(f"     · Korean:      {stats['ko_mismatches']}/{stats['ko_total']}")
     print(f"     · English:     {stats['en_mismatches']}/{stats['en_total']}")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern vocab matcher (Aho-Corasick) for example coverage.
+
+"Which vocab terms occur in this sentence?" used to be one substring scan
+per term per sentence. A VocabMatcher is built once over the terms — the
+day's vocab in step 2, or the full Lexicon vocab for maintenance — and then
+answers for any text in a single left-to-right pass, whatever the number of
+terms. Matching is plain substring containment (same answers as `t in text`;
+Korean vocab routinely appears inside inflected forms, so no word
+boundaries).
+
+Also a maintenance CLI: recompute `vocab_covered` for every example in a
+Lexicon store against the store's full vocab (one pass over the examples)
+and report examples whose recorded coverage is stale.
+
+Usage:
+    python vocab_matcher.py audit                          # ~/.langpack/lexicon/ko-en.json
+    python vocab_matcher.py audit --pair en-ko
+    python vocab_matcher.py audit --store path/to/store.json --show 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Iterable
+
+LEXICON_DIR = Path.home() / ".langpack" / "lexicon"
+
+
+class VocabMatcher:
+    """Aho-Corasick automaton over `terms` (empty terms are ignored, duplicate
+    terms collapse). Term ids are positions in `self.terms`."""
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: list[str] = list(dict.fromkeys(t for t in terms if t))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._term: list[int] = [-1]  # term id ending exactly at this state
+        self._link: list[int] = [0]   # nearest proper suffix state that ends a term (0 = none)
+        for tid, term in enumerate(self.terms):
+            state = 0
+            for ch in term:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._term.append(-1)
+                    self._link.append(0)
+                state = nxt
+            self._term[state] = tid
+        self._build_links()
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                fs = self._fail[nxt]
+                self._link[nxt] = fs if self._term[fs] >= 0 else self._link[fs]
+                queue.append(nxt)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def ids_in(self, text: str) -> set[int]:
+        """Ids of every term occurring in `text`."""
+        goto, fail, term, link = self._goto, self._fail, self._term, self._link
+        found: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            s = state if term[state] >= 0 else link[state]
+            while s and term[s] not in found:
+                found.add(term[s])
+                s = link[s]
+        return found
+
+    def terms_in(self, text: str) -> list[str]:
+        """Terms occurring in `text`, in `self.terms` order."""
+        return [self.terms[i] for i in sorted(self.ids_in(text))]
+
+    def coverage(self, texts: Iterable[str]) -> list[set[int]]:
+        """ids_in for each text: one pass over the whole collection."""
+        return [self.ids_in(text) for text in texts]
+
+
+# ─── Lexicon store audit ──────────────────────────────────────────────────────
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Vocab matcher tools")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    a = sub.add_parser("audit", help="recompute example coverage over a Lexicon store")
+    a.add_argument("--pair", default="ko-en", help="store pair (default ko-en)")
+    a.add_argument("--store", help=f"store JSON path (default {LEXICON_DIR}/<pair>.json)")
+    a.add_argument("--show", type=int, default=10, help="stale examples to print")
+    return p.parse_args()
+
+
+def load_store(path: Path) -> tuple[list[str], list[dict]]:
+    """(vocab terms, examples) from a Lexicon store file. Fields are
+    positional like the store itself: "ko" is always the key-language text."""
+    if not path.exists():
+        raise SystemExit(f"❌ lexicon store not found at {path}")
+    store = json.loads(path.read_text(encoding="utf-8"))
+    vocab, examples = store.get("vocab"), store.get("examples")
+    if vocab is None or examples is None:
+        raise SystemExit(f"❌ {path.name}: expected top-level `vocab` and `examples`")
+    terms = list(vocab) if isinstance(vocab, dict) else [v["ko"] for v in vocab]
+    examples = list(examples.values()) if isinstance(examples, dict) else examples
+    return terms, examples
+
+
+def audit(path: Path, show: int) -> int:
+    terms, examples = load_store(path)
+    t0 = time.perf_counter()
+    matcher = VocabMatcher(terms)
+    build_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    coverage = matcher.coverage(ex["ko"] for ex in examples)
+    scan_s = time.perf_counter() - t0
+    print(f"🔎 {path.name}: {len(matcher)} vocab terms, {len(examples)} examples "
+          f"(automaton {build_s * 1000:.0f} ms, scan {scan_s * 1000:.0f} ms)")
+
+    stale = []
+    for ex, ids in zip(examples, coverage):
+        actual = {matcher.terms[i] for i in ids}
+        recorded = set(ex.get("vocab_covered") or [])
+        if actual != recorded:
+            stale.append((ex["ko"], sorted(actual - recorded), sorted(recorded - actual)))
+    uncovered = len(matcher) - len(set().union(*coverage)) if coverage else len(matcher)
+    print(f"  vocab with no example: {uncovered}")
+    print(f"  examples with stale vocab_covered: {len(stale)}")
+    for text, missing, extra in stale[:show]:
+        print(f"    {text[:50]}")
+        if missing:
+            print(f"      + also covers: {', '.join(missing)}")
+        if extra:
+            print(f"      - recorded but absent: {', '.join(extra)}")
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+    if args.cmd == "audit":
+        path = Path(args.store) if args.store else LEXICON_DIR / f"{args.pair}.json"
+        return audit(path, args.show)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
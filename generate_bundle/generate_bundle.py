@@ -27,6 +27,10 @@ try:
 except ImportError:
     boto3 = None
 
+# Shared S3 client factory (pooled connections, adaptive retries).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from bundle_pipeline.aws_clients import client as aws_client
+
 # Optional imports for transcription
 try:
     import whisper
@@ -914,7 +918,7 @@ Examples:
                     print(f"Key prefix: {key_prefix}")
                     
                     # Initialize S3 client
-                    s3_client = boto3.client('s3')
+                    s3_client = aws_client('s3')
                     
                     # Upload manifest
                     manifest_s3_key = f"{key_prefix}{output_path.name}"
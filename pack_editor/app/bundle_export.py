@@ -9,6 +9,7 @@ import uuid
 from typing import Optional
 
 from app.dao import DAO
+from app import aws_clients
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -112,8 +113,6 @@ def publish_pack(dao: DAO, pack_id: str) -> dict:
     """
     Build manifest, upload bundle.json + copy audio files to publish prefix, return info.
     """
-    import boto3
-
     pack = dao.get_pack(pack_id)
     if not pack:
         raise ValueError(f"Pack {pack_id} not found")
@@ -124,11 +123,11 @@ def publish_pack(dao: DAO, pack_id: str) -> dict:
     publish_prefix = _resolve_publish_prefix(pack)
     bucket = settings.s3_bucket_name
 
-    s3 = boto3.client("s3",
-        region_name=settings.aws_region or "us-east-1",
-        aws_access_key_id=settings.aws_access_key_id or None,
-        aws_secret_access_key=settings.aws_secret_access_key or None,
-    )
+    # Each credential is passed on its own, as before the shared factory
+    # (app.s3.client() only uses them as a pair).
+    s3 = aws_clients.client("s3", settings.aws_region or "us-east-1",
+                            access_key_id=settings.aws_access_key_id or None,
+                            secret_access_key=settings.aws_secret_access_key or None)
 
     # Upload bundle.json
     manifest_key = f"{publish_prefix}/bundle.json"
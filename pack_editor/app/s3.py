@@ -3,19 +3,19 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-import boto3
-
+from app import aws_clients
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
-def _client():
-    kwargs = {"region_name": settings.aws_region or "us-east-1"}
+def client():
+    """The app's shared S3 client (built once per process)."""
+    kwargs = {}
     if settings.aws_access_key_id and settings.aws_secret_access_key:
-        kwargs["aws_access_key_id"] = settings.aws_access_key_id
-        kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-    return boto3.client("s3", **kwargs)
+        kwargs["access_key_id"] = settings.aws_access_key_id
+        kwargs["secret_access_key"] = settings.aws_secret_access_key
+    return aws_clients.client("s3", settings.aws_region or "us-east-1", **kwargs)
 
 
 def s3_key_for_track(project_id: str, pack_id: str, filename: str) -> str:
@@ -25,11 +25,11 @@ def s3_key_for_track(project_id: str, pack_id: str, filename: str) -> str:
 
 def upload_file(local_path: Path, s3_key: str) -> None:
     logger.info("Uploading %s -> s3://%s/%s", local_path.name, settings.s3_bucket_name, s3_key)
-    _client().upload_file(str(local_path), settings.s3_bucket_name, s3_key)
+    client().upload_file(str(local_path), settings.s3_bucket_name, s3_key)
 
 
 def generate_presigned_url(s3_key: str, expires_in: int = 3600) -> str:
-    return _client().generate_presigned_url(
+    return client().generate_presigned_url(
         "get_object",
         Params={"Bucket": settings.s3_bucket_name, "Key": s3_key},
         ExpiresIn=expires_in,
@@ -37,4 +37,4 @@ def generate_presigned_url(s3_key: str, expires_in: int = 3600) -> str:
 
 
 def delete_file(s3_key: str) -> None:
-    _client().delete_object(Bucket=settings.s3_bucket_name, Key=s3_key)
+    client().delete_object(Bucket=settings.s3_bucket_name, Key=s3_key)
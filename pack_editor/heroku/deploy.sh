@@ -9,8 +9,16 @@ resolve_target "${TARGET}"
 
 heroku git:remote -a "${APP_NAME}" -r "${REMOTE_NAME}" >/dev/null 2>&1 || true
 
-echo "Deploying pack_editor/ subtree to Heroku (main)..."
 cd "$(git rev-parse --show-toplevel)"
+
+# The app's copy of the shared boto3 client factory (see its docstring).
+if ! cmp -s bundle_pipeline/aws_clients.py pack_editor/app/aws_clients.py; then
+  echo "pack_editor/app/aws_clients.py differs from bundle_pipeline/aws_clients.py."
+  echo "Copy it over and commit: cp bundle_pipeline/aws_clients.py pack_editor/app/"
+  exit 1
+fi
+
+echo "Deploying pack_editor/ subtree to Heroku (main)..."
 git subtree push --prefix pack_editor "${REMOTE_NAME}" main
 
 echo "Deployed. Next: ./heroku/migrate.sh ${TARGET}"
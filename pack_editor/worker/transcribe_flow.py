@@ -27,9 +27,10 @@ sys.path.insert(0, str(REPO_ROOT))
 from dotenv import load_dotenv
 load_dotenv(PACK_EDITOR_ROOT / ".env")
 
-import boto3
 from psycopg_pool import ConnectionPool
 
+from bundle_pipeline.aws_clients import client as aws_client
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [worker] %(levelname)s %(message)s",
@@ -141,7 +142,7 @@ def process_job(pool: ConnectionPool, job: dict):
 
     try:
         # 1. Download audio from S3
-        s3 = boto3.client("s3")
+        s3 = aws_client("s3")
         with tempfile.NamedTemporaryFile(suffix=Path(job["filename"]).suffix, delete=False) as tmp:
             log.info("  Downloading s3://%s/%s", S3_BUCKET, job["s3_key"])
             s3.download_file(S3_BUCKET, job["s3_key"], tmp.name)
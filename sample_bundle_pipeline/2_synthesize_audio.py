@@ -5,8 +5,9 @@ AWS Polly, then concatenate the per-turn segments into one file per
 "track" (or one file per scene if you're producing multi-file bundles).
 
 SAFETY: defaults to dry-run. Will refuse to make any AWS calls without
---commit. Always shows the cost estimate first. Hard cap on total
-character count protects against runaway scripts.
+--commit. Always shows the cost estimate first. Hard cap on the characters
+that would actually be debited (cache misses) protects against runaway
+scripts.
 
 Usage (dry-run, no AWS calls):
     python sample_bundle_pipeline/2_synthesize_audio.py --bundle-id starter_coffee
@@ -18,6 +19,20 @@ Output:
     samples/<bundle_id>/audio/track_001.mp3
     samples/<bundle_id>/audio/script.timed.json   (per-turn timings, useful for QA)
 
+Turns are synthesized concurrently (--concurrency requests in flight, at most
+--max-rps per second — Polly's default SynthesizeSpeech quota is 8 TPS);
+turn order and the turns/ layout are unchanged. Per-turn request latency is
+printed and saved under "synthesis" in script.timed.json.
+
+Turn timings in script.timed.json are exact (from the turn mp3s' frame
+headers, see turn_timing.py). --speech-marks also fetches Polly word speech
+marks for each synthesized turn and writes per-word timings; marks requests
+are billed like audio, so it doubles the chars to debit.
+
+Turn audio is cached by content (synth_turns.TurnCache, default
+~/.langpack/cache/sample_audio): re-running after editing a few lines only
+synthesizes — and pays for — those lines. --no-cache bypasses it.
+
 If you want multiple tracks per bundle, supply a script that contains
 "scene_breaks" or run this script once per scene with a different bundle_id.
 For now we produce a single track per script.
@@ -31,6 +46,10 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from mp3_concat import concat_turns, read_frames
+from synth_turns import (DEFAULT_CACHE_DIR, TurnCache, TurnPool, plan_turns, print_latency_stats,
+                         run_cached_turns, turn_key)
+from turn_timing import build_timings, place_timings, words_from_speech_marks
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SAMPLES_DIR = REPO_ROOT / "sample_bundle_pipeline" / "samples"
@@ -51,9 +70,15 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--engine", choices=("neural", "long-form", "standard"), default="neural", help="Polly engine")
     p.add_argument("--sample-rate", default="24000", help="Audio sample rate (default: 24000)")
     p.add_argument("--inter-turn-pause-ms", type=int, default=400, help="Silence between turns (ms)")
-    p.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help=f"Hard cap on total characters (default: {DEFAULT_MAX_CHARS})")
+    p.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help=f"Hard cap on characters to debit (default: {DEFAULT_MAX_CHARS})")
     p.add_argument("--commit", action="store_true", help="Actually call Polly. Default is dry-run.")
     p.add_argument("--region", default="us-east-1", help="AWS region (default: us-east-1)")
+    p.add_argument("--concurrency", type=int, default=4, help="Turns synthesized in parallel (default: 4)")
+    p.add_argument("--max-rps", type=float, default=8, help="Max Polly requests/second (default: 8, the account TPS quota)")
+    p.add_argument("--speech-marks", action="store_true",
+                   help="Also fetch word speech marks for per-word timings (doubles the chars debited)")
+    p.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help=f"Turn audio cache (default: {DEFAULT_CACHE_DIR})")
+    p.add_argument("--no-cache", action="store_true", help="Synthesize every turn; don't read or write the cache")
     return p.parse_args()
 
 
@@ -69,7 +94,14 @@ def estimate_cost(script: dict[str, Any]) -> tuple[int, float]:
     return total_chars, cost_usd
 
 
-def print_plan(script: dict[str, Any], total_chars: int, cost_usd: float, args: argparse.Namespace) -> None:
+def turn_keys(script: dict[str, Any], args: argparse.Namespace) -> list[str]:
+    settings = {"sample_rate": args.sample_rate, "output_format": "mp3"}
+    return [turn_key("polly", t["voice"], args.engine, settings, t["text"])
+            for t in script.get("turns", [])]
+
+
+def print_plan(script: dict[str, Any], total_chars: int, debit: int, cost_usd: float,
+               plan: dict[str, Any], cache: TurnCache, args: argparse.Namespace) -> None:
     print("═══ Polly synthesis plan ═══")
     print(f"  Bundle:           {args.bundle_id}")
     print(f"  Script:           {args.script}")
@@ -78,10 +110,14 @@ def print_plan(script: dict[str, Any], total_chars: int, cost_usd: float, args:
     print(f"  Engine:           {args.engine}")
     print(f"  Sample rate:      {args.sample_rate} Hz")
     print(f"  Inter-turn pause: {args.inter_turn_pause_ms} ms")
-    print(f"  Turns:            {len(script.get('turns', []))}")
+    print(f"  Concurrency:      {args.concurrency} turns in flight, ≤{args.max_rps:g} req/s")
+    print(f"  Cache:            {cache.root or 'disabled (--no-cache)'}")
+    print(f"  Total turns:      {plan['calls']}  (cache hits {plan['cache_hits']}, "
+          f"to synthesize {plan['synthesized']})")
     print(f"  Total characters: {total_chars}")
-    print(f"  Estimated cost:   ${cost_usd:.4f} USD  ({total_chars} chars × $4/1M neural)")
-    print(f"  Cap:              {args.max_chars} chars")
+    print(f"  Speech marks:     {'word (audio + marks requests)' if args.speech_marks else 'off'}")
+    print(f"  Chars to debit:   {debit}  (cap {args.max_chars})")
+    print(f"  Estimated cost:   ${cost_usd:.4f} USD  ({debit} chars × $4/1M neural)")
     print()
     voices_used: dict[str, int] = {}
     for t in script.get("turns", []):
@@ -91,7 +127,8 @@ def print_plan(script: dict[str, Any], total_chars: int, cost_usd: float, args:
     print()
 
 
-def synth_with_polly(script: dict[str, Any], out_dir: Path, args: argparse.Namespace) -> None:
+def synth_with_polly(script: dict[str, Any], out_dir: Path, args: argparse.Namespace,
+                     cache: TurnCache, keys: list[str], plan: dict[str, Any]) -> None:
     try:
         import boto3
     except ImportError:
@@ -106,71 +143,73 @@ def synth_with_polly(script: dict[str, Any], out_dir: Path, args: argparse.Names
     turns_dir = audio_dir / "turns"
     turns_dir.mkdir(parents=True, exist_ok=True)
 
-    # Synthesize each turn into its own mp3 first
-    per_turn_files: list[Path] = []
-    timings: list[dict[str, Any]] = []
-    cumulative_ms = 0
+    # Synthesize each turn into its own mp3 first (concurrently; order kept)
+    turns = script.get("turns", [])
+    pool = TurnPool(args.concurrency, args.max_rps)
+    print(f"▶ Synthesizing {plan['synthesized']} of {len(turns)} turns, {pool.concurrency} at a time")
+    fresh_words: dict[str, list[dict[str, Any]]] = {}
 
-    for i, turn in enumerate(script.get("turns", [])):
-        voice = turn["voice"]
-        text = turn["text"]
+    def synth_one(i: int, turn: dict[str, Any]) -> Path:
         out_file = turns_dir / f"turn_{i:03d}.mp3"
-        print(f"▶ Synthesizing turn {i + 1}/{len(script['turns'])}: voice={voice}, chars={len(text)}")
-        resp = polly.synthesize_speech(
-            Text=text,
-            OutputFormat="mp3",
-            VoiceId=voice,
-            Engine=args.engine,
-            SampleRate=args.sample_rate,
-        )
+        with pool.slot():
+            resp = polly.synthesize_speech(
+                Text=turn["text"],
+                OutputFormat="mp3",
+                VoiceId=turn["voice"],
+                Engine=args.engine,
+                SampleRate=args.sample_rate,
+            )
+            audio = resp["AudioStream"].read()
         with open(out_file, "wb") as f:
-            f.write(resp["AudioStream"].read())
-        per_turn_files.append(out_file)
-
-        # We don't get duration back from Polly, so estimate at ~12 chars/sec.
-        # The concatenation step (below) computes accurate timings from the
-        # actual audio if pydub is available.
-        approx_ms = int((len(text) / 12) * 1000)
-        timings.append({
-            "turn": i,
-            "speaker": turn.get("speaker"),
-            "voice": voice,
-            "text": text,
-            "startMs": cumulative_ms,
-            "endMs": cumulative_ms + approx_ms,
-            "approx": True,
-        })
-        cumulative_ms += approx_ms + args.inter_turn_pause_ms
+            f.write(audio)
+        if args.speech_marks:
+            with pool.slot():
+                marks = polly.synthesize_speech(
+                    Text=turn["text"],
+                    OutputFormat="json",
+                    SpeechMarkTypes=["word"],
+                    VoiceId=turn["voice"],
+                    Engine=args.engine,
+                )["AudioStream"].read()
+            stream = read_frames(audio)
+            fresh_words[keys[i]] = words_from_speech_marks(marks, stream.duration_ms if stream else None)
+        return out_file
+
+    def provenance(i: int, turn: dict[str, Any]) -> dict[str, Any]:
+        meta = {"provider": "polly", "voice_id": turn["voice"], "model": args.engine,
+                "settings": {"sample_rate": args.sample_rate, "output_format": "mp3"},
+                "text": turn["text"], "chars": len(turn["text"]), "producer": "sample_bundle_pipeline"}
+        if keys[i] in fresh_words:
+            meta["words"] = fresh_words[keys[i]]
+        return meta
+
+    per_turn_files, latencies, synthesis = run_cached_turns(
+        turns, keys, plan, cache, turns_dir, synth_one, pool, provenance)
+    print_latency_stats(synthesis)
+
+    # Turn durations come from the mp3 frame headers; words from this run's
+    # speech marks or the cache sidecar (repeated lines share a key).
+    words = [fresh_words.get(k) or cache.meta(k).get("words") for k in keys]
+    fields = [{
+        "turn": i,
+        "speaker": turn.get("speaker"),
+        "voice": turn["voice"],
+        "text": turn["text"],
+        "synthMs": latencies[i],
+        "cacheHit": latencies[i] is None,
+    } for i, turn in enumerate(turns)]
+    timings = build_timings(turns, per_turn_files, fields, words, args.inter_turn_pause_ms)
 
     # Concatenate
     print("🔗 Concatenating turns...")
     track_path = audio_dir / "track_001.mp3"
     try:
-        from pydub import AudioSegment
-
-        combined = AudioSegment.empty()
-        accurate_timings: list[dict[str, Any]] = []
-        cursor_ms = 0
-        for i, f in enumerate(per_turn_files):
-            seg = AudioSegment.from_file(f, format="mp3")
-            start = cursor_ms
-            combined += seg
-            cursor_ms += len(seg)
-            end = cursor_ms
-            if i < len(per_turn_files) - 1:
-                pause = AudioSegment.silent(duration=args.inter_turn_pause_ms)
-                combined += pause
-                cursor_ms += args.inter_turn_pause_ms
-            accurate_timings.append({
-                **timings[i],
-                "startMs": start,
-                "endMs": end,
-                "approx": False,
-            })
-        combined.export(track_path, format="mp3", bitrate="128k")
-        timings = accurate_timings
-        print(f"✅ Wrote {track_path} ({cursor_ms / 1000:.1f}s, accurate timings)")
+        spans, method = concat_turns(per_turn_files, track_path, args.inter_turn_pause_ms)
+        timings = place_timings(timings, spans)
+        how = "frame-level, no re-encode" if method == "frames" else "re-encoded 128k"
+        print(f"✅ Wrote {track_path} ({spans[-1][1] / 1000:.1f}s, {how}, exact timings)")
     except ImportError:
+        # Only the pcm fallback (turns in mismatched formats) needs pydub.
         print("⚠ pydub not installed; per-turn files written but not concatenated.")
         print("   pip install pydub  (and brew install ffmpeg)")
         print(f"   Per-turn files in: {audio_dir}")
@@ -178,7 +217,8 @@ def synth_with_polly(script: dict[str, Any], out_dir: Path, args: argparse.Names
     # Save timings as a sidecar JSON for QA / future skip-whisper optimization
     timings_path = audio_dir / "script.timed.json"
     timings_path.write_text(
-        json.dumps({"language": script.get("language"), "turns": timings}, ensure_ascii=False, indent=2) + "\n",
+        json.dumps({"language": script.get("language"), "turns": timings, "synthesis": synthesis},
+                   ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
     print(f"✅ Wrote {timings_path}")
@@ -192,14 +232,19 @@ def main() -> int:
     out_dir = args.output_dir or (SAMPLES_DIR / args.bundle_id / "audio")
 
     script = load_script(script_path)
-    total_chars, cost_usd = estimate_cost(script)
-    print_plan(script, total_chars, cost_usd, args)
-
-    if total_chars > args.max_chars:
+    cache = TurnCache(None if args.no_cache else args.cache_dir)
+    keys = turn_keys(script, args)
+    plan = plan_turns(script.get("turns", []), keys, cache)
+    total_chars, _ = estimate_cost(script)
+    debit = plan["chars_debited"] * (2 if args.speech_marks else 1)
+    cost_usd = debit * NEURAL_COST_PER_CHAR
+    print_plan(script, total_chars, debit, cost_usd, plan, cache, args)
+
+    if debit > args.max_chars:
         print(
-            f"❌ Total characters ({total_chars}) exceeds the cap ({args.max_chars}).\n"
+            f"❌ Chars to debit ({debit}) exceeds the cap ({args.max_chars}).\n"
             f"   This is a safety guard. If you really want to proceed, re-run with\n"
-            f"   --max-chars {total_chars + 100}.",
+            f"   --max-chars {debit + 100}.",
             file=sys.stderr,
         )
         return 1
@@ -218,7 +263,7 @@ def main() -> int:
             return 1
 
     print("🚀 Calling Polly...")
-    synth_with_polly(script, out_dir, args)
+    synth_with_polly(script, out_dir, args, cache, keys, plan)
     print()
     print("🎉 Synthesis complete.")
     print(f"   Next: ./sample_bundle_pipeline/3_make_qr_pack.sh {args.bundle_id} {out_dir}")
@@ -12,8 +12,9 @@ See ``ELEVENLABS_WORKFLOW.md`` in this directory for the end-to-end flow,
 voice picking, and cost model.
 
 SAFETY: defaults to dry-run. Will refuse to call ElevenLabs without --commit.
-Always prints a character debit estimate first. Hard cap on total character
-count protects against runaway scripts.
+Always prints a character debit estimate first. Hard cap on the characters
+that would actually be debited (cache misses) protects against runaway
+scripts.
 
 Usage (dry-run, no API calls):
     python sample_bundle_pipeline/2_synthesize_audio_elevenlabs.py \\
@@ -33,6 +34,20 @@ Output:
     samples/<bundle_id>/audio/script.timed.json
     samples/<bundle_id>/audio/turns/turn_NNN.mp3
 
+Turns are synthesized concurrently (--concurrency requests in flight; keep it
+at or under your tier's concurrent-request limit — Starter 3, Creator 5).
+Turn order and the turns/ layout are unchanged; per-turn request latency is
+printed and saved under "synthesis" in script.timed.json.
+
+Turns are requested with timestamps (convert_with_timestamps — same
+character debit), so script.timed.json gets per-word timings from
+ElevenLabs' character alignment; turn durations come from the mp3 frame
+headers (turn_timing.py).
+
+Turn audio is cached by content (synth_turns.TurnCache, shared with the Polly
+variant): a re-run only debits characters for lines whose text, voice or
+voice settings changed. --no-cache bypasses it.
+
 Note on the script.json "voice" field:
     Step 1 populates ``voice`` with Polly voice names (Seoyeon, Jihye, ...).
     This script IGNORES that field and maps by ``speaker`` letter instead:
@@ -43,6 +58,7 @@ Note on the script.json "voice" field:
 from __future__ import annotations
 
 import argparse
+import base64
 import json
 import os
 import sys
@@ -50,6 +66,10 @@ import time
 from pathlib import Path
 from typing import Any
 
+from mp3_concat import concat_turns
+from synth_turns import (DEFAULT_CACHE_DIR, TurnCache, TurnPool, plan_turns, print_latency_stats,
+                         run_cached_turns, turn_key)
+from turn_timing import build_timings, place_timings, words_from_alignment
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SAMPLES_DIR = REPO_ROOT / "sample_bundle_pipeline" / "samples"
@@ -65,6 +85,8 @@ CONFIRM_CHAR_THRESHOLD = 5_000
 # Retries for transient failures (429 rate limit, 5xx).
 MAX_RETRIES = 4
 
+OUTPUT_FORMAT = "mp3_44100_128"
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Synthesize a script with ElevenLabs")
@@ -78,7 +100,12 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--similarity-boost", type=float, default=0.75, help="Voice settings similarity_boost 0.0-1.0 (default: 0.75)")
     p.add_argument("--style", type=float, default=0.0, help="Voice settings style 0.0-1.0 (default: 0.0)")
     p.add_argument("--inter-turn-pause-ms", type=int, default=400, help="Silence between turns (ms)")
-    p.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help=f"Hard cap on total characters (default: {DEFAULT_MAX_CHARS})")
+    p.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help=f"Hard cap on characters to debit (default: {DEFAULT_MAX_CHARS})")
+    p.add_argument("--concurrency", type=int, default=3,
+                   help="Turns synthesized in parallel (default: 3; stay within your tier's concurrency limit)")
+    p.add_argument("--max-rps", type=float, default=0, help="Max requests/second (default: 0 = no cap)")
+    p.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help=f"Turn audio cache (default: {DEFAULT_CACHE_DIR})")
+    p.add_argument("--no-cache", action="store_true", help="Synthesize every turn; don't read or write the cache")
     p.add_argument("--commit", action="store_true", help="Actually call ElevenLabs. Default is dry-run.")
     return p.parse_args()
 
@@ -116,7 +143,19 @@ def count_chars(script: dict[str, Any]) -> int:
     return sum(len(turn.get("text", "")) for turn in script.get("turns", []))
 
 
-def print_plan(script: dict[str, Any], total_chars: int, voice_map: dict[str, str], args: argparse.Namespace) -> None:
+def voice_settings_dict(args: argparse.Namespace) -> dict[str, Any]:
+    return {"stability": args.stability, "similarity_boost": args.similarity_boost,
+            "style": args.style, "output_format": OUTPUT_FORMAT}
+
+
+def turn_keys(script: dict[str, Any], voice_map: dict[str, str], args: argparse.Namespace) -> list[str]:
+    settings = voice_settings_dict(args)
+    return [turn_key("elevenlabs", voice_map[t.get("speaker", "A")], args.model, settings, t["text"])
+            for t in script.get("turns", [])]
+
+
+def print_plan(script: dict[str, Any], total_chars: int, voice_map: dict[str, str], plan: dict[str, Any],
+               cache: TurnCache, args: argparse.Namespace) -> None:
     print("═══ ElevenLabs synthesis plan ═══")
     print(f"  Bundle:           {args.bundle_id}")
     print(f"  Script:           {args.script}")
@@ -129,9 +168,13 @@ def print_plan(script: dict[str, Any], total_chars: int, voice_map: dict[str, st
     print(f"  Similarity boost: {args.similarity_boost}")
     print(f"  Style:            {args.style}")
     print(f"  Inter-turn pause: {args.inter_turn_pause_ms} ms")
-    print(f"  Turns:            {len(script.get('turns', []))}")
+    print(f"  Concurrency:      {args.concurrency} turns in flight"
+          + (f", ≤{args.max_rps:g} req/s" if args.max_rps else ""))
+    print(f"  Cache:            {cache.root or 'disabled (--no-cache)'}")
+    print(f"  Total turns:      {plan['calls']}  (cache hits {plan['cache_hits']}, "
+          f"to synthesize {plan['synthesized']})")
     print(f"  Total characters: {total_chars}")
-    print(f"  Cap:              {args.max_chars} chars")
+    print(f"  Chars to debit:   {plan['chars_debited']}  (cap {args.max_chars})")
     print()
     turns_per_voice: dict[str, int] = {}
     for t in script.get("turns", []):
@@ -141,7 +184,7 @@ def print_plan(script: dict[str, Any], total_chars: int, voice_map: dict[str, st
         turns_per_voice[key] = turns_per_voice.get(key, 0) + 1
     print(f"  Turns per voice: {turns_per_voice}")
     print(
-        "  Cost:            varies by ElevenLabs tier — characters above will be\n"
+        "  Cost:            varies by ElevenLabs tier — chars to debit above will be\n"
         "                   debited from your monthly quota. See ELEVENLABS_WORKFLOW.md."
     )
     print()
@@ -154,23 +197,26 @@ def synth_turn(
     voice_id: str,
     model_id: str,
     out_file: Path,
-) -> None:
-    """One turn with retry on transient failures."""
+    pool: TurnPool,
+) -> list[dict[str, Any]]:
+    """One turn with retry on transient failures; returns its word timings
+    (turn-relative). The request holds a pool slot; the backoff sleep
+    doesn't."""
     last_error: Exception | None = None
     for attempt in range(MAX_RETRIES):
         try:
-            audio_iter = client.text_to_speech.convert(
-                voice_id=voice_id,
-                text=text,
-                model_id=model_id,
-                output_format="mp3_44100_128",
-                voice_settings=voice_settings,
-            )
+            with pool.slot():
+                resp = client.text_to_speech.convert_with_timestamps(
+                    voice_id=voice_id,
+                    text=text,
+                    model_id=model_id,
+                    output_format=OUTPUT_FORMAT,
+                    voice_settings=voice_settings,
+                )
+            audio_b64, alignment = _timestamped(resp)
             with open(out_file, "wb") as f:
-                for chunk in audio_iter:
-                    if chunk:
-                        f.write(chunk)
-            return
+                f.write(base64.b64decode(audio_b64))
+            return words_from_alignment(alignment) if alignment else []
         except Exception as e:
             last_error = e
             status = getattr(e, "status_code", None) or getattr(e, "status", None)
@@ -183,16 +229,28 @@ def synth_turn(
             if attempt == MAX_RETRIES - 1 or not is_retryable:
                 break
             delay = 2 ** attempt  # 1, 2, 4, 8 seconds
-            print(f"   ⚠ transient error ({status or 'unknown'}); retrying in {delay}s")
+            print(f"   ⚠ {out_file.name}: transient error ({status or 'unknown'}); retrying in {delay}s")
             time.sleep(delay)
     raise SystemExit(f"❌ ElevenLabs request failed after {MAX_RETRIES} attempts: {last_error}")
 
 
+def _timestamped(resp: Any) -> tuple[str, Any]:
+    """(base64 audio, character alignment) from convert_with_timestamps — an
+    SDK model in current elevenlabs releases, the raw JSON dict in older
+    ones."""
+    if isinstance(resp, dict):
+        return resp["audio_base64"], resp.get("alignment")
+    return resp.audio_base_64, resp.alignment
+
+
 def synth_with_elevenlabs(
     script: dict[str, Any],
     voice_map: dict[str, str],
     out_dir: Path,
     args: argparse.Namespace,
+    cache: TurnCache,
+    keys: list[str],
+    plan: dict[str, Any],
 ) -> None:
     try:
         from elevenlabs import ElevenLabs, VoiceSettings
@@ -214,76 +272,65 @@ def synth_with_elevenlabs(
     turns_dir = out_dir / "turns"
     turns_dir.mkdir(parents=True, exist_ok=True)
 
-    per_turn_files: list[Path] = []
-    timings: list[dict[str, Any]] = []
-    cumulative_ms = 0
+    turns = script.get("turns", [])
+    pool = TurnPool(args.concurrency, args.max_rps)
+    print(f"▶ Synthesizing {plan['synthesized']} of {len(turns)} turns, {pool.concurrency} at a time")
+    fresh_words: dict[str, list[dict[str, Any]]] = {}
 
-    for i, turn in enumerate(script.get("turns", [])):
-        speaker = turn.get("speaker", "A")
-        voice_id = voice_map[speaker]
-        text = turn["text"]
+    def synth_one(i: int, turn: dict[str, Any]) -> Path:
         out_file = turns_dir / f"turn_{i:03d}.mp3"
-        print(f"▶ Synthesizing turn {i + 1}/{len(script['turns'])}: speaker={speaker} voice={voice_id} chars={len(text)}")
-        synth_turn(
+        fresh_words[keys[i]] = synth_turn(
             client=client,
             voice_settings=voice_settings,
-            text=text,
-            voice_id=voice_id,
+            text=turn["text"],
+            voice_id=voice_map[turn.get("speaker", "A")],
             model_id=args.model,
             out_file=out_file,
+            pool=pool,
         )
-        per_turn_files.append(out_file)
-
-        # Approx timing at ~12 chars/sec; concatenation step overwrites with
-        # accurate values if pydub is available.
-        approx_ms = int((len(text) / 12) * 1000)
-        timings.append({
-            "turn": i,
-            "speaker": speaker,
-            "voice": voice_id,
-            "text": text,
-            "startMs": cumulative_ms,
-            "endMs": cumulative_ms + approx_ms,
-            "approx": True,
-        })
-        cumulative_ms += approx_ms + args.inter_turn_pause_ms
+        return out_file
+
+    def provenance(i: int, turn: dict[str, Any]) -> dict[str, Any]:
+        return {"provider": "elevenlabs", "voice_id": voice_map[turn.get("speaker", "A")],
+                "model": args.model, "settings": voice_settings_dict(args),
+                "text": turn["text"], "chars": len(turn["text"]), "producer": "sample_bundle_pipeline",
+                "words": fresh_words.get(keys[i], [])}
+
+    per_turn_files, latencies, synthesis = run_cached_turns(
+        turns, keys, plan, cache, turns_dir, synth_one, pool, provenance)
+    print_latency_stats(synthesis)
+
+    # Turn durations come from the mp3 frame headers; words from this run's
+    # alignment or the cache sidecar (repeated lines share a key).
+    words = [fresh_words.get(k) or cache.meta(k).get("words") for k in keys]
+    fields = [{
+        "turn": i,
+        "speaker": turn.get("speaker", "A"),
+        "voice": voice_map[turn.get("speaker", "A")],
+        "text": turn["text"],
+        "synthMs": latencies[i],
+        "cacheHit": latencies[i] is None,
+    } for i, turn in enumerate(turns)]
+    timings = build_timings(turns, per_turn_files, fields, words, args.inter_turn_pause_ms)
 
     # Concatenate (identical to the Polly path)
     print("🔗 Concatenating turns...")
     track_path = out_dir / "track_001.mp3"
     try:
-        from pydub import AudioSegment
-
-        combined = AudioSegment.empty()
-        accurate_timings: list[dict[str, Any]] = []
-        cursor_ms = 0
-        for i, f in enumerate(per_turn_files):
-            seg = AudioSegment.from_file(f, format="mp3")
-            start = cursor_ms
-            combined += seg
-            cursor_ms += len(seg)
-            end = cursor_ms
-            if i < len(per_turn_files) - 1:
-                pause = AudioSegment.silent(duration=args.inter_turn_pause_ms)
-                combined += pause
-                cursor_ms += args.inter_turn_pause_ms
-            accurate_timings.append({
-                **timings[i],
-                "startMs": start,
-                "endMs": end,
-                "approx": False,
-            })
-        combined.export(track_path, format="mp3", bitrate="128k")
-        timings = accurate_timings
-        print(f"✅ Wrote {track_path} ({cursor_ms / 1000:.1f}s, accurate timings)")
+        spans, method = concat_turns(per_turn_files, track_path, args.inter_turn_pause_ms)
+        timings = place_timings(timings, spans)
+        how = "frame-level, no re-encode" if method == "frames" else "re-encoded 128k"
+        print(f"✅ Wrote {track_path} ({spans[-1][1] / 1000:.1f}s, {how}, exact timings)")
     except ImportError:
+        # Only the pcm fallback (turns in mismatched formats) needs pydub.
         print("⚠ pydub not installed; per-turn files written but not concatenated.")
         print("   pip install pydub  (and brew install ffmpeg)")
         print(f"   Per-turn files in: {out_dir}")
 
     timings_path = out_dir / "script.timed.json"
     timings_path.write_text(
-        json.dumps({"language": script.get("language"), "turns": timings}, ensure_ascii=False, indent=2) + "\n",
+        json.dumps({"language": script.get("language"), "turns": timings, "synthesis": synthesis},
+                   ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
     print(f"✅ Wrote {timings_path}")
@@ -299,14 +346,18 @@ def main() -> int:
     script = load_script(script_path)
     voice_map = build_voice_map(args)
     validate_speakers(script, voice_map)
+    cache = TurnCache(None if args.no_cache else args.cache_dir)
+    keys = turn_keys(script, voice_map, args)
+    plan = plan_turns(script.get("turns", []), keys, cache)
     total_chars = count_chars(script)
-    print_plan(script, total_chars, voice_map, args)
+    debit = plan["chars_debited"]
+    print_plan(script, total_chars, voice_map, plan, cache, args)
 
-    if total_chars > args.max_chars:
+    if debit > args.max_chars:
         print(
-            f"❌ Total characters ({total_chars}) exceeds the cap ({args.max_chars}).\n"
+            f"❌ Chars to debit ({debit}) exceeds the cap ({args.max_chars}).\n"
             f"   This is a safety guard. If you really want to proceed, re-run with\n"
-            f"   --max-chars {total_chars + 100}.",
+            f"   --max-chars {debit + 100}.",
             file=sys.stderr,
         )
         return 1
@@ -314,18 +365,18 @@ def main() -> int:
     if not args.commit:
         print("--- DRY RUN — no ElevenLabs calls will be made ---")
         print()
-        print(f"To actually synthesize, re-run with --commit ({total_chars} chars will be debited).")
+        print(f"To actually synthesize, re-run with --commit ({debit} chars will be debited).")
         return 0
 
-    if total_chars > CONFIRM_CHAR_THRESHOLD:
-        print(f"⚠ This run will debit {total_chars} chars, above the {CONFIRM_CHAR_THRESHOLD} confirmation threshold.")
+    if debit > CONFIRM_CHAR_THRESHOLD:
+        print(f"⚠ This run will debit {debit} chars, above the {CONFIRM_CHAR_THRESHOLD} confirmation threshold.")
         confirm = input("Type 'YES' to proceed: ")
         if confirm != "YES":
             print("Aborted.")
             return 1
 
     print("🚀 Calling ElevenLabs...")
-    synth_with_elevenlabs(script, voice_map, out_dir, args)
+    synth_with_elevenlabs(script, voice_map, out_dir, args, cache, keys, plan)
     print()
     print("🎉 Synthesis complete.")
     print(f"   QA first: afplay {out_dir}/track_001.mp3")
@@ -0,0 +1,280 @@
+"""
+Streaming track assembly for the sample synthesizers: per-turn mp3s plus a
+fixed pause between turns → one track, with exact turn timings.
+
+Two paths, picked per run:
+
+  - frames: when every turn is MPEG Layer III with the same sample rate and
+    channel count (always the case for one Polly or one ElevenLabs run),
+    the turns' MPEG frames are copied straight into the output — no decode,
+    no re-encode, no generation loss. Pauses are whole silent frames (a
+    zeroed frame body decodes to digital silence), and an Info/Xing frame
+    up front carries the frame and byte counts so players report the right
+    duration. Timings are frame counts × samples per frame.
+
+  - pcm: otherwise, each turn is decoded once (pydub/ffmpeg), converted to
+    the first turn's sample format, and its raw PCM piped into a single
+    ffmpeg encode; pauses are zero samples. Timings are sample counts.
+
+Either way the output is written as it goes — nothing grows a whole-track
+buffer the way `combined += seg` did (which copied the track on every turn).
+"""
+
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+# MPEG Layer III tables, indexed by [version is MPEG-1][bitrate index].
+_BITRATES_KBPS = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# version bits (00 = MPEG-2.5, 10 = MPEG-2, 11 = MPEG-1) → sample rates
+_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+@dataclass(frozen=True)
+class FrameFormat:
+    """What has to match for two frame streams to be spliced."""
+
+    version: int  # header version bits: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    sample_rate: int
+    mono: bool
+
+    @property
+    def samples_per_frame(self) -> int:
+        return 1152 if self.version == 3 else 576
+
+    @property
+    def side_info_len(self) -> int:
+        if self.version == 3:
+            return 17 if self.mono else 32
+        return 9 if self.mono else 17
+
+
+# Samples every Layer III decoder emits before the first encoded sample.
+DECODER_DELAY = 529
+
+
+@dataclass
+class Mp3Stream:
+    fmt: FrameFormat
+    frames: list[bytes]
+    bitrate_indices: list[int]
+    lead_samples: int = 0  # decoded samples before the source audio starts (0 = unknown)
+
+    @property
+    def samples(self) -> int:
+        return len(self.frames) * self.fmt.samples_per_frame
+
+    @property
+    def duration_ms(self) -> int:
+        return _ms(self.samples, self.fmt.sample_rate)
+
+    @property
+    def lead_ms(self) -> int:
+        return _ms(self.lead_samples, self.fmt.sample_rate)
+
+
+def _parse_header(data: bytes, pos: int) -> tuple[FrameFormat, int, int, bool] | None:
+    """(format, frame length, bitrate index, has CRC) for a Layer III frame
+    header at `pos`, or None."""
+    if pos + 4 > len(data) or data[pos] != 0xFF or data[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    version = (b1 >> 3) & 3
+    layer = (b1 >> 1) & 3
+    br_index = b2 >> 4
+    sr_index = (b2 >> 2) & 3
+    if version == 1 or layer != 1 or br_index in (0, 15) or sr_index == 3:
+        return None
+    mpeg1 = version == 3
+    sample_rate = _SAMPLE_RATES[version][sr_index]
+    bitrate = _BITRATES_KBPS[mpeg1][br_index] * 1000
+    padding = (b2 >> 1) & 1
+    length = (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+    fmt = FrameFormat(version=version, sample_rate=sample_rate, mono=(b3 >> 6) == 3)
+    return fmt, length, br_index, not (b1 & 1)
+
+
+def _skip_id3v2(data: bytes) -> int:
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    return 10 + size + (10 if data[5] & 0x10 else 0)
+
+
+def _is_vbr_header(frame: bytes, fmt: FrameFormat, crc: bool) -> bool:
+    off = 4 + (2 if crc else 0) + fmt.side_info_len
+    return frame[off:off + 4] in (b"Xing", b"Info") or frame[36:40] == b"VBRI"
+
+
+def _encoder_delay(frame: bytes, fmt: FrameFormat, crc: bool) -> int | None:
+    """Encoder delay from the LAME extension of a Xing/Info frame (LAME and
+    ffmpeg both write it), or None."""
+    off = 4 + (2 if crc else 0) + fmt.side_info_len
+    if frame[off:off + 4] not in (b"Xing", b"Info"):
+        return None
+    flags = int.from_bytes(frame[off + 4:off + 8], "big")
+    off += 8 + 4 * bool(flags & 1) + 4 * bool(flags & 2) + 100 * bool(flags & 4) + 4 * bool(flags & 8)
+    # 9-byte encoder string, then revision, lowpass, replay gain (8), flags,
+    # bitrate, and 12 + 12 bits of delay / padding.
+    if frame[off:off + 4] not in (b"LAME", b"Lavc", b"Lavf") or off + 24 > len(frame):
+        return None
+    return (frame[off + 21] << 4) | (frame[off + 22] >> 4)
+
+
+def read_frames(data: bytes) -> Mp3Stream | None:
+    """Audio frames of an mp3 (tags and any Xing/Info/VBRI header frame
+    dropped), or None if it isn't a single-format Layer III stream."""
+    pos = _skip_id3v2(data)
+    fmt: FrameFormat | None = None
+    frames: list[bytes] = []
+    indices: list[int] = []
+    lead = 0
+    while pos + 4 <= len(data):
+        hdr = _parse_header(data, pos)
+        if hdr is None or pos + hdr[1] > len(data):
+            if data[pos:pos + 3] == b"TAG" or data[pos:pos + 8] == b"APETAGEX":
+                break
+            pos += 1  # resync
+            continue
+        frame_fmt, length, br_index, crc = hdr
+        frame = data[pos:pos + length]
+        pos += length
+        if fmt is None:
+            fmt = frame_fmt
+            if _is_vbr_header(frame, fmt, crc):
+                delay = _encoder_delay(frame, fmt, crc)
+                lead = delay + DECODER_DELAY if delay is not None else 0
+                continue
+        elif frame_fmt != fmt:
+            return None
+        frames.append(frame)
+        indices.append(br_index)
+    if fmt is None or not frames:
+        return None
+    return Mp3Stream(fmt, frames, indices, lead)
+
+
+def _frame_header(fmt: FrameFormat, br_index: int) -> bytes:
+    sr_index = _SAMPLE_RATES[fmt.version].index(fmt.sample_rate)
+    return bytes((
+        0xFF,
+        0xE0 | (fmt.version << 3) | (1 << 1) | 1,  # Layer III, no CRC
+        (br_index << 4) | (sr_index << 2),
+        0xC0 if fmt.mono else 0x00,
+    ))
+
+
+def _frame_len(fmt: FrameFormat, br_index: int) -> int:
+    mpeg1 = fmt.version == 3
+    return (144 if mpeg1 else 72) * _BITRATES_KBPS[mpeg1][br_index] * 1000 // fmt.sample_rate
+
+
+def silent_frame(fmt: FrameFormat, br_index: int) -> bytes:
+    """A frame whose side info and main data are all zero: part2_3_length 0,
+    main_data_begin 0, so it decodes to silence without touching the bit
+    reservoir."""
+    header = _frame_header(fmt, br_index)
+    return header + bytes(_frame_len(fmt, br_index) - len(header))
+
+
+def _info_frame(fmt: FrameFormat, br_index: int, cbr: bool, n_frames: int, n_bytes: int) -> bytes | None:
+    frame = bytearray(silent_frame(fmt, br_index))
+    off = 4 + fmt.side_info_len
+    if off + 16 > len(frame):
+        return None
+    frame[off:off + 4] = b"Info" if cbr else b"Xing"
+    frame[off + 4:off + 8] = (0x3).to_bytes(4, "big")  # frames + bytes fields present
+    frame[off + 8:off + 12] = n_frames.to_bytes(4, "big")
+    frame[off + 12:off + 16] = n_bytes.to_bytes(4, "big")
+    return bytes(frame)
+
+
+def _ms(samples: int, sample_rate: int) -> int:
+    return round(samples * 1000 / sample_rate)
+
+
+def concat_frames(streams: list[Mp3Stream], out_path: Path, pause_ms: int) -> list[tuple[int, int]]:
+    """Splice frame streams with silent-frame pauses. Returns (startMs, endMs)
+    per turn."""
+    fmt = streams[0].fmt
+    spf = fmt.samples_per_frame
+    all_indices = [i for s in streams for i in s.bitrate_indices]
+    br_index = max(set(all_indices), key=all_indices.count)
+    cbr = all(i == br_index for i in all_indices)
+    pause = silent_frame(fmt, br_index)
+    pause_frames = round(pause_ms * fmt.sample_rate / 1000 / spf)
+
+    spans: list[tuple[int, int]] = []
+    cursor = 0  # samples
+    n_frames = 0
+    placeholder = _info_frame(fmt, br_index, cbr, 0, 0)
+    with open(out_path, "wb") as out:
+        if placeholder:
+            out.write(placeholder)
+        for i, stream in enumerate(streams):
+            for frame in stream.frames:
+                out.write(frame)
+            spans.append((_ms(cursor, fmt.sample_rate), _ms(cursor + stream.samples, fmt.sample_rate)))
+            cursor += stream.samples
+            n_frames += len(stream.frames)
+            if i < len(streams) - 1:
+                out.write(pause * pause_frames)
+                cursor += pause_frames * spf
+                n_frames += pause_frames
+        if placeholder:
+            n_bytes = out.tell()
+            out.seek(0)
+            out.write(_info_frame(fmt, br_index, cbr, n_frames, n_bytes))
+    return spans
+
+
+def concat_pcm(files: list[Path], out_path: Path, pause_ms: int, bitrate: str) -> list[tuple[int, int]]:
+    """Decode each turn once and stream its PCM into one ffmpeg encode.
+    Raises ImportError if pydub isn't installed."""
+    from pydub import AudioSegment
+
+    first = AudioSegment.from_file(files[0], format="mp3")
+    rate, channels = first.frame_rate, first.channels
+    frame_bytes = 2 * channels
+    pause = bytes(round(pause_ms * rate / 1000) * frame_bytes)
+    cmd = [AudioSegment.converter, "-y", "-loglevel", "error",
+           "-f", "s16le", "-ar", str(rate), "-ac", str(channels), "-i", "pipe:0",
+           "-b:a", bitrate, "-f", "mp3", str(out_path)]
+    spans: list[tuple[int, int]] = []
+    cursor = 0
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    try:
+        for i, f in enumerate(files):
+            seg = first if i == 0 else AudioSegment.from_file(f, format="mp3")
+            seg = seg.set_frame_rate(rate).set_channels(channels).set_sample_width(2)
+            pcm = seg.raw_data
+            proc.stdin.write(pcm)
+            n = len(pcm) // frame_bytes
+            spans.append((_ms(cursor, rate), _ms(cursor + n, rate)))
+            cursor += n
+            if i < len(files) - 1:
+                proc.stdin.write(pause)
+                cursor += len(pause) // frame_bytes
+        proc.stdin.close()
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    if proc.wait() != 0:
+        raise SystemExit(f"❌ ffmpeg failed encoding {out_path}")
+    return spans
+
+
+def concat_turns(files: list[Path], out_path: Path, pause_ms: int,
+                 bitrate: str = "128k") -> tuple[list[tuple[int, int]], str]:
+    """Write the track; returns ((startMs, endMs) per turn, path used —
+    "frames" or "pcm")."""
+    streams = [read_frames(Path(f).read_bytes()) for f in files]
+    if all(streams) and len({s.fmt for s in streams}) == 1:
+        return concat_frames(streams, out_path, pause_ms), "frames"
+    return concat_pcm(files, out_path, pause_ms, bitrate), "pcm"
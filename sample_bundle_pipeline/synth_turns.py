@@ -0,0 +1,230 @@
+"""
+Shared per-turn plumbing for the sample synthesizers (2_synthesize_audio.py,
+2_synthesize_audio_elevenlabs.py).
+
+Turns are independent TTS requests, so they are synthesized concurrently:
+`run_turns` keeps up to `concurrency` requests in flight, spaced to at most
+`max_rps` requests/second, and returns results in turn order — the turns/
+layout and the concatenation order don't change. Retry backoff sleeps happen
+outside the slot (see `TurnPool.slot`), so a throttled turn doesn't hold
+capacity the others could use.
+
+Turn audio is also cached by content: the key is sha256 of (provider, voice,
+model, settings, text), and the store uses voicebox's flat layout —
+`<key>.mp3` plus a `<key>.json` provenance sidecar — in its own directory
+(default ~/.langpack/cache/sample_audio, next to voicebox's audio/). A re-run
+only pays for turns whose text or voice settings changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_CACHE_DIR = Path.home() / ".langpack" / "cache" / "sample_audio"
+
+
+class TurnPool:
+    """Concurrency + request-rate limit shared by every turn of one run."""
+
+    def __init__(self, concurrency: int, max_rps: float = 0) -> None:
+        self.concurrency = max(1, concurrency)
+        self._sem = threading.BoundedSemaphore(self.concurrency)
+        self._interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the in-flight slots for the duration of a request."""
+        with self._sem:
+            if self._interval:
+                with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_at)
+                    self._next_at = start + self._interval
+                if start > now:
+                    time.sleep(start - now)
+            yield
+
+
+def run_turns(turns: list[dict[str, Any]], synth_one: Callable[[int, dict[str, Any]], Any],
+              pool: TurnPool, numbers: list[int] | None = None,
+              total: int | None = None) -> tuple[list[Any], list[int], float]:
+    """Run `synth_one(i, turn)` for every turn, concurrently (`numbers` /
+    `total`: script turn indices for the progress lines, when `turns` is a
+    subset). Returns
+    (results in turn order, per-turn latency ms, wall seconds). On the first
+    failure, turns not yet started are cancelled (no further spend) and the
+    error propagates once the ones in flight have finished."""
+    n = len(turns)
+    numbers = numbers or list(range(n))
+    total = total or n
+    latencies = [0] * n
+    done = 0
+    lock = threading.Lock()
+
+    def task(i: int) -> Any:
+        nonlocal done
+        t0 = time.monotonic()
+        result = synth_one(i, turns[i])
+        latencies[i] = round((time.monotonic() - t0) * 1000)
+        with lock:
+            done += 1
+            print(f"  ✓ turn {numbers[i] + 1}/{total} ({done}/{n} done): {latencies[i]} ms", flush=True)
+        return result
+
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=min(max(n, 1), pool.concurrency * 2)) as ex:
+        futures = [ex.submit(task, i) for i in range(n)]
+        for f in as_completed(futures):
+            if f.exception() is not None:
+                for other in futures:
+                    other.cancel()
+                raise f.exception()
+        results = [f.result() for f in futures]
+    return results, latencies, time.monotonic() - t0
+
+
+def latency_stats(latencies: list[int], wall_s: float, concurrency: int) -> dict[str, Any]:
+    """Summary for script.timed.json and the console."""
+    if not latencies:
+        return {"concurrency": concurrency, "turns": 0, "wall_ms": round(wall_s * 1000)}
+    ordered = sorted(latencies)
+    return {
+        "concurrency": concurrency,
+        "turns": len(latencies),
+        "wall_ms": round(wall_s * 1000),
+        "sum_ms": sum(latencies),
+        "p50_ms": round(statistics.median(ordered)),
+        "p95_ms": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "max_ms": ordered[-1],
+    }
+
+
+def print_latency_stats(stats: dict[str, Any]) -> None:
+    if not stats.get("turns"):
+        return
+    print(f"⏱  {stats['turns']} turns in {stats['wall_ms'] / 1000:.1f}s wall "
+          f"(concurrency {stats['concurrency']}; {stats['sum_ms'] / 1000:.1f}s of requests) — "
+          f"per turn p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms, max {stats['max_ms']} ms")
+
+
+# ─── Content-addressed turn cache ─────────────────────────────────────────────
+
+
+def turn_key(provider: str, voice_id: str, model: str, settings: dict[str, Any], text: str) -> str:
+    blob = json.dumps({"provider": provider, "voice_id": voice_id, "model": model,
+                       "settings": settings, "text": text},
+                      ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class TurnCache:
+    """<root>/<key>.mp3 + <key>.json. `root=None` disables it (every lookup
+    misses, nothing is written)."""
+
+    def __init__(self, root: Path | None) -> None:
+        self.root = root.expanduser() if root else None
+
+    def has(self, key: str) -> bool:
+        return self.root is not None and (self.root / f"{key}.mp3").exists()
+
+    def meta(self, key: str) -> dict[str, Any]:
+        """The entry's provenance sidecar ({} if there isn't one)."""
+        if self.root is None:
+            return {}
+        path = self.root / f"{key}.json"
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+    def copy_to(self, key: str, dest: Path) -> None:
+        shutil.copy2(self.root / f"{key}.mp3", dest)
+
+    def put(self, key: str, src: Path, provenance: dict[str, Any]) -> None:
+        if self.root is None:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        sidecar = {**provenance, "key": key,
+                   "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+        # Write-then-rename, sidecar first: a reader never sees a half-written
+        # file, and has() (which looks at the mp3) implies the sidecar exists.
+        tag = f"{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp = self.root / f"{key}.json.{tag}"
+        tmp.write_text(json.dumps(sidecar, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.root / f"{key}.json")
+        tmp = self.root / f"{key}.mp3.{tag}"
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, self.root / f"{key}.mp3")
+
+
+def plan_turns(turns: list[dict[str, Any]], keys: list[str], cache: TurnCache) -> dict[str, Any]:
+    """Hit/miss plan, same totals as voicebox's dry-run costs. A line repeated
+    within the script (same key) is synthesized once: later copies are
+    listed in `dups` (turn → first turn) and not debited."""
+    hits = [cache.has(k) for k in keys]
+    first: dict[str, int] = {}
+    dups: dict[int, int] = {}
+    for i, (key, hit) in enumerate(zip(keys, hits)):
+        if hit:
+            continue
+        if key in first:
+            dups[i] = first[key]
+        else:
+            first[key] = i
+    misses = list(first.values())
+    return {
+        "hits": hits,
+        "misses": misses,
+        "dups": dups,
+        "calls": len(turns),
+        "cache_hits": sum(hits) + len(dups),
+        "synthesized": len(misses),
+        "chars_debited": sum(len(turns[i].get("text", "")) for i in misses),
+    }
+
+
+def run_cached_turns(turns: list[dict[str, Any]], keys: list[str], plan: dict[str, Any],
+                     cache: TurnCache, turns_dir: Path,
+                     synth_one: Callable[[int, dict[str, Any]], Path], pool: TurnPool,
+                     provenance: Callable[[int, dict[str, Any]], dict[str, Any]],
+                     ) -> tuple[list[Path], list[int | None], dict[str, Any]]:
+    """Copy cache hits into turns/, synthesize the misses concurrently (and
+    cache them), then fill repeated lines from their first rendering.
+    Returns (turn files in order, per-turn latency ms — None for turns that
+    weren't synthesized, latency stats over the synthesized ones)."""
+    files: list[Path | None] = [None] * len(turns)
+    for i, hit in enumerate(plan["hits"]):
+        if hit:
+            files[i] = turns_dir / f"turn_{i:03d}.mp3"
+            cache.copy_to(keys[i], files[i])
+    misses = plan["misses"]
+    if plan["cache_hits"]:
+        print(f"  📦 {plan['cache_hits']} turns from cache / repeats, synthesizing {len(misses)}")
+
+    def synth_and_cache(j: int, turn: dict[str, Any]) -> Path:
+        i = misses[j]
+        out = synth_one(i, turn)
+        cache.put(keys[i], out, provenance(i, turn))
+        return out
+
+    made, miss_latencies, wall_s = run_turns([turns[i] for i in misses], synth_and_cache, pool,
+                                             numbers=misses, total=len(turns))
+    latencies: list[int | None] = [None] * len(turns)
+    for i, path, ms in zip(misses, made, miss_latencies):
+        files[i] = path
+        latencies[i] = ms
+    for i, src in plan["dups"].items():
+        files[i] = turns_dir / f"turn_{i:03d}.mp3"
+        shutil.copy2(files[src], files[i])
+    stats = latency_stats(miss_latencies, wall_s, pool.concurrency)
+    stats["cache_hits"] = plan["cache_hits"]
+    return files, latencies, stats
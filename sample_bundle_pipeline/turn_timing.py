@@ -0,0 +1,98 @@
+"""
+Turn and word timings for script.timed.json, without decoding audio.
+
+  - Turn duration comes from the turn mp3's frame headers (mp3_concat.read_frames):
+    frames × samples per frame, exact, and no pydub needed. The old 12
+    chars/sec estimate is only used for a turn whose audio isn't a parseable
+    Layer III stream (flagged `"approx": true`).
+  - Word timings come from the provider when it returns them: ElevenLabs
+    character alignment (convert_with_timestamps) or Polly word speech marks
+    (--speech-marks). They are stored relative to the turn, cached in the
+    turn's cache sidecar, and written out in track time, shifted by the
+    mp3's encoder + decoder delay when the file's LAME tag records it.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from mp3_concat import read_frames
+
+APPROX_CHARS_PER_SEC = 12
+
+
+def words_from_alignment(alignment: Any) -> list[dict[str, Any]]:
+    """ElevenLabs character alignment → words (runs of non-space characters)
+    with turn-relative ms. Accepts the SDK model or the raw JSON dict."""
+    def field(name: str) -> list:
+        value = alignment.get(name) if isinstance(alignment, dict) else getattr(alignment, name, None)
+        return list(value or [])
+
+    chars = field("characters")
+    starts = field("character_start_times_seconds")
+    ends = field("character_end_times_seconds")
+    words: list[dict[str, Any]] = []
+    current: dict[str, Any] | None = None
+    for ch, start, end in zip(chars, starts, ends):
+        if ch.isspace():
+            current = None
+            continue
+        if current is None:
+            current = {"text": "", "startMs": round(start * 1000), "endMs": 0}
+            words.append(current)
+        current["text"] += ch
+        current["endMs"] = round(end * 1000)
+    return words
+
+
+def words_from_speech_marks(raw: bytes, duration_ms: int | None) -> list[dict[str, Any]]:
+    """Polly word speech marks (JSON lines: time, type, value) → words. Marks
+    only carry a start; a word ends where the next one starts, the last one
+    at the end of the turn."""
+    marks = [json.loads(line) for line in raw.decode("utf-8").splitlines() if line.strip()]
+    marks = [m for m in marks if m.get("type") == "word"]
+    words = []
+    for i, m in enumerate(marks):
+        end = marks[i + 1]["time"] if i + 1 < len(marks) else (duration_ms or m["time"])
+        words.append({"text": m["value"], "startMs": m["time"], "endMs": max(end, m["time"])})
+    return words
+
+
+def build_timings(turns: list[dict[str, Any]], files: list[Path], fields: list[dict[str, Any]],
+                  words: list[list[dict[str, Any]] | None], pause_ms: int) -> list[dict[str, Any]]:
+    """One entry per turn: `fields[i]` plus start/end in track time (turns
+    laid end to end with `pause_ms` between) and `words` when known.
+    place_timings() moves them onto the spans the concatenator actually
+    wrote."""
+    timings: list[dict[str, Any]] = []
+    cursor = 0
+    for i, (turn, path) in enumerate(zip(turns, files)):
+        stream = read_frames(Path(path).read_bytes())
+        if stream is not None:
+            duration, lead, approx = stream.duration_ms, stream.lead_ms, False
+        else:
+            duration, lead, approx = int(len(turn["text"]) / APPROX_CHARS_PER_SEC * 1000), 0, True
+        entry = {**fields[i], "startMs": cursor, "endMs": cursor + duration, "approx": approx}
+        if words[i]:
+            offset = cursor + lead
+            entry["words"] = [{**w, "startMs": w["startMs"] + offset, "endMs": w["endMs"] + offset}
+                              for w in words[i]]
+        timings.append(entry)
+        cursor += duration + pause_ms
+    return timings
+
+
+def place_timings(timings: list[dict[str, Any]], spans: list[tuple[int, int]]) -> list[dict[str, Any]]:
+    """Shift each turn (and its words) onto the (startMs, endMs) span the
+    concatenator reports."""
+    placed = []
+    for t, (start, end) in zip(timings, spans):
+        shift = start - t["startMs"]
+        entry = {**t, "startMs": start, "endMs": end, "approx": False}
+        if "words" in t:
+            entry["words"] = [{**w, "startMs": w["startMs"] + shift, "endMs": w["endMs"] + shift}
+                              for w in t["words"]]
+        placed.append(entry)
+    return placed